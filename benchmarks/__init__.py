@@ -0,0 +1,17 @@
+'''ophyd benchmarks
+
+The ``construction``, ``devices``, ``pseudopos`` and ``utils`` modules are
+`asv <https://asv.readthedocs.io>`_ benchmark suites, run against the
+in-process simulated control layer (`ophyd.sim`), such that no IOC is needed.
+Results are tracked over commits with asv (see ``asv.conf.json``)::
+
+    asv run
+    asv continuous --factor 1.2 master HEAD
+
+or, without asv, compared against a saved baseline::
+
+    python -m benchmarks.run --save baseline.json
+    python -m benchmarks.run --compare baseline.json --factor 1.2
+
+The ``bench_*.py`` scripts are standalone stress tests and microbenchmarks.
+'''
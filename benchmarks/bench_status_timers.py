@@ -0,0 +1,63 @@
+'''Stress benchmark of status timeouts and settle times
+
+Creates many concurrent statuses with timeouts and settle times, which are
+all handled by the shared status timer thread, and reports the time taken,
+how late the timeouts fire and the peak number of threads.
+
+Usage::
+
+    python benchmarks/bench_status_timers.py [num_statuses]
+'''
+
+import sys
+import threading
+import time
+
+from ophyd.status import StatusBase
+
+
+def wait_all_done(statuses, poll=0.01):
+    while not all(st.done for st in statuses):
+        time.sleep(poll)
+
+
+def finish_with_settle(num, settle_time=0.05, timeout=10.0):
+    '''Statuses finished early: timeouts cancelled, callbacks after settling'''
+    t0 = time.monotonic()
+    statuses = [StatusBase(timeout=timeout, settle_time=settle_time)
+                for i in range(num)]
+    created = time.monotonic()
+    for st in statuses:
+        st._finished()
+    peak_threads = threading.active_count()
+    wait_all_done(statuses)
+    t1 = time.monotonic()
+
+    assert all(st.success for st in statuses)
+    print('finish + settle: create {:.1f} us/status, all settled after '
+          '{:.3f} s (settle time {} s), peak threads {}'
+          ''.format((created - t0) / num * 1e6, t1 - created, settle_time,
+                    peak_threads))
+
+
+def time_out(num, timeout=0.2):
+    '''Statuses which are never finished, such that all of them time out'''
+    t0 = time.monotonic()
+    statuses = [StatusBase(timeout=timeout) for i in range(num)]
+    peak_threads = threading.active_count()
+    wait_all_done(statuses)
+    t1 = time.monotonic()
+
+    assert not any(st.success for st in statuses)
+    print('timeouts:        all failed after {:.3f} s (timeout {} s), '
+          'peak threads {}'.format(t1 - t0, timeout, peak_threads))
+
+
+def main(num=10000):
+    print('{} concurrent statuses'.format(num))
+    finish_with_settle(num)
+    time_out(num)
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,49 @@
+'''Benchmark of OphydObject subscription dispatch
+
+Reports the number of events per second which can be dispatched to 1, 10
+and 100 (trivial) subscribers.
+
+Usage::
+
+    python benchmarks/bench_subscriptions.py
+'''
+
+import time
+
+from ophyd.ophydobj import OphydObject
+
+
+class EventSource(OphydObject):
+    SUB_VALUE = 'value'
+    _default_sub = SUB_VALUE
+
+
+def events_per_second(num_subscribers, duration=1.0):
+    obj = EventSource(name='obj')
+    for i in range(num_subscribers):
+        obj.subscribe(lambda **kwargs: None)
+
+    run_subs = obj._run_subs
+    count = 0
+    t0 = time.perf_counter()
+    while True:
+        for i in range(1000):
+            run_subs(sub_type='value', value=i, timestamp=None)
+
+        count += 1000
+        elapsed = time.perf_counter() - t0
+        if elapsed > duration:
+            return count / elapsed
+
+
+def main():
+    print('{:>12s} {:>14s} {:>20s}'.format('subscribers', 'events/sec',
+                                           'callbacks/sec'))
+    for num_subscribers in (1, 10, 100):
+        rate = events_per_second(num_subscribers)
+        print('{:>12d} {:>14.0f} {:>20.0f}'.format(num_subscribers, rate,
+                                                   rate * num_subscribers))
+
+
+if __name__ == '__main__':
+    main()
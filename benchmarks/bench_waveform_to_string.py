@@ -0,0 +1,54 @@
+'''Microbenchmark of waveform_to_string for typical char waveforms
+
+Compares the vectorized numpy path against the per-character path used for
+non-array values (i.e., the original implementation).
+
+Usage::
+
+    python benchmarks/bench_waveform_to_string.py
+'''
+
+import timeit
+
+import numpy as np
+
+from ophyd.utils.epics_pvs import waveform_to_string
+
+
+def per_character(value):
+    '''The original, per-character implementation'''
+    value = ''.join(chr(c) for c in value)
+    try:
+        value = value[:value.index('\0')]
+    except (IndexError, ValueError):
+        pass
+    return value
+
+
+def make_waveform(length, fill=0.5):
+    '''A NUL-padded uint8 waveform, a fraction `fill` of which is text'''
+    text = ('/data/images/sample_%06d.h5' % 1) * length
+    text = text[:int(length * fill)]
+    waveform = np.zeros(length, dtype=np.uint8)
+    waveform[:len(text)] = np.frombuffer(text.encode('latin-1'),
+                                         dtype=np.uint8)
+    return waveform
+
+
+def main(number=2000):
+    print('{:>8s} {:>16s} {:>16s} {:>8s}'.format('length', 'vectorized (us)',
+                                                 'per-char (us)', 'speedup'))
+    for length in (256, 4096):
+        waveform = make_waveform(length)
+        assert waveform_to_string(waveform) == per_character(waveform)
+
+        fast = timeit.timeit(lambda: waveform_to_string(waveform),
+                             number=number) / number
+        slow = timeit.timeit(lambda: per_character(waveform),
+                             number=number) / number
+        print('{:>8d} {:>16.2f} {:>16.2f} {:>7.1f}x'
+              ''.format(length, fast * 1e6, slow * 1e6, slow / fast))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+'''Devices and helpers shared by the benchmark suites'''
+
+from ophyd import (Device, Component as C, EpicsSignal, sim)
+from ophyd.control_layer import set_cl
+from ophyd.areadetector.detectors import SimDetector
+from ophyd.areadetector.plugins import (ImagePlugin, StatsPlugin,
+                                        ColorConvPlugin, ProcessPlugin,
+                                        OverlayPlugin, ROIPlugin,
+                                        TransformPlugin, NetCDFPlugin,
+                                        TIFFPlugin, JPEGPlugin, NexusPlugin,
+                                        HDF5Plugin, MagickPlugin)
+
+
+def use_sim(latency=0.0):
+    '''Switch to the simulated control layer, with a fresh database
+
+    PVs are created on first access, so no IOC (or PV list) is needed.
+    '''
+    sim.database.clear()
+    sim.database.latency = latency
+    sim.database.jitter = 0.0
+    sim.database.connection_latency = None
+    sim.database.auto_create = True
+    return set_cl('sim')
+
+
+def restore_cl():
+    '''Switch back to the default control layer'''
+    set_cl('pyepics')
+
+
+class AllPluginsDetector(SimDetector):
+    '''A simulation detector with (at least) one of every plugin'''
+    image1 = C(ImagePlugin, 'image1:')
+    stats1 = C(StatsPlugin, 'Stats1:')
+    stats2 = C(StatsPlugin, 'Stats2:')
+    stats3 = C(StatsPlugin, 'Stats3:')
+    stats4 = C(StatsPlugin, 'Stats4:')
+    stats5 = C(StatsPlugin, 'Stats5:')
+    cc1 = C(ColorConvPlugin, 'CC1:')
+    proc1 = C(ProcessPlugin, 'Proc1:')
+    over1 = C(OverlayPlugin, 'Over1:')
+    roi1 = C(ROIPlugin, 'ROI1:')
+    roi2 = C(ROIPlugin, 'ROI2:')
+    roi3 = C(ROIPlugin, 'ROI3:')
+    roi4 = C(ROIPlugin, 'ROI4:')
+    trans1 = C(TransformPlugin, 'Trans1:')
+    netcdf1 = C(NetCDFPlugin, 'netCDF1:')
+    tiff1 = C(TIFFPlugin, 'TIFF1:')
+    jpeg1 = C(JPEGPlugin, 'JPEG1:')
+    nexus1 = C(NexusPlugin, 'Nexus1:')
+    hdf1 = C(HDF5Plugin, 'HDF1:')
+    magick1 = C(MagickPlugin, 'Magick1:')
+
+
+def make_tree_class(branches, leaves):
+    '''A device class with `branches` sub-devices of `leaves` signals each'''
+    branch_attrs = {'sig{}'.format(i): C(EpicsSignal, ':sig{}'.format(i))
+                    for i in range(leaves)}
+    branch_cls = type('Branch{}'.format(leaves), (Device, ), branch_attrs)
+
+    tree_attrs = {'branch{}'.format(i): C(branch_cls, ':br{}'.format(i))
+                  for i in range(branches)}
+    return type('Tree{}x{}'.format(branches, leaves), (Device, ), tree_attrs)
@@ -0,0 +1,70 @@
+'''Benchmarks of device instantiation against the simulated control layer
+
+Instantiation includes building the component tree and creating (but not
+waiting for) the connections of every signal.
+'''
+
+from ophyd import (EpicsMotor, EpicsScaler, sim)
+from ophyd.mca import EpicsMCA
+
+from .common import (use_sim, restore_cl, AllPluginsDetector,
+                     make_tree_class)
+
+
+class DeviceInstantiation:
+    def setup(self):
+        use_sim()
+
+    def teardown(self):
+        restore_cl()
+
+    def time_epics_motor(self):
+        EpicsMotor('XF:31IDA-OP{Tbl-Ax:X1}Mtr', name='motor')
+
+    def time_epics_scaler(self):
+        EpicsScaler('XF:31IDA-BI{Scaler:1}', name='scaler')
+
+    def time_epics_mca(self):
+        EpicsMCA('XF:31IDA-BI{MCA:1}mca1', name='mca')
+
+    def time_sim_detector_all_plugins(self):
+        AllPluginsDetector('XF:31IDA-BI{Det:1}', name='det')
+
+
+class TreeInstantiation:
+    params = [10, 100]
+    param_names = ['leaves_per_branch']
+
+    def setup(self, leaves):
+        use_sim()
+        self.cls = make_tree_class(10, leaves)
+
+    def teardown(self, leaves):
+        restore_cl()
+
+    def time_instantiate(self, leaves):
+        self.cls('XF:TREE', name='tree')
+
+
+class ConnectedMotors:
+    '''Instantiating and connecting 50 motors, with 10 ms connection latency
+
+    One after the other, as opposed to all at once with Device.bulk_create.
+    '''
+    timeout = 120
+
+    def setup(self):
+        use_sim()
+        sim.database.connection_latency = 0.01
+        self.prefixes = ['XF:31IDA-OP{{Tbl-Ax:{}}}Mtr'.format(i)
+                         for i in range(50)]
+
+    def teardown(self):
+        restore_cl()
+
+    def time_serial(self):
+        for prefix in self.prefixes:
+            EpicsMotor(prefix, name='motor').wait_for_connection(timeout=10)
+
+    def time_bulk_create(self):
+        EpicsMotor.bulk_create(self.prefixes, timeout=10)
@@ -0,0 +1,100 @@
+'''Benchmarks of device operations against the simulated control layer'''
+
+from ophyd import (Device, Component as C, EpicsSignal, Signal)
+
+from .common import (use_sim, restore_cl, AllPluginsDetector,
+                     make_tree_class)
+
+
+class LargeTree:
+    '''read and describe of a 10-branch tree of EPICS signals'''
+    params = [10, 100]
+    param_names = ['leaves_per_branch']
+    timeout = 120
+
+    def setup(self, leaves):
+        use_sim()
+        self.tree = make_tree_class(10, leaves)('XF:TREE', name='tree')
+        self.tree.wait_for_connection(all_signals=True, timeout=30)
+
+    def teardown(self, leaves):
+        restore_cl()
+
+    def time_read(self, leaves):
+        self.tree.read()
+
+    def time_describe(self, leaves):
+        self.tree.describe()
+
+
+class DetectorTree:
+    '''read and describe of a simulation detector with all plugins'''
+    timeout = 120
+
+    def setup(self):
+        use_sim()
+        self.det = AllPluginsDetector('XF:31IDA-BI{Det:1}', name='det',
+                                      configuration_attrs=['cam', 'stats1',
+                                                           'roi1'])
+        self.det.wait_for_connection(all_signals=True, timeout=30)
+
+    def teardown(self):
+        restore_cl()
+
+    def time_read(self):
+        self.det.read()
+
+    def time_describe(self):
+        self.det.describe()
+
+    def time_read_configuration(self):
+        self.det.read_configuration()
+
+    def time_describe_configuration(self):
+        self.det.describe_configuration()
+
+
+class SubscriptionFanOut:
+    '''Value callbacks run for each put to a signal'''
+    params = [1, 10, 100]
+    param_names = ['subscribers']
+
+    def setup(self, subscribers):
+        self.signal = Signal(name='signal', value=0)
+        for i in range(subscribers):
+            self.signal.subscribe(lambda **kwargs: None, run=False)
+        self.value = 0
+
+    def time_put(self, subscribers):
+        self.value += 1
+        self.signal.put(self.value)
+
+
+class StagedDevice(Device):
+    sig0 = C(EpicsSignal, ':sig0')
+    sig1 = C(EpicsSignal, ':sig1')
+    sig2 = C(EpicsSignal, ':sig2')
+    sig3 = C(EpicsSignal, ':sig3')
+    sig4 = C(EpicsSignal, ':sig4')
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stage_sigs.update([(self.sig0, 1), (self.sig1, 2),
+                                (self.sig2, 3), (self.sig3, 4),
+                                (self.sig4, 5)])
+
+
+class StageCycle:
+    '''stage followed by unstage, restoring 5 EPICS signals'''
+
+    def setup(self):
+        use_sim()
+        self.device = StagedDevice('XF:STAGE', name='dev')
+        self.device.wait_for_connection(all_signals=True, timeout=30)
+
+    def teardown(self):
+        restore_cl()
+
+    def time_stage_unstage(self):
+        self.device.stage()
+        self.device.unstage()
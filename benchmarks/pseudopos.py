@@ -0,0 +1,57 @@
+'''Benchmarks of PseudoPositioner overhead, using soft real positioners'''
+
+from ophyd import (PseudoPositioner, PseudoSingle, SoftPositioner,
+                   Component as C)
+from ophyd.pseudopos import (pseudo_position_argument,
+                             real_position_argument)
+
+
+class Pseudo3x3(PseudoPositioner):
+    pseudo1 = C(PseudoSingle, limits=(-10, 10))
+    pseudo2 = C(PseudoSingle, limits=(-10, 10))
+    pseudo3 = C(PseudoSingle, limits=None)
+    real1 = C(SoftPositioner)
+    real2 = C(SoftPositioner)
+    real3 = C(SoftPositioner)
+
+    @pseudo_position_argument
+    def forward(self, pseudo_pos):
+        return self.RealPosition(real1=-pseudo_pos.pseudo1,
+                                 real2=-pseudo_pos.pseudo2,
+                                 real3=-pseudo_pos.pseudo3)
+
+    @real_position_argument
+    def inverse(self, real_pos):
+        return self.PseudoPosition(pseudo1=-real_pos.real1,
+                                   pseudo2=-real_pos.real2,
+                                   pseudo3=-real_pos.real3)
+
+
+class PseudoOverhead:
+    def setup(self):
+        self.pseudo = Pseudo3x3('', name='pseudo')
+        for real in self.pseudo.real_positioners:
+            real._set_position(0)
+        self.pseudo_pos = self.pseudo.PseudoPosition(1, 2, 3)
+        self.real_pos = self.pseudo.RealPosition(-1, -2, -3)
+        self.target = 0
+
+    def time_forward(self):
+        self.pseudo.forward(self.pseudo_pos)
+
+    def time_forward_sequence(self):
+        self.pseudo.forward((1, 2, 3))
+
+    def time_inverse(self):
+        self.pseudo.inverse(self.real_pos)
+
+    def time_position(self):
+        self.pseudo.position
+
+    def time_move(self):
+        self.target = -self.target + 1
+        self.pseudo.move((self.target, self.target, self.target), wait=True)
+
+    def time_single_move(self):
+        self.target = -self.target + 1
+        self.pseudo.pseudo1.move(self.target, wait=True)
@@ -0,0 +1,147 @@
+'''Run the asv benchmark suites in-process, without asv
+
+Results may be saved as a baseline, and later runs compared against it,
+failing if any benchmark got slower by more than a factor (a regression
+threshold, as with ``asv continuous --factor``).
+
+Usage::
+
+    python -m benchmarks.run [-k PATTERN] [--save FILE] [--compare FILE]
+                             [--factor FACTOR]
+'''
+
+import argparse
+import importlib
+import inspect
+import itertools
+import json
+import re
+import sys
+import time
+
+SUITES = ('construction', 'devices', 'pseudopos', 'utils')
+
+
+def _param_sets(cls):
+    params = getattr(cls, 'params', None)
+    if params is None:
+        return [()]
+    if not params or not isinstance(params[0], (list, tuple)):
+        params = [params]
+    return list(itertools.product(*params))
+
+
+def _benchmark_name(module, cls, method, params):
+    name = '{}.{}.{}'.format(module, cls.__name__, method)
+    if params:
+        name += '({})'.format(', '.join(repr(p) for p in params))
+    return name
+
+
+def discover(pattern=None):
+    '''Yield (name, class, method name, parameters) of all benchmarks'''
+    for module_name in SUITES:
+        module = importlib.import_module('.' + module_name, __package__)
+        classes = [obj for obj in vars(module).values()
+                   if inspect.isclass(obj) and
+                   obj.__module__ == module.__name__]
+        for cls in sorted(classes, key=lambda cls: cls.__name__):
+            methods = sorted(attr for attr in dir(cls)
+                             if attr.startswith('time_'))
+            for method, params in itertools.product(methods,
+                                                    _param_sets(cls)):
+                name = _benchmark_name(module_name, cls, method, params)
+                if pattern is None or re.search(pattern, name):
+                    yield name, cls, method, params
+
+
+def time_benchmark(cls, method, params, *, min_duration=0.1, repeat=3):
+    '''The best time of a single call (in seconds) of a benchmark'''
+    suite = cls()
+    if hasattr(suite, 'setup'):
+        suite.setup(*params)
+
+    try:
+        fcn = getattr(suite, method)
+        number = 1
+        while True:
+            t0 = time.perf_counter()
+            for i in range(number):
+                fcn(*params)
+            elapsed = time.perf_counter() - t0
+            if elapsed >= min_duration:
+                break
+            number *= 10
+
+        best = elapsed / number
+        for i in range(repeat - 1):
+            t0 = time.perf_counter()
+            for i in range(number):
+                fcn(*params)
+            best = min(best, (time.perf_counter() - t0) / number)
+        return best
+    finally:
+        if hasattr(suite, 'teardown'):
+            suite.teardown(*params)
+
+
+def compare(results, baseline, factor):
+    '''Benchmarks which are slower than the baseline by more than factor
+
+    Returns
+    -------
+    regressions : list of (name, baseline, result)
+    '''
+    return [(name, baseline[name], result)
+            for name, result in sorted(results.items())
+            if name in baseline and result > baseline[name] * factor]
+
+
+def _format_time(seconds):
+    for unit, scale in (('s', 1), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= scale:
+            break
+    return '{:.3g} {}'.format(seconds / scale, unit)
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('-k', dest='pattern', default=None,
+                        help='Only run benchmarks matching this regex')
+    parser.add_argument('--save', default=None,
+                        help='Save the results to this JSON file')
+    parser.add_argument('--compare', default=None,
+                        help='Compare against results saved with --save')
+    parser.add_argument('--factor', type=float, default=1.5,
+                        help='Regression threshold for --compare '
+                        '(default: %(default)s)')
+    args = parser.parse_args(args)
+
+    baseline = {}
+    if args.compare is not None:
+        with open(args.compare, 'rt') as f:
+            baseline = json.load(f)
+
+    results = {}
+    for name, cls, method, params in discover(args.pattern):
+        results[name] = time_benchmark(cls, method, params)
+        line = '{:<60s} {:>10s}'.format(name, _format_time(results[name]))
+        if name in baseline:
+            line += ' {:>7.2f}x'.format(results[name] / baseline[name])
+        print(line)
+        sys.stdout.flush()
+
+    if args.save is not None:
+        with open(args.save, 'wt') as f:
+            json.dump(results, f, indent=1, sort_keys=True)
+
+    regressions = compare(results, baseline, args.factor)
+    for name, before, after in regressions:
+        print('REGRESSION: {} {} -> {} (threshold {}x)'
+              ''.format(name, _format_time(before), _format_time(after),
+                        args.factor))
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
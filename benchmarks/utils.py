@@ -0,0 +1,20 @@
+'''Benchmarks of ophyd.utils helpers'''
+
+from ophyd.utils.epics_pvs import waveform_to_string
+
+from .bench_waveform_to_string import make_waveform
+
+
+class WaveformToString:
+    params = [40, 256, 4096]
+    param_names = ['length']
+
+    def setup(self, length):
+        self.waveform = make_waveform(length)
+        self.as_list = self.waveform.tolist()
+
+    def time_array(self, length):
+        waveform_to_string(self.waveform)
+
+    def time_list(self, length):
+        waveform_to_string(self.as_list)
@@ -5,9 +5,11 @@ logger.addHandler(logging.NullHandler())
 
 from . import *
 
+from .control_layer import (set_cl, get_cl)
 
 # Signals
-from .signal import (Signal, EpicsSignal, EpicsSignalRO, DerivedSignal)
+from .signal import (Signal, EpicsSignal, EpicsSignalRO, DerivedSignal,
+                     bulk_set)
 
 # Positioners
 from .positioner import (PositionerBase, SoftPositioner)
@@ -19,7 +21,7 @@ from .pseudopos import (PseudoPositioner, PseudoSingle)
 from .scaler import EpicsScaler
 from .device import (Device, Component, FormattedComponent,
                      DynamicDeviceComponent)
-from .status import StatusBase
+from .status import (StatusBase, AndStatus, OrStatus, wait_all)
 from .mca import EpicsMCA, EpicsDXP
 from .quadem import QuadEM
 
@@ -0,0 +1,96 @@
+'''Control layer implementation using pyepics (Channel Access)'''
+
+import epics
+from epics import (ca, dbr)
+
+from .utils.startup import setup
+
+__all__ = ['name', 'get_pv', 'get_property_pv', 'get_many', 'caget', 'caput',
+           'setup']
+
+name = 'pyepics'
+
+
+def get_pv(pvname, **kwargs):
+    '''Create a pyepics PV
+
+    Keyword arguments are passed on to epics.PV
+    '''
+    return epics.PV(pvname, **kwargs)
+
+
+def get_property_pv(pvname, callback, **kwargs):
+    '''Create a pyepics PV monitoring only property (metadata) changes
+
+    The PV is ctrl-form and subscribed with the DBE_PROPERTY mask, such that
+    callback receives the control variables (units, precision, limits and
+    enum strings) on connection and whenever they change on the IOC. Value
+    monitors, being time-form, never carry fresh control variables.
+
+    Keyword arguments are passed on to epics.PV
+    '''
+    return epics.PV(pvname, form='ctrl', auto_monitor=dbr.DBE_PROPERTY,
+                    callback=callback, **kwargs)
+
+
+def get_many(pvs, *, timeout=None):
+    '''Get the values of many PVs, waiting only once for all of them
+
+    Non-blocking gets are issued for all PVs before waiting for any of the
+    responses, as in epics.caget_many.
+
+    PV-like objects without a channel (``chid`` and ``ftype``) are gotten one
+    at a time with their own ``get``, as are all PVs with pyepics versions
+    before 3.4 (lacking non-blocking gets with metadata).
+
+    Parameters
+    ----------
+    pvs : sequence of epics.PV
+        Connected PVs
+    timeout : float, optional
+        Maximum time to wait for each response
+
+    Returns
+    -------
+    results : list
+        A dictionary of value and metadata (including the timestamp, for
+        time-form PVs) per PV, or None for any request which failed
+    '''
+    batched = (hasattr(ca, 'get_with_metadata') and
+               hasattr(ca, 'get_complete_with_metadata'))
+
+    def has_channel(pv):
+        return (batched and getattr(pv, 'chid', None) is not None and
+                getattr(pv, 'ftype', None) is not None)
+
+    for pv in pvs:
+        if has_channel(pv):
+            ca.get_with_metadata(pv.chid, ftype=pv.ftype, wait=False)
+
+    if batched:
+        ca.poll()
+
+    results = []
+    for pv in pvs:
+        if has_channel(pv):
+            results.append(ca.get_complete_with_metadata(
+                pv.chid, ftype=pv.ftype, timeout=timeout))
+            continue
+
+        value = pv.get(timeout=timeout)
+        if value is None:
+            results.append(None)
+        else:
+            results.append({'value': value,
+                            'timestamp': getattr(pv, 'timestamp', None)})
+    return results
+
+
+def caget(pvname, **kwargs):
+    '''Get a PV value through channel access (see epics.caget)'''
+    return epics.caget(pvname, **kwargs)
+
+
+def caput(pvname, value, **kwargs):
+    '''Put a PV value through channel access (see epics.caput)'''
+    return epics.caput(pvname, value, **kwargs)
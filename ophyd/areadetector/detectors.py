@@ -58,7 +58,12 @@ class DetectorBase(ADBase):
 
     def make_data_key(self):
         source = 'PV:{}'.format(self.prefix)
-        shape = tuple(self.cam.array_size.get())
+        array_size = self.cam.array_size
+        if array_size.read_source is None:
+            # monitor the array size, such that describing (at the start of
+            # every run) does not have to get it each time
+            array_size.set_read_source('monitor')
+        shape = tuple(array_size.get())
         return dict(shape=shape, source=source, dtype='array',
                     external='FILESTORE:')
 
@@ -13,11 +13,11 @@
 import re
 import time as ttime
 import logging
+import threading
 from collections import OrderedDict
 import numpy as np
 
-import epics
-
+from ..control_layer import get_cl
 from .base import (ADBase, ADComponent as C, ad_group,
                    EpicsSignalWithRBV as SignalWithRBV)
 from ..signal import (EpicsSignalRO, EpicsSignal)
@@ -156,18 +156,67 @@ class ImagePlugin(PluginBase):
 
     array_data = C(EpicsSignal, 'ArrayData')
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (generation, shape, pixel count) of the array, see _get_geometry
+        self._geometry = None
+        # incremented whenever the array size changes
+        self._geometry_generation = 0
+        self._geometry_monitored = False
+        self._geometry_lock = threading.Lock()
+        # held only while subscribing to the size signals
+        self._subscribe_lock = threading.Lock()
+
     @property
     def image(self):
-        array_size = self.array_size.get()
-        if array_size == [0, 0, 0]:
+        '''The current image, reshaped according to the array size
+
+        The array geometry is cached (and updated by monitors on the size
+        signals), such that only the array data is requested. The returned
+        array is a view of the received data rather than a copy.
+        '''
+        shape, pixel_count = self._get_geometry()
+        image = self.array_data.get(count=pixel_count)
+        return np.asarray(image)[:pixel_count].reshape(shape)
+
+    def _get_geometry(self):
+        '''The (cached) shape and pixel count of the array'''
+        if not self._geometry_monitored:
+            # not under the geometry lock, which the monitor callbacks need,
+            # as subscribing may wait for a PV to (re)connect
+            with self._subscribe_lock:
+                if not self._geometry_monitored:
+                    for sig in (self.array_size.height, self.array_size.width,
+                                self.array_size.depth, self.ndimensions):
+                        sig.subscribe(self._geometry_changed, run=False)
+                    self._geometry_monitored = True
+
+        with self._geometry_lock:
+            generation = self._geometry_generation
+            geometry = self._geometry
+
+        if geometry is not None and geometry[0] == generation:
+            return geometry[1:]
+
+        array_size = tuple(self.array_size.get())
+        if not any(array_size):
             raise RuntimeError('Invalid image; ensure array_callbacks are on')
 
         if array_size[-1] == 0:
             array_size = array_size[:-1]
 
         pixel_count = self.array_pixels
-        image = self.array_data.get(count=pixel_count)
-        return np.array(image).reshape(array_size)
+        with self._geometry_lock:
+            # only valid if the size did not change while getting it
+            if self._geometry_generation == generation:
+                self._geometry = (generation, array_size, pixel_count)
+
+        return array_size, pixel_count
+
+    def _geometry_changed(self, **kwargs):
+        '''Array size monitor callback, invalidating the cached geometry'''
+        with self._geometry_lock:
+            self._geometry_generation += 1
 
 
 class StatsPlugin(PluginBase):
@@ -738,7 +787,7 @@ def get_areadetector_plugin_class(prefix, timeout=2.0):
         return cls
 
     type_rbv = prefix + 'PluginType_RBV'
-    type_ = epics.caget(type_rbv, timeout=timeout)
+    type_ = get_cl().caget(type_rbv, timeout=timeout)
 
     if type_ is None:
         raise ValueError('Unable to determine plugin type (caget timed out)')
@@ -2,7 +2,6 @@
 """Command Line Interface to opyd objects"""
 
 
-import time
 import functools
 import sys
 import warnings
@@ -19,6 +18,7 @@ from epics import caget, caput
 from . import (EpicsMotor, PositionerBase, PVPositioner, Device)
 from .utils import DisconnectedError
 from .utils.startup import setup as setup_ophyd
+from .status import (AndStatus, wait_all)
 from prettytable import PrettyTable
 import numpy as np
 
@@ -218,26 +218,26 @@ def mov(positioner, position):
     with catch_keyboard_interrupt(positioner):
         stat = [p.move(v, wait=False) for p, v in
                 zip(positioner, position)]
+        # done once all moves are, whether or not any of them fails
+        moved = AndStatus(*stat, fail_fast=False)
 
         # The loop below ensures that at least a couple prints
         # will happen
         flag = 0
-        done = False
 
-        while not all(s.done for s in stat) or (flag < 2):
+        while not moved.done or (flag < 2):
             print(tc.LightGreen, end='')
             print('   ', end='')
             for p, prec in zip(positioner, pos_prec):
                 print_value(p.position, egu=p.egu, prec=prec)
             print('\n')
             print('\033[2A', end='')
-            time.sleep(0.01)
-            done = all(s.done for s in stat)
-            if done:
+            # refresh the positions while moving, returning early when done
+            if moved.wait_done(0.01):
                 flag += 1
 
     print(tc.Normal + '\n')
-    for err in [s for s in stat if not s.success]:
+    for err in [s for s in stat if s.done and not s.success]:
         device = err.pos
         reason = "Unknown"
         if isinstance(device, EpicsMotor):
@@ -539,11 +539,13 @@ def log_pos_mov(id=None, dry_run=False, positioners=None, **kwargs):
 
     sys.stdout.flush()
 
-    if len(stat) > 0:
-        while all(s.done for s in stat):
-            time.sleep(0.01)
-
-    print(' Done{}\n'.format(tc.Normal))
+    try:
+        wait_all(stat)
+    except RuntimeError:
+        print(' {}[!!] Not all positioners reached their target{}\n'
+              ''.format(tc.Red, tc.Normal))
+    else:
+        print(' Done{}\n'.format(tc.Normal))
 
 
 def log_pos_diff(id=None, positioners=None, **kwargs):
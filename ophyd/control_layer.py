@@ -0,0 +1,84 @@
+'''
+:mod:`ophyd.control_layer` - Control layer selection
+====================================================
+
+.. module:: ophyd.control_layer
+   :synopsis: Selects the library used to talk to process variables
+
+EpicsSignal and friends do not create PVs directly, but go through the
+currently selected control layer. This makes it possible to swap out pyepics
+for the in-process simulated PV database in :mod:`ophyd.sim`, for example to
+benchmark device code on a machine without any IOCs.
+
+The default control layer may be chosen with the environment variable
+``OPHYD_CONTROL_LAYER``.
+'''
+
+import importlib
+import logging
+import os
+import types
+
+logger = logging.getLogger(__name__)
+
+__all__ = ['set_cl', 'get_cl']
+
+# control layer name -> module implementing it (relative to ophyd)
+_control_layers = {'pyepics': '._pyepics_shim',
+                   'sim': '.sim',
+                   }
+
+# the functions every control layer module must export
+_exports = ('name', 'get_pv', 'get_property_pv', 'get_many', 'caget', 'caput',
+            'setup')
+
+_cl = None
+
+
+def set_cl(control_layer=None):
+    '''Select the control layer used for newly created signals
+
+    Signals already instantiated keep the control layer they were created
+    with.
+
+    Parameters
+    ----------
+    control_layer : {'pyepics', 'sim'}, optional
+        The control layer name. Defaults to the environment variable
+        OPHYD_CONTROL_LAYER, or 'pyepics' if that is unset.
+
+    Returns
+    -------
+    cl : namespace
+        The selected control layer
+    '''
+    global _cl
+
+    if control_layer is None:
+        control_layer = os.environ.get('OPHYD_CONTROL_LAYER', 'pyepics')
+
+    control_layer = control_layer.lower()
+
+    try:
+        module_name = _control_layers[control_layer]
+    except KeyError:
+        raise ValueError('Unknown control layer {!r}; choose from: {}'
+                         ''.format(control_layer,
+                                   ', '.join(sorted(_control_layers))))
+
+    shim = importlib.import_module(module_name, package=__package__)
+    logger.debug('Using control layer %r (%s)', control_layer, shim.__name__)
+    _cl = types.SimpleNamespace(**{attr: getattr(shim, attr)
+                                   for attr in _exports})
+    return _cl
+
+
+def get_cl():
+    '''The currently selected control layer
+
+    If no control layer has been selected, the default is set up (see
+    `set_cl`).
+    '''
+    if _cl is None:
+        return set_cl()
+    return _cl
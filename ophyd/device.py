@@ -1,15 +1,29 @@
 import time as ttime
 import logging
 import textwrap
+import threading
+import asyncio
+from functools import partial
 from enum import Enum
 from collections import (OrderedDict, namedtuple)
 
-from .ophydobj import OphydObject
+from . import (metrics, tracing)
+from .ophydobj import (OphydObject, instrumented, record_operation)
 from .status import DeviceStatus
 from .utils import (ExceptionBundle, set_and_wait, RedundantStaging)
+from .utils.futures import (create_future, get_loop, resolved,
+                            resolve_threadsafe, chain)
 
 logger = logging.getLogger(__name__)
 
+# methods timed and traced per device (see ophyd.metrics, ophyd.tracing)
+_INSTRUMENTED_METHODS = ('stage', 'unstage', 'trigger', 'read', 'describe',
+                         'move')
+
+
+# The devices created by Device.bulk_create, and those which failed to connect
+BulkCreateResult = namedtuple('BulkCreateResult', 'devices unconnected')
+
 
 class Staged(Enum):
     """Three-state switch"""
@@ -71,6 +85,8 @@ class Component:
             add_prefix = ('suffix', 'write_pv')
 
         self.add_prefix = tuple(add_prefix)
+        # attribute name the construction plan was compiled for
+        self._compiled_attr = None
 
     def maybe_add_prefix(self, instance, kw, suffix):
         """Add prefix to a suffix if kw is in self.add_prefix
@@ -98,21 +114,59 @@ class Component:
                                              suffix=suffix)
         return suffix
 
+    def compile(self):
+        '''Compile the construction plan used by `create_component`
+
+        Everything which does not depend on the instance is done once here:
+        keyword arguments which are passed through verbatim are separated from
+        those which get the device prefix added, and the name suffix is
+        precomputed. ComponentMeta compiles the plans of all components when
+        the device class is created.
+        '''
+        self._static_kwargs = {kw: val for kw, val in self.kwargs.items()
+                               if kw not in self.add_prefix}
+        self._prefixed_kwargs = tuple((kw, val)
+                                      for kw, val in self.kwargs.items()
+                                      if kw in self.add_prefix and
+                                      kw != 'name')
+        self._name_suffix = '_{}'.format(self.attr)
+        self._prefix_name = 'name' in self.add_prefix
+        self._prefix_suffix = 'suffix' in self.add_prefix
+        # subclasses customizing maybe_add_prefix are always deferred to
+        self._plain_prefix = (type(self).maybe_add_prefix is
+                              Component.maybe_add_prefix)
+        self._wait_on_create = (self.lazy and
+                                hasattr(self.cls, 'wait_for_connection'))
+        self._compiled_attr = self.attr
+
+    def _add_prefix(self, instance, kw, suffix):
+        if self._plain_prefix:
+            return '{}{}'.format(instance.prefix, suffix)
+        return self.maybe_add_prefix(instance, kw, suffix)
+
     def create_component(self, instance):
         '''Create a component for the instance'''
-        kwargs = self.kwargs.copy()
-        kwargs['name'] = '{}_{}'.format(instance.name, self.attr)
+        if self._compiled_attr != self.attr:
+            self.compile()
 
-        for kw, val in list(kwargs.items()):
-            kwargs[kw] = self.maybe_add_prefix(instance, kw, val)
+        kwargs = self._static_kwargs.copy()
+        name = '{}{}'.format(instance.name, self._name_suffix)
+        if self._prefix_name:
+            name = self._add_prefix(instance, 'name', name)
+        kwargs['name'] = name
+
+        for kw, val in self._prefixed_kwargs:
+            kwargs[kw] = self._add_prefix(instance, kw, val)
 
         if self.suffix is not None:
-            pv_name = self.maybe_add_prefix(instance, 'suffix', self.suffix)
+            pv_name = self.suffix
+            if self._prefix_suffix:
+                pv_name = self._add_prefix(instance, 'suffix', pv_name)
             cpt_inst = self.cls(pv_name, parent=instance, **kwargs)
         else:
             cpt_inst = self.cls(parent=instance, **kwargs)
 
-        if self.lazy and hasattr(self.cls, 'wait_for_connection'):
+        if self._wait_on_create:
             cpt_inst.wait_for_connection()
 
         return cpt_inst
@@ -153,7 +207,8 @@ class Component:
             return self
 
         if self.attr not in instance._signals:
-            instance._signals[self.attr] = self.create_component(instance)
+            instance._add_component(self.attr,
+                                    self.create_component(instance))
 
         return instance._signals[self.attr]
 
@@ -225,6 +280,9 @@ class DynamicDeviceComponent:
         # TODO: component compatibility
         self.trigger_value = None
         self.attrs = list(defn.keys())
+        # (device class, attribute) -> generated sub-device class, see
+        # create_class
+        self._classes = {}
 
     def make_docstring(self, parent_class):
         if self.doc is not None:
@@ -267,13 +325,22 @@ class DynamicDeviceComponent:
         inst.attr = attr_name
         return inst
 
-    def create_component(self, instance):
-        '''Create a component for the instance'''
+    def create_class(self, owner):
+        '''The sub-device class generated for the device class `owner`
+
+        Classes are generated once per device class, and then reused for all
+        of its instances.
+        '''
+        key = (owner, self.attr)
+        try:
+            return self._classes[key]
+        except KeyError:
+            pass
+
         clsname = self.clsname
         if clsname is None:
             # make up a class name based on the instance's class name
-            clsname = ''.join((instance.__class__.__name__,
-                               self.attr.capitalize()))
+            clsname = ''.join((owner.__name__, self.attr.capitalize()))
 
             # TODO: and if the attribute has any underscores, convert that to
             #       camelcase
@@ -287,18 +354,24 @@ class DynamicDeviceComponent:
         for attr in self.defn.keys():
             clsdict[attr] = self.create_attr(attr)
 
-        attrs = set(self.defn.keys())
+        cls = type(clsname, (Device, ), clsdict)
+        return self._classes.setdefault(key, cls)
+
+    def create_component(self, instance):
+        '''Create a component for the instance'''
+        cls = self.create_class(type(instance))
+
         inst_read = set(instance.read_attrs)
         if self.attr in inst_read:
             # if the sub-device is in the read list, then add all attrs
-            read_attrs = attrs
+            read_attrs = list(self.defn.keys())
         else:
             # otherwise, only add the attributes that exist in the sub-device
             # to the read_attrs list
-            read_attrs = inst_read.intersection(attrs)
+            read_attrs = [attr for attr in self.defn.keys()
+                          if attr in inst_read]
 
-        cls = type(clsname, (Device, ), clsdict)
-        return cls(instance.prefix, read_attrs=list(read_attrs),
+        return cls(instance.prefix, read_attrs=read_attrs,
                    name='{}_{}'.format(instance.name, self.attr),
                    parent=instance)
 
@@ -307,7 +380,8 @@ class DynamicDeviceComponent:
             return self
 
         if self.attr not in instance._signals:
-            instance._signals[self.attr] = self.create_component(instance)
+            instance._add_component(self.attr,
+                                    self.create_component(instance))
 
         return instance._signals[self.attr]
 
@@ -329,7 +403,7 @@ class ComponentMeta(type):
 
         RESERVED_ATTRS = ['name', 'parent', 'signal_names', '_signals',
                           'read_attrs', 'configuration_attrs', '_sig_attrs',
-                          '_sub_devices']
+                          '_sub_devices', '_construction_plan']
         for attr in RESERVED_ATTRS:
             if attr in clsdict:
                 raise TypeError("The attribute name %r is reserved for "
@@ -352,6 +426,14 @@ class ComponentMeta(type):
         for cpt_attr, cpt in clsobj._sig_attrs.items():
             # Notify the component of their attribute name
             cpt.attr = cpt_attr
+            if isinstance(cpt, Component):
+                cpt.compile()
+
+        # The construction plan: the components instantiated, in order, by
+        # Device.__init__
+        clsobj._construction_plan = tuple(
+            (attr, cpt) for attr, cpt in clsobj._sig_attrs.items()
+            if not cpt.lazy)
 
         # List Signal attribute names.
         clsobj.signal_names = list(clsobj._sig_attrs.keys())
@@ -372,6 +454,15 @@ class ComponentMeta(type):
                 continue
             clsobj._sub_devices.append(attr)
 
+        # Instrument data acquisition methods (see ophyd.metrics and
+        # ophyd.tracing), wrapping the implementation the class resolves to
+        # unless it already is
+        for method in _INSTRUMENTED_METHODS:
+            fcn = getattr(clsobj, method, None)
+            if fcn is not None and not getattr(fcn, '_ophyd_instrumented',
+                                               False):
+                setattr(clsobj, method, instrumented(method)(fcn))
+
         return clsobj
 
 
@@ -528,6 +619,18 @@ class Device(BlueskyInterface, OphydObject, metaclass=ComponentMeta):
                  name=None, parent=None, **kwargs):
         # Store EpicsSignal objects (only created once they are accessed)
         self._signals = {}
+        # Dotted component paths resolved by __getattr__
+        self._resolved_paths = {}
+        # Flattened read/describe plans, keyed by method (see _flat_plan)
+        self._flat_plans = {}
+
+        # Attribute names of instantiated, but unconnected, components
+        self._unconnected = set()
+        self._all_connected = True
+        self._connection_cond = threading.Condition()
+
+        # (read_source, max_age) applied to all components, if set
+        self._read_source = None
 
         self.prefix = prefix
         if self.signal_names and prefix is None:
@@ -548,9 +651,11 @@ class Device(BlueskyInterface, OphydObject, metaclass=ComponentMeta):
         self.read_attrs = list(read_attrs)
         self.configuration_attrs = list(configuration_attrs)
 
-        # Instantiate non-lazy signals
-        [getattr(self, attr) for attr, cpt in self._sig_attrs.items()
-         if not cpt.lazy]
+        # Instantiate non-lazy signals, following the class construction plan
+        signals = self._signals
+        for attr, cpt in self._construction_plan:
+            if attr not in signals:
+                self._add_component(attr, cpt.create_component(self))
 
     def wait_for_connection(self, all_signals=False, timeout=2.0):
         '''Wait for signals to connect
@@ -562,22 +667,212 @@ class Device(BlueskyInterface, OphydObject, metaclass=ComponentMeta):
         timeout : float or None
             Overall timeout
         '''
+        names = self._start_connection(all_signals)
+        if self._wait_connected(names, timeout):
+            return
+
+        unconnected = ', '.join(self._get_unconnected())
+        raise TimeoutError('Failed to connect to all signals: {}'
+                           ''.format(unconnected))
+
+    def _start_connection(self, all_signals):
+        '''Instantiate the components to connect, returning their names'''
         names = [attr for attr, cpt in self._sig_attrs.items()
                  if not cpt.lazy or all_signals]
 
         # Instantiate first to kickoff connection process
-        signals = [getattr(self, name) for name in names]
+        [getattr(self, name) for name in names]
+        return names
+
+    def _wait_connected(self, names, timeout):
+        '''Wait for the named components to connect, returning success'''
+        def all_connected():
+            return self._unconnected.isdisjoint(names)
+
+        with self._connection_cond:
+            return self._connection_cond.wait_for(all_connected, timeout)
+
+    @classmethod
+    def bulk_create(cls, prefixes, names=None, *, all_signals=False,
+                    timeout=2.0, **kwargs):
+        '''Create many devices of this class, connecting them concurrently
+
+        All of the devices are instantiated (starting the connection of every
+        PV) before waiting for any of them, and then waited for together,
+        such that the time taken is about that of the slowest device rather
+        than the sum.
+
+        Parameters
+        ----------
+        prefixes : sequence of str
+            The PV prefix of each device
+        names : sequence of str, optional
+            The name of each device, defaulting to its prefix
+        all_signals : bool, optional
+            Wait for all signals to connect (including lazy ones)
+        timeout : float or None, optional
+            Overall timeout for all of the devices to connect
+        kwargs :
+            Passed on to each device initializer
+
+        Returns
+        -------
+        result : BulkCreateResult
+            A namedtuple of ``devices``, the devices in the order of
+            `prefixes`, and ``unconnected``, a dictionary of the name of each
+            device which failed to connect within the timeout to its
+            unconnected signals. Devices are returned whether or not they
+            connected, and may still connect later.
+        '''
+        prefixes = list(prefixes)
+        if names is None:
+            names = prefixes
+        else:
+            names = list(names)
+            if len(names) != len(prefixes):
+                raise ValueError('Expected {} names, got {}'
+                                 ''.format(len(prefixes), len(names)))
+
+        devices = [cls(prefix, name=name, **kwargs)
+                   for prefix, name in zip(prefixes, names)]
+        connect_names = [dev._start_connection(all_signals)
+                         for dev in devices]
+
+        if timeout is not None:
+            deadline = ttime.monotonic() + timeout
+
+        unconnected = OrderedDict()
+        for dev, dev_names in zip(devices, connect_names):
+            if timeout is not None:
+                timeout = max(deadline - ttime.monotonic(), 0.0)
+            if not dev._wait_connected(dev_names, timeout):
+                unconnected[dev.name] = list(dev._get_unconnected())
+
+        if unconnected:
+            logger.warning('%d of %d %s devices failed to connect: %s',
+                           len(unconnected), len(devices), cls.__name__,
+                           ', '.join(unconnected))
+
+        return BulkCreateResult(devices=devices, unconnected=unconnected)
+
+    def connect_async(self, all_signals=False, *, timeout=None, loop=None):
+        '''Connect the device, as an asyncio future
+
+        All components are instantiated up front, such that the whole device
+        tree connects concurrently. Completion is then tracked through the
+        components' connection subscriptions, rather than by a waiting thread.
+
+        Parameters
+        ----------
+        all_signals : bool, optional
+            Connect all signals (including lazy ones)
+        timeout : float, optional
+            Overall timeout, after which a TimeoutError is set on the future
+        loop : asyncio.AbstractEventLoop, optional
+            The event loop the future belongs to, defaulting to the current
+            one
+
+        Returns
+        -------
+        future : asyncio.Future
+            Resolved with the device once connected
+        '''
+        loop = get_loop(loop)
+        future = create_future(loop)
+        components = {name: getattr(self, name)
+                      for name in self._start_connection(all_signals)}
+
+        lock = threading.RLock()
+        pending = set()
+        subscriptions = []
+
+        def clear_subs():
+            for obj, cb in subscriptions:
+                obj.clear_sub(cb)
+
+        def connection_changed(name, connected=None, **kwargs):
+            with lock:
+                if connected:
+                    pending.discard(name)
+                else:
+                    pending.add(name)
+
+                if pending:
+                    return
+
+            clear_subs()
+            resolve_threadsafe(loop, future, self)
+
+        def timed_out():
+            clear_subs()
+            if not future.done():
+                unconnected = ', '.join(self._get_unconnected())
+                future.set_exception(
+                    TimeoutError('Failed to connect to all signals: {}'
+                                 ''.format(unconnected)))
+
+        with lock:
+            pending.update(name for name, obj in components.items()
+                           if not obj.connected)
+            for name in list(pending):
+                obj = components[name]
+                cb = partial(connection_changed, name)
+                subscriptions.append((obj, cb))
+                # replays the connection state, should it have just changed
+                obj.subscribe(cb, event_type=obj.SUB_CONNECTION, run=True)
+
+        if not pending:
+            clear_subs()
+            if not future.done():
+                future.set_result(self)
+        elif timeout is not None:
+            handle = loop.call_later(timeout, timed_out)
+            future.add_done_callback(lambda future: handle.cancel())
+
+        return future
+
+    def _add_component(self, attr, cpt_inst):
+        '''Store a newly instantiated component and track its connection'''
+        self._signals[attr] = cpt_inst
+        self._resolved_paths.clear()
+
+        if self._read_source is not None:
+            self._apply_read_source(cpt_inst)
+
+        connected = getattr(cpt_inst, 'connected', True)
+        self._set_component_connected(attr, connected)
+
+        # Any connection events prior to this are replayed on subscription
+        if isinstance(cpt_inst, OphydObject):
+            cpt_inst.subscribe(partial(self._component_connection_changed,
+                                       attr),
+                               event_type=cpt_inst.SUB_CONNECTION, run=True)
+
+    def _component_connection_changed(self, attr, connected=None, **kwargs):
+        '''Subscription callback: a component's connection state changed'''
+        self._set_component_connected(attr, connected)
+
+    def _set_component_connected(self, attr, connected):
+        '''Update the connection state of a single component
+
+        Runs the connection subscription if the state of the device as a whole
+        changes, which in turn updates the parent device.
+        '''
+        with self._connection_cond:
+            if connected:
+                self._unconnected.discard(attr)
+            else:
+                self._unconnected.add(attr)
 
-        t0 = ttime.time()
-        while timeout is None or (ttime.time() - t0) < timeout:
-            connected = [sig.connected for sig in signals]
-            if all(connected):
+            self._connection_cond.notify_all()
+
+            all_connected = not self._unconnected
+            if all_connected == self._all_connected:
                 return
-            ttime.sleep(min((0.05, timeout / 10.0)))
 
-        unconnected = ', '.join(self._get_unconnected())
-        raise TimeoutError('Failed to connect to all signals: {}'
-                           ''.format(unconnected))
+            self._all_connected = all_connected
+            self._run_subs(sub_type=self.SUB_CONNECTION,
+                           connected=all_connected, timestamp=None)
 
     def _get_unconnected(self):
         '''Yields all of the signal pvnames or prefixes that are unconnected
@@ -596,6 +891,39 @@ class Device(BlueskyInterface, OphydObject, metaclass=ComponentMeta):
 
             yield '{} ({})'.format(attr, prefix)
 
+    @property
+    def read_source(self):
+        '''The read source set for all EPICS signals in the device
+
+        None if `set_read_source` has not been called, in which case each
+        signal keeps its own.
+        '''
+        if self._read_source is None:
+            return None
+        return self._read_source[0]
+
+    def set_read_source(self, read_source, *, max_age=None):
+        '''Set the read source policy of all EPICS signals in the device
+
+        This applies recursively to all sub-devices, including components
+        which are instantiated later on.
+
+        Parameters
+        ----------
+        read_source : {'get', 'monitor'}
+            See `EpicsSignalBase.set_read_source`
+        max_age : float, optional
+            See `EpicsSignalBase.set_read_source`
+        '''
+        self._read_source = (read_source, max_age)
+        for cpt_inst in self._signals.values():
+            self._apply_read_source(cpt_inst)
+
+    def _apply_read_source(self, cpt_inst):
+        if hasattr(cpt_inst, 'set_read_source'):
+            read_source, max_age = self._read_source
+            cpt_inst.set_read_source(read_source, max_age=max_age)
+
     def get_instantiated_signals(self, *, attr_prefix=None):
         '''Yields all of the instantiated signals in a device hierarchy
 
@@ -621,13 +949,17 @@ class Device(BlueskyInterface, OphydObject, metaclass=ComponentMeta):
 
     @property
     def connected(self):
-        return all(signal.connected for name, signal in self._signals.items())
+        '''All instantiated components are connected'''
+        return not self._unconnected
 
     def __getattr__(self, name):
         '''Get a component from a fully-qualified name
 
         As a reminder, __getattr__ is only called if a real attribute doesn't
         already exist, or a device component has yet to be instantiated.
+
+        Dotted component paths (such as ``'current1.mean_value'``) are
+        resolved once and cached per device.
         '''
         if '.' not in name:
             try:
@@ -637,39 +969,137 @@ class Device(BlueskyInterface, OphydObject, metaclass=ComponentMeta):
             except KeyError:
                 raise AttributeError(name)
 
-        attr_names = name.split('.')
         try:
-            attr = getattr(self, attr_names[0])
-        except AttributeError:
-            raise AttributeError('{} of {}'.format(attr_names[0], name))
+            return self._resolved_paths[name]
+        except KeyError:
+            pass
+
+        obj = self
+        cacheable = True
+        for attr in name.split('.'):
+            # only paths made up entirely of components are cached
+            cacheable = (cacheable and isinstance(obj, Device) and
+                         attr in obj._sig_attrs)
+            try:
+                obj = getattr(obj, attr)
+            except AttributeError:
+                raise AttributeError('{} of {}'.format(attr, name))
 
-        if len(attr_names) > 1:
-            sub_attr_names = '.'.join(attr_names[1:])
-            return getattr(attr, sub_attr_names)
+        if cacheable:
+            self._resolved_paths[name] = obj
+        return obj
 
-        return attr
+    def _flat_plan(self, method):
+        '''The flattened plan of `method`, compiled on first use
 
-    def _read_attr_list(self, attr_list, *, config=False):
-        '''Get a 'read' dictionary containing attributes in attr_list'''
-        values = OrderedDict()
+        The plan is recompiled only if the ``read_attrs`` or
+        ``configuration_attrs`` of any device it descended into changed.
+
+        Parameters
+        ----------
+        method : {'read', 'describe', 'read_configuration',
+                  'describe_configuration'}
+
+        Returns
+        -------
+        plan : _FlatPlan
+            With ``calls``, the leaf calls whose results make up the
+            dictionary, in order, and ``devices``, the sub-devices descended
+            into with the slices of ``calls`` they account for
+        '''
+        plan = self._flat_plans.get(method)
+        if plan is None or not all(tuple(getattr(dev, list_name)) == attrs
+                                   for dev, list_name, attrs in plan.deps):
+            plan = _FlatPlan(calls=[], deps=[], devices=[])
+            self._flatten(method, plan)
+            self._flat_plans[method] = plan
+
+        return plan
+
+    def _flatten(self, method, plan):
+        '''Add the leaf calls of `method` on this device to the plan'''
+        list_name, base_method = _FLAT_METHODS[method]
+        attr_list = getattr(self, list_name)
+        plan.deps.append((self, list_name, tuple(attr_list)))
         for attr in attr_list:
             obj = getattr(self, attr)
-            if config:
-                values.update(obj.read_configuration())
+            if base_method is not None:
+                # configuration is read_configuration() followed by read()
+                _flatten_obj(obj, method, plan)
+                _flatten_obj(obj, base_method, plan)
+            else:
+                _flatten_obj(obj, method, plan)
 
-            values.update(obj.read())
+    def _call_plan(self, method):
+        '''Run the flattened plan of `method`, merging the results
 
+        The flattened sub-devices do not have their (instrumented) methods
+        called, so their operations are recorded here, spanning their leaf
+        calls.
+        '''
+        plan = self._flat_plan(method)
+        values = OrderedDict()
+        if not (metrics.enabled or tracing.enabled):
+            for obj, obj_method in plan.calls:
+                values.update(getattr(obj, obj_method)())
+            return values
+
+        times = []
+        for obj, obj_method in plan.calls:
+            times.append(tracing.now())
+            values.update(getattr(obj, obj_method)())
+        times.append(tracing.now())
+
+        for dev, dev_method, start, stop in plan.devices:
+            record_operation(dev, dev_method, times[start], times[stop])
         return values
 
     def read(self):
         """returns dictionary mapping names to (value, timestamp) pairs
 
         To control which fields are included, adjust the ``read_attrs`` list.
+
+        The gets of all EPICS signals in the device tree are issued at once,
+        such that only a single network wait is required per read. The read
+        of each sub-device is therefore recorded as spanning the whole batch.
         """
         res = super().read()
-        res.update(self._read_attr_list(self.read_attrs))
+        plan = self._flat_plan('read')
+        t0 = tracing.now()
+        res.update(_bulk_read(obj for obj, method in plan.calls))
+        _record_flat_devices(plan, t0, tracing.now())
         return res
 
+    def read_async(self, *, loop=None):
+        '''The `read` dictionary, as an asyncio future
+
+        The values of all signals in the device tree are requested at once
+        (see `Signal.read_async`). Sub-devices which customize `read` are read
+        synchronously.
+        '''
+        loop = get_loop(loop)
+        res = super().read()
+
+        plan = self._flat_plan('read')
+        t0 = tracing.now()
+        futures = []
+        for obj, method in plan.calls:
+            if isinstance(obj, Device):
+                futures.append(resolved(obj.read(), loop=loop))
+            else:
+                futures.append(obj.read_async(loop=loop))
+
+        def combine(results):
+            for values in results:
+                res.update(values)
+            _record_flat_devices(plan, t0, tracing.now())
+            return res
+
+        if not futures:
+            return resolved(res, loop=loop)
+
+        return chain(asyncio.gather(*futures), combine, loop=loop)
+
     def read_configuration(self):
         """
         returns dictionary mapping names to (value, timestamp) pairs
@@ -677,29 +1107,17 @@ class Device(BlueskyInterface, OphydObject, metaclass=ComponentMeta):
         To control which fields are included, adjust the
         ``configuration_attrs`` list.
         """
-        return self._read_attr_list(self.configuration_attrs, config=True)
-
-    def _describe_attr_list(self, attr_list, *, config=False):
-        '''Get a 'describe' dictionary containing attributes in attr_list'''
-        desc = OrderedDict()
-        for attr in attr_list:
-            obj = getattr(self, attr)
-            if config:
-                desc.update(obj.describe_configuration())
-
-            desc.update(obj.describe())
-
-        return desc
+        return self._call_plan('read_configuration')
 
     def describe(self):
         '''describe the read data keys' data types and other metadata'''
         res = super().describe()
-        res.update(self._describe_attr_list(self.read_attrs))
+        res.update(self._call_plan('describe'))
         return res
 
     def describe_configuration(self):
         '''describe the configuration data keys' data types/other metadata'''
-        return self._describe_attr_list(self.configuration_attrs, config=True)
+        return self._call_plan('describe_configuration')
 
     @property
     def trigger_signals(self):
@@ -850,3 +1268,95 @@ class Device(BlueskyInterface, OphydObject, metaclass=ComponentMeta):
 
         yield ('read_attrs', self.read_attrs)
         yield ('configuration_attrs', self.configuration_attrs)
+
+
+# method -> (attribute list, method also called on configuration attributes)
+_FLAT_METHODS = {'read': ('read_attrs', None),
+                 'describe': ('read_attrs', None),
+                 'read_configuration': ('configuration_attrs', 'read'),
+                 'describe_configuration': ('configuration_attrs',
+                                            'describe'),
+                 }
+
+# calls : list of (obj, method name)
+# deps : list of (device, attribute list name, attribute list snapshot)
+# devices : list of (sub-device, method name, start, stop) with the calls
+#           slice flattened from each sub-device descended into
+_FlatPlan = namedtuple('_FlatPlan', 'calls deps devices')
+
+
+def _flatten_obj(obj, method, plan):
+    '''Add the call of `method` on obj to the plan
+
+    Sub-devices which do not customize the method are descended into, such
+    that the plan only holds calls on the leaves of the device tree.
+    '''
+    if (isinstance(obj, Device) and
+            getattr(type(obj), method) is getattr(Device, method)):
+        start = len(plan.calls)
+        obj._flatten(method, plan)
+        plan.devices.append((obj, method, start, len(plan.calls)))
+    else:
+        plan.calls.append((obj, method))
+
+
+def _record_flat_devices(plan, t0, t1):
+    '''Record the operations of the sub-devices flattened into a plan, all
+    spanning t0 to t1'''
+    if metrics.enabled or tracing.enabled:
+        for dev, method, start, stop in plan.devices:
+            record_operation(dev, method, t0, t1)
+
+
+def _bulk_read(objs):
+    '''Read objects, batching the gets of their EPICS signals
+
+    Objects providing `_bulk_read_request` (EPICS signals) have their PVs
+    requested all at once through their control layer, waiting only once for
+    all of the responses. All others are read individually.
+
+    Parameters
+    ----------
+    objs : iterable
+        Objects to read
+
+    Returns
+    -------
+    values : OrderedDict
+        The combined `read` dictionaries, in the order of objs
+    '''
+    results = []
+    # control layer get_many -> [(result index, signal, pv), ...]
+    batches = OrderedDict()
+    for obj in objs:
+        request = None
+        if hasattr(obj, '_bulk_read_request'):
+            request = obj._bulk_read_request()
+
+        if request is None:
+            results.append(obj.read())
+        else:
+            get_many, pv = request
+            batches.setdefault(get_many, []).append((len(results), obj, pv))
+            results.append(None)
+
+    for get_many, requests in batches.items():
+        t0 = tracing.now()
+        infos = get_many([pv for idx, obj, pv in requests])
+        # recorded once per batch, rather than once per signal
+        if metrics.enabled or tracing.enabled:
+            t1 = tracing.now()
+            if metrics.enabled:
+                metrics.observe('ophyd_ca_get_many_seconds', t1 - t0)
+                metrics.inc('ophyd_ca_get_many_pvs_total', len(requests))
+            if tracing.enabled:
+                tracing.add_span('get_many', t0, t1, cat='ca',
+                                 args={'pvs': len(requests)})
+
+        for (idx, obj, pv), info in zip(requests, infos):
+            results[idx] = obj._bulk_read_result(info)
+
+    values = OrderedDict()
+    for res in results:
+        values.update(res)
+    return values
@@ -0,0 +1,364 @@
+'''
+:mod:`ophyd.metrics` - Performance metrics
+==========================================
+
+.. module:: ophyd.metrics
+   :synopsis: Counters and latency histograms of EPICS operations, callbacks
+              and device methods
+
+Metrics are disabled by default, in which case instrumented code only checks
+the module-level `enabled` flag. Once enabled (see `enable`), the following
+are recorded:
+
+============================== ========= ======================================
+Name                           Type      Labels
+============================== ========= ======================================
+ophyd_ca_get_seconds           histogram signal
+ophyd_ca_get_many_seconds      histogram
+ophyd_ca_get_many_pvs_total    counter
+ophyd_ca_put_seconds           histogram signal
+ophyd_put_completion_seconds   histogram signal
+ophyd_monitor_events_total     counter   signal
+ophyd_callback_seconds         histogram obj, sub_type, callback
+ophyd_set_and_wait_iterations  histogram signal
+ophyd_device_seconds           histogram device, operation
+============================== ========= ======================================
+
+Histograms count their observations, so the number of gets and puts are
+included in the CA latency histograms.
+
+``ophyd_device_seconds`` includes sub-devices read or described through their
+parent device. As their gets are batched with the parent's, the read of such
+a sub-device is timed as the whole batched read.
+
+Example::
+
+    from ophyd import metrics
+
+    metrics.enable()
+    ...  # run a scan
+    metrics.export('/tmp/ophyd_metrics.prom')
+'''
+
+import bisect
+import functools
+import json
+import threading
+import time
+from collections import OrderedDict
+
+__all__ = ['enabled', 'enable', 'disable', 'reset', 'inc', 'observe',
+           'timed_callback', 'callback_name', 'snapshot',
+           'to_prometheus', 'to_json', 'export', 'Counter', 'Histogram']
+
+#: Whether metrics are recorded; see `enable` and `disable`
+enabled = False
+
+#: Default histogram buckets for durations, in seconds
+LATENCY_BUCKETS = (1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 0.01, 0.05, 0.1, 0.5,
+                   1.0, 5.0, 10.0)
+#: Histogram buckets for iteration counts
+COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 1000)
+
+# name -> (type, description)
+_descriptions = {
+    'ophyd_ca_get_seconds': ('histogram', 'Channel access get latency'),
+    'ophyd_ca_get_many_seconds': ('histogram',
+                                  'Latency of batched channel access gets'),
+    'ophyd_ca_get_many_pvs_total': ('counter',
+                                    'PVs requested in batched gets'),
+    'ophyd_ca_put_seconds': ('histogram', 'Channel access put call duration'),
+    'ophyd_put_completion_seconds': ('histogram',
+                                     'Time from put to put completion'),
+    'ophyd_monitor_events_total': ('counter', 'Monitor events received'),
+    'ophyd_callback_seconds': ('histogram',
+                               'Subscription callback execution time'),
+    'ophyd_set_and_wait_iterations': ('histogram',
+                                      'Readback checks per set_and_wait'),
+    'ophyd_device_seconds': ('histogram',
+                             'Duration of device operations (e.g., stage, '
+                             'trigger, read, move)'),
+}
+
+# (name, sorted label items) -> Counter or Histogram
+_registry = {}
+_lock = threading.Lock()
+_start_time = time.time()
+
+
+class Counter:
+    '''A monotonically increasing count'''
+    kind = 'counter'
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount=1):
+        self.value += amount
+
+    def as_dict(self, elapsed):
+        rate = self.value / elapsed if elapsed > 0 else 0.0
+        return {'value': self.value, 'rate': rate}
+
+
+class Histogram:
+    '''Counts of observations falling in each of a set of buckets
+
+    Parameters
+    ----------
+    buckets : sequence of float
+        Increasing upper bounds of the buckets. Values larger than the last
+        fall into an implicit +Inf bucket.
+    '''
+    kind = 'histogram'
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def as_dict(self, elapsed):
+        # cumulative, as in the Prometheus exposition format
+        cumulative = 0
+        buckets = OrderedDict()
+        for bound, count in zip(self.buckets + (float('inf'), ),
+                                self.counts):
+            cumulative += count
+            buckets[_format_bound(bound)] = cumulative
+
+        return {'count': self.count, 'sum': self.sum, 'buckets': buckets}
+
+
+def _format_bound(bound):
+    return '+Inf' if bound == float('inf') else repr(bound)
+
+
+def enable():
+    '''Start recording metrics'''
+    global enabled
+    enabled = True
+
+
+def disable():
+    '''Stop recording metrics (already recorded ones are kept)'''
+    global enabled
+    enabled = False
+
+
+def reset():
+    '''Discard all recorded metrics'''
+    global _start_time
+    with _lock:
+        _registry.clear()
+        _start_time = time.time()
+
+
+def _get_metric(name, labels, factory):
+    key = (name, tuple(sorted((label, str(value))
+                              for label, value in labels.items())))
+    try:
+        return _registry[key]
+    except KeyError:
+        with _lock:
+            return _registry.setdefault(key, factory())
+
+
+def inc(name, amount=1, **labels):
+    '''Increment a counter
+
+    Parameters
+    ----------
+    name : str
+        The metric name
+    amount : int, optional
+        The amount to increment by
+    labels :
+        The labels identifying the counter, e.g. signal='motor'
+    '''
+    metric = _get_metric(name, labels, Counter)
+    with _lock:
+        metric.inc(amount)
+
+
+def observe(name, value, *, buckets=LATENCY_BUCKETS, **labels):
+    '''Record an observation in a histogram
+
+    Parameters
+    ----------
+    name : str
+        The metric name
+    value : float
+        The observed value (e.g., a duration in seconds)
+    buckets : sequence of float, optional
+        The histogram buckets, used when it is first created
+    labels :
+        The labels identifying the histogram, e.g. signal='motor'
+    '''
+    metric = _get_metric(name, labels, functools.partial(Histogram, buckets))
+    with _lock:
+        metric.observe(value)
+
+
+def timed_callback(name, callback, **labels):
+    '''Wrap callback to observe the time from now until it is called
+
+    Parameters
+    ----------
+    name : str
+        The histogram metric name
+    callback : callable
+        The callback to wrap
+    labels :
+        The histogram labels
+    '''
+    t0 = time.monotonic()
+
+    @functools.wraps(callback)
+    def wrapped(*args, **kwargs):
+        observe(name, time.monotonic() - t0, **labels)
+        return callback(*args, **kwargs)
+
+    return wrapped
+
+
+def callback_name(callback):
+    '''A label identifying a callback'''
+    callback = getattr(callback, 'callback', callback)
+    if isinstance(callback, functools.partial):
+        callback = callback.func
+
+    name = getattr(callback, '__qualname__', None)
+    if name is None:
+        return repr(callback)
+
+    module = getattr(callback, '__module__', None)
+    if module:
+        return '{}.{}'.format(module, name)
+    return name
+
+
+def snapshot():
+    '''A copy of all recorded metrics
+
+    Returns
+    -------
+    snapshot : dict
+        With keys 'timestamp', 'elapsed' (seconds since the metrics were
+        reset) and 'metrics': a list of dictionaries with the 'name', 'type',
+        'description' and 'labels' of each metric, along with its 'value' and
+        'rate' (counters), or its 'count', 'sum' and cumulative 'buckets'
+        (histograms).
+    '''
+    now = time.time()
+    with _lock:
+        elapsed = now - _start_time
+        items = sorted(_registry.items(), key=lambda item: item[0])
+        metrics = []
+        for (name, labels), metric in items:
+            info = {'name': name,
+                    'type': metric.kind,
+                    'description': _descriptions.get(name, (None, ''))[1],
+                    'labels': OrderedDict(labels),
+                    }
+            info.update(metric.as_dict(elapsed))
+            metrics.append(info)
+
+    return {'timestamp': now, 'elapsed': elapsed, 'metrics': metrics}
+
+
+def _escape_label(value):
+    return (str(value).replace('\\', r'\\').replace('"', r'\"')
+            .replace('\n', r'\n'))
+
+
+def _format_labels(labels, **extra):
+    items = list(labels.items()) + list(extra.items())
+    if not items:
+        return ''
+    return '{' + ','.join('{}="{}"'.format(key, _escape_label(value))
+                          for key, value in items) + '}'
+
+
+def to_prometheus(snap=None):
+    '''Format a snapshot in the Prometheus text exposition format
+
+    Parameters
+    ----------
+    snap : dict, optional
+        A snapshot (see `snapshot`), defaults to a new one
+    '''
+    if snap is None:
+        snap = snapshot()
+
+    lines = []
+    described = set()
+    for metric in snap['metrics']:
+        name, labels = metric['name'], metric['labels']
+        if name not in described:
+            described.add(name)
+            if metric['description']:
+                lines.append('# HELP {} {}'.format(name,
+                                                   metric['description']))
+            lines.append('# TYPE {} {}'.format(name, metric['type']))
+
+        if metric['type'] == 'counter':
+            lines.append('{}{} {}'.format(name, _format_labels(labels),
+                                          metric['value']))
+            continue
+
+        for bound, count in metric['buckets'].items():
+            lines.append('{}_bucket{} {}'.format(
+                name, _format_labels(labels, le=bound), count))
+        lines.append('{}_sum{} {!r}'.format(name, _format_labels(labels),
+                                            metric['sum']))
+        lines.append('{}_count{} {}'.format(name, _format_labels(labels),
+                                            metric['count']))
+
+    return '\n'.join(lines) + '\n'
+
+
+def to_json(snap=None, **kwargs):
+    '''Format a snapshot as JSON
+
+    Parameters
+    ----------
+    snap : dict, optional
+        A snapshot (see `snapshot`), defaults to a new one
+    kwargs :
+        Passed on to json.dumps
+    '''
+    if snap is None:
+        snap = snapshot()
+    return json.dumps(snap, **kwargs)
+
+
+def export(path, *, format=None):
+    '''Write a snapshot of the metrics to a file
+
+    Parameters
+    ----------
+    path : str
+        The file to write
+    format : {'prometheus', 'json'}, optional
+        Defaults to 'json' for paths ending in '.json', or 'prometheus'
+        otherwise
+    '''
+    if format is None:
+        format = 'json' if path.lower().endswith('.json') else 'prometheus'
+
+    if format == 'json':
+        text = to_json(indent=1)
+    elif format == 'prometheus':
+        text = to_prometheus()
+    else:
+        raise ValueError('Unknown metrics format {!r}; choose from: json, '
+                         'prometheus'.format(format))
+
+    with open(path, 'wt') as f:
+        f.write(text)
@@ -1,11 +1,310 @@
-from collections import defaultdict
 import time
 import logging
+import threading
+import functools
 
+import numpy as np
+
+from . import (metrics, tracing)
 from .status import (StatusBase, MoveStatus, DeviceStatus)
+from .utils.timers import get_timer_thread
 
 logger = logging.getLogger(__name__)
 
+# class -> subscription types, see OphydObject._get_sub_types
+_class_sub_types = {}
+# guards modifications of subscriber lists (dispatch does not need it)
+_subs_lock = threading.RLock()
+
+
+# per-thread set of (object id, operation) being instrumented
+_instrumented_calls = threading.local()
+
+
+def instrumented(operation):
+    '''Method decorator timing (see ophyd.metrics) and tracing (see
+    ophyd.tracing) an operation per object
+
+    Nested calls of the same operation on the same object (e.g., through
+    super()) are only recorded once, at the outermost call.
+
+    Parameters
+    ----------
+    operation : str
+        The operation name, e.g. 'trigger'
+    '''
+    def wrapper(fcn):
+        @functools.wraps(fcn)
+        def wrapped(self, *args, **kwargs):
+            if not (metrics.enabled or tracing.enabled):
+                return fcn(self, *args, **kwargs)
+
+            try:
+                active = _instrumented_calls.active
+            except AttributeError:
+                active = _instrumented_calls.active = set()
+
+            key = (id(self), operation)
+            if key in active:
+                return fcn(self, *args, **kwargs)
+
+            active.add(key)
+            t0 = tracing.now()
+            try:
+                return fcn(self, *args, **kwargs)
+            finally:
+                active.discard(key)
+                record_operation(self, operation, t0, tracing.now())
+
+        wrapped._ophyd_instrumented = True
+        return wrapped
+    return wrapper
+
+
+def record_operation(obj, operation, t0, t1):
+    '''Record the metrics and tracing span of an operation on obj
+
+    For operations which are not run through an `instrumented` method, such
+    as those of sub-devices flattened into the read plan of a parent device.
+
+    Parameters
+    ----------
+    obj : OphydObject
+        The object the operation was run on
+    operation : str
+        The operation name, e.g. 'read'
+    t0 : float
+        Start time, from ophyd.tracing.now()
+    t1 : float
+        End time, from ophyd.tracing.now()
+    '''
+    if metrics.enabled:
+        metrics.observe('ophyd_device_seconds', t1 - t0,
+                        device=obj.name, operation=operation)
+    if tracing.enabled:
+        tracing.add_span('{}.{}'.format(obj.name, operation), t0, t1,
+                         cat='device',
+                         args={'device': obj.name, 'operation': operation})
+
+
+class _EventRecord:
+    '''The arguments of the most recent event of a subscription type, kept
+    for replaying to new subscribers'''
+    __slots__ = ('args', 'kwargs')
+
+    def __init__(self, args, kwargs):
+        self.args = args
+        self.kwargs = kwargs
+
+
+def _get_delivery_thread():
+    '''The thread running coalesced/batched subscription callbacks
+
+    A single thread is shared by all such subscriptions, such that slow
+    consumers never hold up the threads which generate events.
+    '''
+    return get_timer_thread('ophyd_delivery')
+
+
+class _WrappedCallback:
+    '''Base for subscription callback wrappers'''
+    def __init__(self, callback):
+        self.callback = callback
+
+    def __eq__(self, other):
+        # compares equal to the subscribed callback, for clear_sub
+        if isinstance(other, _WrappedCallback):
+            return self is other
+        return self.callback == other
+
+    __hash__ = object.__hash__
+
+
+class CoalescedCallback(_WrappedCallback):
+    '''A subscription which is only delivered the latest of its events
+
+    Events arriving while one is pending are collapsed into it, keeping only
+    the latest arguments. Delivery happens on a separate thread, at most at
+    `max_rate`. See `OphydObject.subscribe`.
+
+    Parameters
+    ----------
+    callback : callable
+        The subscribed callback
+    max_rate : float, optional
+        Maximum number of callbacks per second. If unset, events are only
+        collapsed while delivery is behind.
+
+    Attributes
+    ----------
+    callback : callable
+        The subscribed callback
+    delivered : int
+        The number of events delivered to the callback
+    dropped : int
+        The number of events collapsed into later ones, and so never
+        delivered
+    '''
+    def __init__(self, callback, max_rate=None):
+        if max_rate is not None and max_rate <= 0:
+            raise ValueError('max_rate must be positive')
+
+        super().__init__(callback)
+        self.max_rate = max_rate
+        self.delivered = 0
+        self.dropped = 0
+
+        self._min_interval = (1.0 / max_rate) if max_rate else 0.0
+        self._lock = threading.Lock()
+        self._pending = None
+        self._last_delivery = None
+
+    def __call__(self, *args, **kwargs):
+        with self._lock:
+            if self._pending is not None:
+                # not yet delivered; replace it
+                self.dropped += 1
+                self._pending = (args, kwargs)
+                return
+
+            self._pending = (args, kwargs)
+            deliver_at = time.monotonic()
+            if self._last_delivery is not None:
+                deliver_at = max(deliver_at,
+                                 self._last_delivery + self._min_interval)
+
+        _get_delivery_thread().call_at(deliver_at, self._deliver)
+
+    def _deliver(self):
+        '''Run the callback with the pending event (delivery thread)'''
+        with self._lock:
+            args, kwargs = self._pending
+            self._pending = None
+            self._last_delivery = time.monotonic()
+            self.delivered += 1
+
+        self.callback(*args, **kwargs)
+
+    def __repr__(self):
+        return ('<CoalescedCallback {!r} max_rate={} delivered={} dropped={}>'
+                ''.format(self.callback, self.max_rate, self.delivered,
+                          self.dropped))
+
+
+class BatchedCallback(_WrappedCallback):
+    '''A subscription delivered its events in batches, as numpy arrays
+
+    The timestamp and value of each event are stored in preallocated arrays,
+    which are handed to the callback (on a separate thread) once full, or
+    once the oldest event in them is `max_latency` old. The callback is run
+    as::
+
+        callback(timestamps=timestamps, values=values, obj=obj,
+                 sub_type=sub_type)
+
+    See `OphydObject.subscribe_batch`.
+
+    Parameters
+    ----------
+    callback : callable
+        The subscribed callback
+    max_batch : int, optional
+        The maximum number of events per batch
+    max_latency : float, optional
+        The maximum time in seconds an event is held before delivery
+    dtype : numpy dtype, optional
+        The dtype of the values array
+
+    Attributes
+    ----------
+    callback : callable
+        The subscribed callback
+    delivered : int
+        The number of events delivered to the callback
+    batches : int
+        The number of batches delivered to the callback
+    '''
+    def __init__(self, callback, max_batch=1000, max_latency=0.1,
+                 dtype=float):
+        if max_batch < 1:
+            raise ValueError('max_batch must be at least 1')
+
+        super().__init__(callback)
+        self.max_batch = int(max_batch)
+        self.max_latency = float(max_latency)
+        self.dtype = np.dtype(dtype)
+        self.delivered = 0
+        self.batches = 0
+
+        self._lock = threading.Lock()
+        # incremented each time a batch is taken, invalidating latency
+        # flushes scheduled for earlier batches
+        self._generation = 0
+        self._info = {}
+        self._allocate()
+
+    def _allocate(self):
+        self._timestamps = np.empty(self.max_batch, dtype=float)
+        self._values = np.empty(self.max_batch, dtype=self.dtype)
+        self._count = 0
+
+    def __call__(self, *args, value=None, timestamp=None, obj=None,
+                 sub_type=None, **kwargs):
+        if timestamp is None:
+            timestamp = time.time()
+
+        with self._lock:
+            index = self._count
+            self._values[index] = value
+            self._timestamps[index] = timestamp
+            self._count += 1
+            self._info = dict(obj=obj, sub_type=sub_type)
+
+            # scheduled with the lock held, keeping batches in order
+            if self._count == self.max_batch:
+                _get_delivery_thread().call_at(time.monotonic(),
+                                               self._deliver, *self._take())
+            elif index == 0:
+                _get_delivery_thread().call_at(
+                    time.monotonic() + self.max_latency, self._flush_expired,
+                    self._generation)
+
+    def _take(self):
+        '''Take the current batch, replacing its arrays (with the lock)'''
+        count = self._count
+        batch = (self._timestamps[:count], self._values[:count], self._info)
+        self._generation += 1
+        self._allocate()
+        return batch
+
+    def _flush_expired(self, generation):
+        '''Deliver the batch that generation refers to, if still pending'''
+        with self._lock:
+            if generation != self._generation or not self._count:
+                return
+            batch = self._take()
+
+        self._deliver(*batch)
+
+    def flush(self):
+        '''Deliver any pending events now, from the calling thread'''
+        with self._lock:
+            if not self._count:
+                return
+            batch = self._take()
+
+        self._deliver(*batch)
+
+    def _deliver(self, timestamps, values, info):
+        self.batches += 1
+        self.delivered += len(values)
+        self.callback(timestamps=timestamps, values=values, **info)
+
+    def __repr__(self):
+        return ('<BatchedCallback {!r} max_batch={} delivered={} batches={}>'
+                ''.format(self.callback, self.max_batch, self.delivered,
+                          self.batches))
+
 
 class OphydObject:
     '''The base class for all objects in Ophyd
@@ -25,7 +324,11 @@ class OphydObject:
     name
     '''
 
+    SUB_CONNECTION = 'connection'
     _default_sub = None
+    # subscription types for which the most recent event is not kept for
+    # replaying to new subscribers (see `subscribe`)
+    _no_replay_subs = frozenset()
 
     def __init__(self, *, name=None, parent=None):
         super().__init__()
@@ -33,13 +336,41 @@ class OphydObject:
         self.name = name
         self._parent = parent
 
-        self._subs = dict((getattr(self, sub), []) for sub in dir(self)
-                          if sub.startswith('SUB_') or sub.startswith('_SUB_'))
-        self._sub_cache = defaultdict(lambda: None)
+        # subscription type -> tuple of callbacks, replaced (never modified)
+        # on subscribe and clear_sub
+        self._subs = dict.fromkeys(self._get_sub_types(), ())
+        self._sub_cache = {}
+
+    @classmethod
+    def _get_sub_types(cls):
+        '''All subscription types (SUB_* and _SUB_* attributes) of the class
+
+        These are only determined once per class.
+        '''
+        try:
+            return _class_sub_types[cls]
+        except KeyError:
+            pass
+
+        sub_types = []
+        for attr in dir(cls):
+            if attr.startswith('SUB_') or attr.startswith('_SUB_'):
+                sub_type = getattr(cls, attr)
+                if sub_type not in sub_types:
+                    sub_types.append(sub_type)
+
+        sub_types = tuple(sub_types)
+        _class_sub_types[cls] = sub_types
+        return sub_types
 
     @property
     def connected(self):
-        '''Subclasses should override this'''
+        '''Subclasses should override this
+
+        Subclasses whose connection state can change should also run the
+        SUB_CONNECTION subscription (with a `connected` keyword argument) when
+        it does.
+        '''
         return True
 
     @property
@@ -90,10 +421,9 @@ class OphydObject:
         cb
             The callback
         '''
-        cached = self._sub_cache[sub_type]
-        if cached:
-            args, kwargs = cached
-            self._run_sub(cb, *args, **kwargs)
+        cached = self._sub_cache.get(sub_type)
+        if cached is not None:
+            self._run_sub(cb, *cached.args, **cached.kwargs)
 
     def _run_subs(self, *args, **kwargs):
         '''Run a set of subscription callbacks
@@ -107,22 +437,41 @@ class OphydObject:
         sub_type = kwargs['sub_type']
 
         # Guarantee that the object will be in the kwargs
-        if 'obj' not in kwargs:
-            kwargs['obj'] = self
+        kwargs.setdefault('obj', self)
 
         # And if a timestamp key exists, but isn't filled -- supply it with
         # a new timestamp
-        if 'timestamp' in kwargs and kwargs['timestamp'] is None:
+        if kwargs.get('timestamp', 0) is None:
             kwargs['timestamp'] = time.time()
 
-        # Shallow-copy the callback arguments for replaying the
-        # callback at a later time (e.g., when a new subscription is made)
-        self._sub_cache[sub_type] = (tuple(args), dict(kwargs))
+        # Keep the callback arguments for replaying the callback at a later
+        # time (e.g., when a new subscription is made). Callbacks receive
+        # their own copy of kwargs, so these need not be copied.
+        if sub_type not in self._no_replay_subs:
+            self._sub_cache[sub_type] = _EventRecord(args, kwargs)
 
-        for cb in self._subs[sub_type]:
-            self._run_sub(cb, *args, **kwargs)
+        timed = metrics.enabled
 
-    def subscribe(self, cb, event_type=None, run=True):
+        # the tuple of callbacks is replaced rather than modified, so
+        # (un)subscribing from a callback is safe
+        for cb in self._subs[sub_type]:
+            if timed:
+                t0 = time.monotonic()
+
+            try:
+                cb(*args, **kwargs)
+            except Exception as ex:
+                logger.error('Subscription %s callback exception (%s)',
+                             sub_type, self, exc_info=ex)
+
+            if timed:
+                metrics.observe('ophyd_callback_seconds',
+                                time.monotonic() - t0, obj=self.name,
+                                sub_type=sub_type,
+                                callback=metrics.callback_name(cb))
+
+    def subscribe(self, cb, event_type=None, run=True, *, coalesce=False,
+                  max_rate=None):
         '''Subscribe to events this signal group emits
 
         See also :func:`clear_sub`
@@ -137,7 +486,22 @@ class OphydObject:
             the default sub for the instance - obj._default_sub)
         run : bool, optional
             Run the callback now
+        coalesce : bool, optional
+            Only deliver the latest event, from a separate thread, collapsing
+            any events which arrive while one is pending. Suited to slow
+            consumers (e.g., GUIs) of high-rate events.
+        max_rate : float, optional
+            With coalesce, the maximum number of callbacks per second
+
+        Returns
+        -------
+        cb : callable
+            The callback as subscribed: with coalesce, a CoalescedCallback
+            counting delivered and dropped events
         '''
+        if max_rate is not None and not coalesce:
+            raise ValueError('max_rate requires coalesce=True')
+
         if event_type is None:
             event_type = self._default_sub
 
@@ -146,17 +510,64 @@ class OphydObject:
                              ' {} has no default subscription set'
                              ''.format(self.name, self.__class__.__name__))
 
-        try:
-            self._subs[event_type].append(cb)
-        except KeyError:
-            raise KeyError('Unknown event type: %s' % event_type)
+        if coalesce:
+            cb = CoalescedCallback(cb, max_rate=max_rate)
+
+        with _subs_lock:
+            try:
+                self._subs[event_type] += (cb, )
+            except KeyError:
+                raise KeyError('Unknown event type: %s' % event_type)
 
         if run:
             self._run_cached_sub(event_type, cb)
 
+        return cb
+
+    def subscribe_batch(self, cb, event_type=None, *, max_batch=1000,
+                        max_latency=0.1, dtype=float):
+        '''Subscribe to events, delivered in batches as numpy arrays
+
+        The timestamp and value of every event are accumulated, and the
+        callback is run (on a separate thread) with whole arrays of them::
+
+            cb(timestamps=timestamps, values=values, obj=obj,
+               sub_type=sub_type)
+
+        This amortizes the callback overhead over many events, and allows for
+        vectorized processing.
+
+        See also :func:`clear_sub`
+
+        Parameters
+        ----------
+        cb : callable
+            The callback
+        event_type : str, optional
+            The name of the event to subscribe to (if None, defaults to
+            the default sub for the instance - obj._default_sub)
+        max_batch : int, optional
+            The maximum number of events per batch
+        max_latency : float, optional
+            The maximum time in seconds an event is held before delivery
+        dtype : numpy dtype, optional
+            The dtype of the values array
+
+        Returns
+        -------
+        cb : BatchedCallback
+            The callback as subscribed, with delivery counts and a `flush`
+            method
+        '''
+        batched = BatchedCallback(cb, max_batch=max_batch,
+                                  max_latency=max_latency, dtype=dtype)
+        self.subscribe(batched, event_type=event_type, run=False)
+        return batched
+
     def _reset_sub(self, event_type):
         '''Remove all subscriptions in an event type'''
-        del self._subs[event_type][:]
+        with _subs_lock:
+            self._subs[event_type] = ()
 
     def clear_sub(self, cb, event_type=None):
         '''Remove a subscription, given the original callback function
@@ -171,14 +582,21 @@ class OphydObject:
             The event to unsubscribe from (if None, removes it from all event
             types)
         '''
-        if event_type is None:
-            for event_type, cbs in self._subs.items():
+        def remove(event_type, cb):
+            cbs = list(self._subs[event_type])
+            cbs.remove(cb)
+            self._subs[event_type] = tuple(cbs)
+
+        with _subs_lock:
+            if event_type is not None:
+                remove(event_type, cb)
+                return
+
+            for event_type in self._subs:
                 try:
-                    cbs.remove(cb)
+                    remove(event_type, cb)
                 except ValueError:
                     pass
-        else:
-            self._subs[event_type].remove(cb)
 
     def check_value(self, value, **kwargs):
         '''Check if the value is valid for this object
@@ -3,7 +3,7 @@ import time
 from functools import partial
 from collections import OrderedDict
 
-from .ophydobj import OphydObject
+from .ophydobj import (OphydObject, instrumented)
 from .status import (MoveStatus, wait as status_wait)
 from .utils.epics_pvs import (data_type, data_shape)
 
@@ -80,6 +80,7 @@ class PositionerBase(OphydObject):
     def high_limit(self):
         return self.limits[1]
 
+    @instrumented('move')
     def move(self, position, moved_cb=None, timeout=None):
         '''Move to a specified position, optionally waiting for motion to
         complete.
@@ -251,6 +252,7 @@ class SoftPositioner(PositionerBase):
         self._set_position(position)
         self._done_moving()
 
+    @instrumented('move')
     def move(self, position, wait=True, timeout=None, moved_cb=None):
         '''Move to a specified position, optionally waiting for motion to
         complete.
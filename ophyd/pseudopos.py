@@ -18,7 +18,8 @@ from collections import (OrderedDict, namedtuple, Sequence)
 from .utils import DisconnectedError
 from .positioner import (PositionerBase, SoftPositioner)
 from .device import Device
-from .status import (wait as status_wait)
+from .ophydobj import instrumented
+from .status import (AndStatus, wait as status_wait)
 
 logger = logging.getLogger(__name__)
 
@@ -141,6 +142,7 @@ class PseudoSingle(SoftPositioner):
         '''
         pass
 
+    @instrumented('move')
     def move(self, pos, **kwargs):
         '''Move this pseudo axis to a specific position.
 
@@ -316,7 +318,8 @@ class PseudoPositioner(Device, SoftPositioner):
         self._finished_lock = threading.RLock()
         self._concurrent = bool(concurrent)
         self._finish_thread = None
-        self._real_waiting = []
+        # combined status of the real motions of a concurrent move
+        self._real_status = None
         self._move_queue = []
 
         if self.__class__ is PseudoPositioner:
@@ -596,24 +599,23 @@ class PseudoPositioner(Device, SoftPositioner):
 
     def _done_moving(self, success=True):
         '''Call this when motion has completed.  Runs SUB_DONE subscription.'''
-        del self._real_waiting[:]
+        self._real_status = None
         super()._done_moving(success=success)
 
-    def _real_finished(self, obj=None):
-        '''Callback: A single real positioner has finished moving.
+    def _real_finished(self, status):
+        '''Callback: The real positioners have finished moving.
 
-        Used for asynchronous motion, if all have finished moving then fire a
-        callback (via `Positioner._done_moving`)
+        Used for asynchronous motion, with the combined status of all real
+        motions. Fires a callback (via `Positioner._done_moving`), unless the
+        motion was superseded by another one.
         '''
         with self._finished_lock:
-            real = obj
-            logger.debug('Real motor %s finished moving', real.name)
+            if status is not self._real_status:
+                return
 
-            if real in self._real_waiting:
-                self._real_waiting.remove(real)
-
-                if not self._real_waiting:
-                    self._done_moving()
+            logger.debug('[%s:concurrent] Real motors finished moving '
+                         '(success=%s)', self.name, status.success)
+            self._done_moving(success=status.success)
 
     def move_single(self, pseudo, position, **kwargs):
         '''Move one PseudoSingle axis to a position
@@ -693,12 +695,14 @@ class PseudoPositioner(Device, SoftPositioner):
 
     def _concurrent_move(self, real_pos, **kwargs):
         '''Move all real positioners to a certain position, in parallel'''
-        self._real_waiting.extend(self._real)
-
+        statuses = []
         for real, value in zip(self._real, real_pos):
             logger.debug('[concurrent] Moving %s to %s', real.name, value)
-            real.move(value, wait=False, moved_cb=self._real_finished,
-                      **kwargs)
+            statuses.append(real.move(value, wait=False, **kwargs))
+
+        # done once all real motions are, even should one of them fail
+        self._real_status = AndStatus(*statuses, fail_fast=False)
+        self._real_status.add_callback(self._real_finished)
 
     @pseudo_position_argument
     def move(self, position, wait=True, timeout=None, moved_cb=None):
@@ -749,7 +753,7 @@ class PseudoPositioner(Device, SoftPositioner):
             Status object created by PositionerBase.move()
         '''
         # Clear all old statuses for not yet completed real motions
-        del self._real_waiting[:]
+        self._real_status = None
 
         timeout = status.timeout
         real_pos = self.forward(position)
@@ -1,14 +1,18 @@
 # vi: ts=4 sw=4
 import logging
+import threading
 import time
 
-import epics
-
+from . import metrics
+from .control_layer import get_cl
 from .utils import (ReadOnlyError, LimitError)
 from .utils.epics_pvs import (pv_form, waveform_to_string,
-                              raise_if_disconnected, data_type, data_shape)
+                              raise_if_disconnected, data_type, data_shape,
+                              _value_matcher)
+from .utils.futures import (create_future, get_loop, resolved,
+                            resolve_threadsafe, chain)
 from .ophydobj import OphydObject
-from .status import DeviceStatus
+from .status import (DeviceStatus, Status, AndStatus)
 
 logger = logging.getLogger(__name__)
 
@@ -93,6 +97,65 @@ class Signal(OphydObject):
         self._run_subs(sub_type=self.SUB_VALUE, old_value=old_value,
                        value=value, timestamp=self._timestamp)
 
+    def set(self, value, *, tolerance=None, timeout=None, settle_time=None):
+        '''Set the value of the signal, returning a status object
+
+        For a soft signal, the value is set (and the status completed)
+        immediately.
+
+        Parameters
+        ----------
+        value : any
+            Value to set
+        tolerance : float, optional
+            Allowed difference between the readback and the value for the
+            set to be considered complete, where applicable
+        timeout : float, optional
+            Maximum time to wait for the set to complete, after which the
+            status is marked as failed
+        settle_time : float, optional
+            Time to wait after completion before running status callbacks
+
+        Returns
+        -------
+        status : Status
+        '''
+        self.put(value)
+        status = Status(self, timeout=timeout, settle_time=settle_time)
+        status._finished()
+        return status
+
+    def get_async(self, *, loop=None):
+        '''The readback value, as an asyncio future
+
+        Parameters
+        ----------
+        loop : asyncio.AbstractEventLoop, optional
+            The event loop the future belongs to, defaulting to the current
+            one
+
+        Returns
+        -------
+        future : asyncio.Future
+        '''
+        return resolved(self.get(), loop=loop)
+
+    def set_async(self, value, **kwargs):
+        '''Set the value of the signal, to be awaited from a coroutine
+
+        Keyword arguments are passed on to `set`.
+
+        Returns
+        -------
+        status : StatusBase
+            The set status, which may be awaited
+        '''
+        return self.set(value, **kwargs)
+
+    def read_async(self, *, loop=None):
+        '''The `read` dictionary, as an asyncio future'''
+        return resolved(self.read(), loop=loop)
+
     @property
     def value(self):
         '''The signal's value'''
@@ -161,6 +224,14 @@ class DerivedSignal(Signal):
             # set up the initial timestamp reporting, if connected
             self._timestamp = self._derived_from.timestamp
 
+        self._derived_from.subscribe(self._derived_connection_changed,
+                                     event_type=self.SUB_CONNECTION)
+
+    def _derived_connection_changed(self, connected=None, **kwargs):
+        '''Connection state of the original signal changed'''
+        self._run_subs(sub_type=self.SUB_CONNECTION, connected=connected,
+                       timestamp=None)
+
     @property
     def derived_from(self):
         '''Signal that this one is derived from'''
@@ -184,6 +255,23 @@ class DerivedSignal(Signal):
         self._timestamp = self._derived_from.timestamp
         return res
 
+    def set(self, value, **kwargs):
+        '''Set the value of the original signal, returning a status object'''
+        return self._derived_from.set(value, **kwargs)
+
+    def get_async(self, *, loop=None):
+        '''Get the value from the original signal, as an asyncio future'''
+        return self._derived_from.get_async(loop=loop)
+
+    def read_async(self, *, loop=None):
+        '''The `read` dictionary, from the original signal's value'''
+        def to_read(value):
+            self._timestamp = self._derived_from.timestamp
+            return {self.name: {'value': value,
+                                'timestamp': self._timestamp}}
+
+        return chain(self.get_async(loop=loop), to_read, loop=loop)
+
     def wait_for_connection(self, timeout=0.0):
         '''Wait for the original signal to connect'''
         return self._derived_from.wait_for_connection(timeout=timeout)
@@ -213,19 +301,35 @@ class EpicsSignalBase(Signal):
     read_pv : str
         The PV to read from
     pv_kw : dict, optional
-        Keyword arguments for epics.PV(**pv_kw)
+        Keyword arguments for epics.PV(**pv_kw). A connection_callback is
+        called after the signal's own.
     auto_monitor : bool, optional
         Use automonitor with epics.PV
     name : str, optional
         Name of signal.  If not given defaults to read_pv
     string : bool, optional
         Attempt to cast the EPICS PV value to a string by default
+    cl : namespace, optional
+        The control layer used to create PVs, defaults to the currently
+        selected one (see `ophyd.control_layer.set_cl`)
+    read_source : {'get', 'monitor'}, optional
+        Where `get` and `read` take the value from; see `set_read_source`
+    max_age : float, optional
+        Maximum age of a monitored value for the 'monitor' read source
     '''
+    READ_SOURCES = ('get', 'monitor')
+    # control variables (metadata) held in the ctrlvars cache
+    CTRLVARS = ('precision', 'units', 'enum_strs', 'lower_ctrl_limit',
+                'upper_ctrl_limit')
+
     def __init__(self, read_pv, *,
                  pv_kw=None,
                  string=False,
                  auto_monitor=False,
                  name=None,
+                 cl=None,
+                 read_source='get',
+                 max_age=None,
                  **kwargs):
 
         if 'rw' in kwargs:
@@ -241,10 +345,38 @@ class EpicsSignalBase(Signal):
 
         if pv_kw is None:
             pv_kw = dict()
+        else:
+            pv_kw = dict(pv_kw)
 
+        if cl is None:
+            cl = get_cl()
+
+        self._cl = cl
         self._read_pv = None
+        self._conn_lock = threading.RLock()
+        # PV name -> connection state, as reported by connection callbacks
+        self._pv_connected = {}
+        self._signal_connected = False
         self._string = bool(string)
+        # a connection callback of the caller's, chained to the signal's own
+        self._user_conn_callback = pv_kw.pop('connection_callback', None)
         self._pv_kw = pv_kw
+        self._read_source = None
+        self._max_age = None
+        # local (monotonic) time the last monitor event was received
+        self._monitor_time = None
+        # PV name -> control variables, see _get_ctrlvars
+        self._ctrlvars = {}
+        # PV name -> PV monitoring its properties, see _get_ctrlvars
+        self._property_pvs = {}
+        # cached description and the (type, shape) of the value it is for,
+        # see describe
+        self._describe_cache = None
+        self._describe_layout = None
+
+        if read_source == 'monitor':
+            auto_monitor = True
+
         self._auto_monitor = auto_monitor
 
         if name is None:
@@ -252,12 +384,15 @@ class EpicsSignalBase(Signal):
 
         super().__init__(name=name, **kwargs)
 
-        self._read_pv = epics.PV(read_pv, form=pv_form,
-                                 auto_monitor=auto_monitor,
-                                 **pv_kw)
+        self._read_pv = cl.get_pv(read_pv, form=pv_form,
+                                  auto_monitor=auto_monitor,
+                                  connection_callback=self._pv_conn_changed,
+                                  **pv_kw)
 
         self._read_pv.add_callback(self._read_changed,
                                    run_now=self._read_pv.connected)
+        self._update_connection_state()
+        self.set_read_source(read_source, max_age=max_age)
 
     @property
     def as_string(self):
@@ -268,15 +403,81 @@ class EpicsSignalBase(Signal):
     @raise_if_disconnected
     def precision(self):
         '''The precision of the read PV, as reported by EPICS'''
-        return self._read_pv.precision
+        return self._get_ctrlvars(self._read_pv)['precision']
+
+    @property
+    @raise_if_disconnected
+    def units(self):
+        '''The engineering units of the read PV, as reported by EPICS'''
+        return self._get_ctrlvars(self._read_pv)['units']
 
     @property
     @raise_if_disconnected
     def enum_strs(self):
         """List of strings if PV is an enum type"""
-        return self._read_pv.enum_strs
+        return self._get_ctrlvars(self._read_pv)['enum_strs']
+
+    def _get_ctrlvars(self, pv):
+        '''Control variables (metadata) of one of the signal's PVs
 
-    def _reinitialize_pv(self, old_instance, **pv_kw):
+        These are requested from EPICS only once and then cached, until
+        the PV reconnects or `refresh_ctrlvars` is called. The PV's properties
+        are monitored from then on (see the control layer `get_property_pv`),
+        such that changes on the IOC update the cache.
+
+        Returns
+        -------
+        ctrlvars : dict
+            Keyed on CTRLVARS, with None for any not available
+        '''
+        try:
+            return self._ctrlvars[pv.pvname]
+        except KeyError:
+            pass
+
+        self._monitor_properties(pv.pvname)
+        ctrlvars = pv.get_ctrlvars()
+        if ctrlvars is None:
+            # request failed; fall back to the PV attributes, and do not
+            # cache so that it will be retried
+            return {key: getattr(pv, key, None) for key in self.CTRLVARS}
+
+        ctrlvars = {key: ctrlvars.get(key) for key in self.CTRLVARS}
+        with self._conn_lock:
+            # a property event may have arrived in the meantime
+            return self._ctrlvars.setdefault(pv.pvname, ctrlvars)
+
+    def _monitor_properties(self, pvname):
+        '''Subscribe to property (DBE_PROPERTY) events of a PV, if not yet'''
+        with self._conn_lock:
+            if pvname not in self._property_pvs:
+                self._property_pvs[pvname] = self._cl.get_property_pv(
+                    pvname, callback=self._property_changed)
+
+    def _property_changed(self, pvname=None, **kwargs):
+        '''Property monitor callback, with the control variables of a PV
+
+        Run on subscription and whenever the properties change on the IOC.
+        '''
+        ctrlvars = {key: kwargs.get(key) for key in self.CTRLVARS}
+        with self._conn_lock:
+            old = self._ctrlvars.get(pvname)
+            self._ctrlvars[pvname] = ctrlvars
+
+        if old is None or any(_differs(ctrlvars[key], old[key])
+                              for key in self.CTRLVARS):
+            self._describe_cache = None
+
+    def refresh_ctrlvars(self):
+        '''Discard the cached control variables (limits, precision, units and
+        enum strings), such that they are requested again on next access
+
+        The cached description (see `describe`) is discarded as well.
+        '''
+        self._ctrlvars.clear()
+        self._describe_cache = None
+
+    def _reinitialize_pv(self, old_instance, *, wait=True, **pv_kw):
         '''Reinitialize a PV instance
 
         Takes care of clearing callbacks, setting PV form, and ensuring
@@ -284,8 +485,10 @@ class EpicsSignalBase(Signal):
 
         Parameters
         ----------
-        old_instance : epics.PV
-            The old PV instance
+        old_instance : PV
+            The old PV instance, as created by the control layer
+        wait : bool, optional
+            Wait for the new instance to connect, if the old one was
         pv_kw : kwargs
             The parameters to pass to the initializer
         '''
@@ -293,14 +496,15 @@ class EpicsSignalBase(Signal):
         old_instance.clear_callbacks()
         was_connected = old_instance.connected
 
-        new_instance = epics.PV(old_instance.pvname, form=old_instance.form,
-                                **pv_kw)
-        if was_connected:
+        new_instance = self._cl.get_pv(
+            old_instance.pvname, form=old_instance.form,
+            connection_callback=self._pv_conn_changed, **pv_kw)
+        if was_connected and wait:
             new_instance.wait_for_connection()
 
         return new_instance
 
-    def subscribe(self, callback, event_type=None, run=True):
+    def subscribe(self, callback, event_type=None, run=True, **kwargs):
         if event_type is None:
             event_type = self._default_sub
 
@@ -309,17 +513,101 @@ class EpicsSignalBase(Signal):
         obj_mon = (event_type == self.SUB_VALUE and
                    self._auto_monitor is not True)
 
-        # but if the epics.PV has already connected and determined that it
+        if obj_mon:
+            self._monitor_read_pv()
+
+        return super().subscribe(callback, event_type=event_type, run=run,
+                                 **kwargs)
+
+    def _monitor_read_pv(self, *, wait=True):
+        '''Ensure that the read PV is monitored
+
+        Parameters
+        ----------
+        wait : bool, optional
+            Wait for the PV to reconnect, should it have to be recreated
+        '''
+        # if the epics.PV has already connected and determined that it
         # should automonitor (based on the maximum automonitor length), then we
         # don't need to reinitialize it
-        if obj_mon and not self._read_pv.auto_monitor:
-            self._read_pv = self._reinitialize_pv(self._read_pv,
-                                                  auto_monitor=True,
-                                                  **self._pv_kw)
-            self._read_pv.add_callback(self._read_changed,
-                                       run_now=self._read_pv.connected)
+        if self._read_pv.auto_monitor:
+            return
 
-        return super().subscribe(callback, event_type=event_type, run=run)
+        self._monitor_time = None
+        self._read_pv = self._reinitialize_pv(self._read_pv, wait=wait,
+                                              auto_monitor=True,
+                                              **self._pv_kw)
+        self._read_pv.add_callback(self._read_changed,
+                                   run_now=self._read_pv.connected)
+
+    @property
+    def read_source(self):
+        '''Where `get` and `read` take the value from: 'get' or 'monitor'
+
+        See `set_read_source`.
+        '''
+        return self._read_source
+
+    @property
+    def max_age(self):
+        '''Maximum age of a monitored value for the 'monitor' read source'''
+        return self._max_age
+
+    def set_read_source(self, read_source, *, max_age=None):
+        '''Set the read source policy
+
+        Parameters
+        ----------
+        read_source : {'get', 'monitor'}
+            'get' asks the control layer for the value on every `get` and
+            `read`. 'monitor' monitors the read PV and answers from the most
+            recent monitor event, without any network traffic, falling back
+            to 'get' when no (sufficiently recent) monitored value exists.
+        max_age : float, optional
+            With the 'monitor' read source, the maximum time in seconds since
+            the last monitor event was received for its value to be used
+        '''
+        if read_source not in self.READ_SOURCES:
+            raise ValueError('Unknown read source {!r}; choose from: {}'
+                             ''.format(read_source,
+                                       ', '.join(self.READ_SOURCES)))
+
+        if max_age is not None:
+            max_age = float(max_age)
+
+        if read_source == 'monitor':
+            self._monitor_read_pv()
+
+        self._read_source = read_source
+        self._max_age = max_age
+
+    def _monitor_cache_valid(self, get_kw=None):
+        '''Can the cached monitor value be used in place of a get?
+
+        Parameters
+        ----------
+        get_kw : dict, optional
+            Keyword arguments to `get`, other than as_string. Any affecting
+            the returned value require a get.
+        '''
+        if self._read_source != 'monitor' or self._monitor_time is None:
+            return False
+
+        if get_kw:
+            if get_kw.get('use_monitor', True) is False:
+                return False
+            if not set(get_kw).issubset(('use_monitor', 'timeout')):
+                return False
+
+        pv = self._read_pv
+        if not (pv.auto_monitor and pv.connected):
+            return False
+
+        if self._max_age is not None:
+            age = time.monotonic() - self._monitor_time
+            return age <= self._max_age
+
+        return True
 
     def wait_for_connection(self, timeout=1.0):
         if not self._read_pv.connected:
@@ -352,15 +640,48 @@ class EpicsSignalBase(Signal):
     def connected(self):
         return self._read_pv.connected
 
+    def _connection_pvs(self):
+        '''The PVs which all must be connected for the signal to be'''
+        return (self._read_pv, )
+
+    def _pv_conn_changed(self, pvname=None, conn=None, pv=None, **kwargs):
+        '''Connection callback from any of the signal's PVs'''
+        with self._conn_lock:
+            self._pv_connected[pvname] = bool(conn)
+            # metadata may have changed, e.g. if the IOC was rebooted
+            self._ctrlvars.pop(pvname, None)
+            self._describe_cache = None
+            self._update_connection_state()
+
+        if self._user_conn_callback is not None:
+            self._user_conn_callback(pvname=pvname, conn=conn, pv=pv, **kwargs)
+
+    def _update_connection_state(self):
+        '''Run the connection subscription if the connection state changed
+
+        The state is determined from the connection callbacks, as the PV
+        `connected` attribute may only be updated after they have run.
+        '''
+        with self._conn_lock:
+            connected = all(pv is not None and
+                            self._pv_connected.get(pv.pvname, pv.connected)
+                            for pv in self._connection_pvs())
+
+            if connected == self._signal_connected:
+                return
+
+            self._signal_connected = connected
+            self._run_subs(sub_type=self.SUB_CONNECTION, connected=connected,
+                           timestamp=None)
+
     @property
     @raise_if_disconnected
     def limits(self):
         '''The read PV limits'''
 
         # This overrides the base limits
-        pv = self._read_pv
-        pv.get_ctrlvars()
-        return (pv.lower_ctrl_limit, pv.upper_ctrl_limit)
+        ctrlvars = self._get_ctrlvars(self._read_pv)
+        return (ctrlvars['lower_ctrl_limit'], ctrlvars['upper_ctrl_limit'])
 
     def get(self, *, as_string=None, **kwargs):
         '''Get the readback value through an explicit call to EPICS
@@ -380,18 +701,36 @@ class EpicsSignalBase(Signal):
         use_monitor : bool, optional
             to use value from latest monitor callback or to make an
             explicit CA call for the value. (default: True)
+
+        With the 'monitor' read source (see `set_read_source`), the most recent
+        monitored value is returned without any call to EPICS, provided the
+        kwargs do not change the value returned.
         '''
-        # NOTE: in the future this should be improved to grab self._readback
-        #       instead, when all of the kwargs match up
         if as_string is None:
             as_string = self._string
 
+        if self._read_source == 'monitor':
+            if as_string == self._string and self._monitor_cache_valid(kwargs):
+                return self._readback
+
+            # the monitored value is missing or stale, so bypass it
+            kwargs.setdefault('use_monitor', False)
+
         if not self._read_pv.connected:
             if not self._read_pv.wait_for_connection():
                 raise TimeoutError('Failed to connect to %s' %
                                    self._read_pv.pvname)
 
-        ret = self._read_pv.get(as_string=as_string, **kwargs)
+        if metrics.enabled:
+            t0 = time.monotonic()
+            ret = self._read_pv.get(as_string=as_string, **kwargs)
+            # only gets not served from the pyepics monitor cache
+            if not (self._read_pv.auto_monitor and
+                    kwargs.get('use_monitor', True)):
+                metrics.observe('ophyd_ca_get_seconds',
+                                time.monotonic() - t0, signal=self.name)
+        else:
+            ret = self._read_pv.get(as_string=as_string, **kwargs)
 
         if as_string:
             return waveform_to_string(ret)
@@ -409,17 +748,45 @@ class EpicsSignalBase(Signal):
         if timestamp is None:
             timestamp = time.time()
 
+        if self._string and kwargs.get('enum_strs'):
+            # enum state string, as get(as_string=True) would return
+            value = kwargs.get('char_value', value)
+
         value = self._fix_type(value)
+
+        if (self._describe_cache is not None and
+                _value_layout(value) != self._describe_layout):
+            # the data type or shape in the description changed
+            self._describe_cache = None
+
+        if metrics.enabled:
+            metrics.inc('ophyd_monitor_events_total', signal=self.name)
+
         super().put(value, timestamp=timestamp, force=True)
 
+        # only after the readback has been updated, such that the cached
+        # value is never older than the monitor time implies
+        if self._read_pv is not None and self._read_pv.auto_monitor:
+            self._monitor_time = time.monotonic()
+
     def describe(self):
         """Return the description as a dictionary
 
+        The description is cached, provided that monitor events will tell
+        when it changes: that is, if the read PV is monitored or its data type
+        and shape are fixed (i.e., strings and scalars). It is discarded when
+        a monitored value changes type or shape, the control variables change
+        (see `refresh_ctrlvars`) or the connection state changes.
+
         Returns
         -------
         dict
             Dictionary of name and formatted description string
         """
+        desc = self._describe_cache
+        if desc is not None:
+            return {self.name: dict(desc)}
+
         desc = {'source': 'PV:{}'.format(self._read_pv.pvname), }
 
         val = self.value
@@ -430,16 +797,37 @@ class EpicsSignalBase(Signal):
             desc['precision'] = int(self.precision)
         except (ValueError, TypeError):
             pass
-        desc['units'] = self._read_pv.units
+        desc['units'] = self.units
 
+        pvs = [self._read_pv]
         if hasattr(self, '_write_pv'):
-            desc['lower_ctrl_limit'] = self._write_pv.lower_ctrl_limit
-            desc['upper_ctrl_limit'] = self._write_pv.upper_ctrl_limit
+            ctrlvars = self._get_ctrlvars(self._write_pv)
+            desc['lower_ctrl_limit'] = ctrlvars['lower_ctrl_limit']
+            desc['upper_ctrl_limit'] = ctrlvars['upper_ctrl_limit']
+            pvs.append(self._write_pv)
 
         if self.enum_strs:
             desc['enum_strs'] = list(self.enum_strs)
 
-        return {self.name: desc}
+        if self._describe_cacheable(desc, pvs):
+            self._describe_cache = desc
+            self._describe_layout = _value_layout(val)
+
+        return {self.name: dict(desc)}
+
+    def _describe_cacheable(self, desc, pvs):
+        '''Would monitor events tell when the description changes?'''
+        if not all(pv.connected and pv.pvname in self._ctrlvars
+                   for pv in pvs):
+            # control variables not cached, or not up-to-date
+            return False
+
+        if self._read_pv.auto_monitor or desc['dtype'] == 'string':
+            return True
+
+        # a scalar PV cannot change type or shape without reconnecting
+        return (desc['dtype'] == 'number' and
+                (getattr(self._read_pv, 'nelm', None) or 1) <= 1)
 
     @raise_if_disconnected
     def read(self):
@@ -450,9 +838,127 @@ class EpicsSignalBase(Signal):
         dict
             Dictionary of value timestamp pairs
         """
+        if self._monitor_cache_valid():
+            return {self.name: {'value': self._readback,
+                                'timestamp': self._timestamp}}
+
+        value = self.get()
+        if getattr(self._read_pv, 'form', None) == 'time':
+            # the timestamp was already received along with the value
+            timestamp = self._read_pv.timestamp
+        else:
+            timestamp = self.timestamp
 
-        return {self.name: {'value': self.value,
-                            'timestamp': self.timestamp}}
+        return {self.name: {'value': value,
+                            'timestamp': timestamp}}
+
+    def _monitor_async(self, loop):
+        '''A future resolved with the (value, timestamp) of the read PV
+
+        The read PV is monitored (without blocking for it to reconnect), and
+        the most recent monitor event used, awaiting the first one if
+        necessary.
+        '''
+        if self._read_pv.auto_monitor and self._monitor_time is not None:
+            return resolved((self._readback, self._timestamp), loop=loop)
+
+        future = create_future(loop)
+        # resolved (and unsubscribed) only once, by whichever of the monitor
+        # event and the check below comes first
+        lock = threading.Lock()
+        state = {'resolved': False}
+
+        def resolve(value, timestamp):
+            with lock:
+                if state['resolved']:
+                    return
+                state['resolved'] = True
+
+            self.clear_sub(value_changed)
+            resolve_threadsafe(loop, future, (value, timestamp))
+
+        def value_changed(value=None, timestamp=None, **kwargs):
+            resolve(value, timestamp)
+
+        self._monitor_read_pv(wait=False)
+        self.subscribe(value_changed, event_type=self.SUB_VALUE, run=False)
+
+        if self._monitor_time is not None:
+            # a monitor event arrived before subscribing
+            resolve(self._readback, self._timestamp)
+
+        return future
+
+    def get_async(self, *, loop=None):
+        '''The readback value, as an asyncio future
+
+        Rather than issuing a blocking get, the read PV is monitored and the
+        future resolved from the most recent monitor event (awaiting the first
+        one, should there be none yet).
+
+        Parameters
+        ----------
+        loop : asyncio.AbstractEventLoop, optional
+            The event loop the future belongs to, defaulting to the current
+            one
+
+        Returns
+        -------
+        future : asyncio.Future
+        '''
+        loop = get_loop(loop)
+        return chain(self._monitor_async(loop), lambda info: info[0],
+                     loop=loop)
+
+    def read_async(self, *, loop=None):
+        '''The `read` dictionary, as an asyncio future (see `get_async`)'''
+        loop = get_loop(loop)
+
+        def to_read(info):
+            value, timestamp = info
+            return {self.name: {'value': value,
+                                'timestamp': timestamp}}
+
+        return chain(self._monitor_async(loop), to_read, loop=loop)
+
+    def _bulk_read_request(self):
+        '''The request for this signal in a batched read (see `Device.read`)
+
+        Only unmonitored read PVs are batched, as monitored ones are read
+        from the monitor cache without a request, and only for signals which
+        do not customize `get` or `read`.
+
+        Returns
+        -------
+        request : (get_many, pv) or None
+            The control layer function to batch the get with, and the PV to
+            get. None if `read` should be called instead.
+        '''
+        cls = type(self)
+        if (cls.get is not EpicsSignalBase.get or
+                cls.read is not EpicsSignalBase.read):
+            return None
+
+        if self._string or self._read_pv.auto_monitor:
+            return None
+
+        if not self._read_pv.connected:
+            return None
+
+        return (self._cl.get_many, self._read_pv)
+
+    def _bulk_read_result(self, info):
+        '''Format the result of a batched get, as `read` would'''
+        if info is None:
+            # the batched get failed, so retry on its own
+            return self.read()
+
+        timestamp = info.get('timestamp')
+        if timestamp is None:
+            timestamp = self.timestamp
+
+        return {self.name: {'value': info['value'],
+                            'timestamp': timestamp}}
 
 
 class EpicsSignalRO(EpicsSignalBase):
@@ -519,15 +1025,17 @@ class EpicsSignal(EpicsSignalBase):
                          auto_monitor=auto_monitor, name=name, **kwargs)
 
         if write_pv is not None:
-            self._write_pv = epics.PV(write_pv, form=pv_form,
-                                      auto_monitor=self._auto_monitor,
-                                      **self._pv_kw)
+            self._write_pv = self._cl.get_pv(
+                write_pv, form=pv_form, auto_monitor=self._auto_monitor,
+                connection_callback=self._pv_conn_changed, **self._pv_kw)
             self._write_pv.add_callback(self._write_changed,
                                         run_now=self._write_pv.connected)
         else:
             self._write_pv = self._read_pv
 
-    def subscribe(self, callback, event_type=None, run=True):
+        self._update_connection_state()
+
+    def subscribe(self, callback, event_type=None, run=True, **kwargs):
         if event_type is None:
             event_type = self._default_sub
 
@@ -546,7 +1054,15 @@ class EpicsSignal(EpicsSignalBase):
             self._write_pv.add_callback(self._write_changed,
                                         run_now=self._write_pv.connected)
 
-        return super().subscribe(callback, event_type=event_type, run=run)
+        return super().subscribe(callback, event_type=event_type, run=run,
+                                 **kwargs)
+
+    def _monitor_read_pv(self, *, wait=True):
+        shared = self._write_pv is self._read_pv
+        super()._monitor_read_pv(wait=wait)
+        if shared:
+            # the read PV was replaced; keep writing through the same one
+            self._write_pv = self._read_pv
 
     def wait_for_connection(self, timeout=1.0):
         super().wait_for_connection(timeout=1.0)
@@ -582,14 +1098,16 @@ class EpicsSignal(EpicsSignalBase):
     def connected(self):
         return self._read_pv.connected and self._write_pv.connected
 
+    def _connection_pvs(self):
+        return (self._read_pv, self._write_pv)
+
     @property
     @raise_if_disconnected
     def limits(self):
         '''The write PV limits'''
         # read_pv_limits = super().limits
-        pv = self._write_pv
-        pv.get_ctrlvars()
-        return (pv.lower_ctrl_limit, pv.upper_ctrl_limit)
+        ctrlvars = self._get_ctrlvars(self._write_pv)
+        return (ctrlvars['lower_ctrl_limit'], ctrlvars['upper_ctrl_limit'])
 
     def check_value(self, value):
         '''Check if the value is within the setpoint PV's control limits
@@ -639,6 +1157,24 @@ class EpicsSignal(EpicsSignalBase):
                            old_value=old_value, value=value,
                            timestamp=self._setpoint_ts, **kwargs)
 
+    def _timed_put(self, value, use_complete, kwargs):
+        '''Put to the write PV, recording metrics (see ophyd.metrics)'''
+        callback = kwargs.get('callback')
+        if use_complete and callback is not None:
+            kwargs = dict(kwargs)
+            kwargs['callback'] = metrics.timed_callback(
+                'ophyd_put_completion_seconds', callback, signal=self.name)
+
+        t0 = time.monotonic()
+        self._write_pv.put(value, use_complete=use_complete, **kwargs)
+        elapsed = time.monotonic() - t0
+
+        metrics.observe('ophyd_ca_put_seconds', elapsed, signal=self.name)
+        if use_complete and callback is None and kwargs.get('wait'):
+            # the put blocked until completion
+            metrics.observe('ophyd_put_completion_seconds', elapsed,
+                            signal=self.name)
+
     def put(self, value, force=False, **kwargs):
         '''Using channel access, set the write PV to `value`.
 
@@ -661,8 +1197,10 @@ class EpicsSignal(EpicsSignalBase):
 
         use_complete = kwargs.get('use_complete', self._put_complete)
 
-        self._write_pv.put(value, use_complete=use_complete,
-                           **kwargs)
+        if metrics.enabled:
+            self._timed_put(value, use_complete, kwargs)
+        else:
+            self._write_pv.put(value, use_complete=use_complete, **kwargs)
 
         old_value = self._setpoint
         self._setpoint = value
@@ -671,9 +1209,87 @@ class EpicsSignal(EpicsSignalBase):
             # readback and setpoint PV are one in the same, so update the
             # readback as well
             super().put(value, timestamp=time.time(), force=True)
+            # the put completion callback is for the PV, not the subscribers
+            sub_kwargs = {key: val for key, val in kwargs.items()
+                          if key not in ('callback', 'callback_data')}
             self._run_subs(sub_type=self.SUB_SETPOINT,
                            old_value=old_value, value=value,
-                           timestamp=self.timestamp, **kwargs)
+                           timestamp=self.timestamp, **sub_kwargs)
+
+    def set(self, value, *, tolerance=None, timeout=None, settle_time=None):
+        '''Set the value of the write PV, without waiting for completion
+
+        With put completion enabled (see `put_complete`), the returned status
+        completes when EPICS reports the put as complete. Otherwise, it
+        completes when the readback matches the value: as received by a
+        monitor event following the put, or already held from monitoring a
+        separate read PV. Where the read and write PVs are one and the same,
+        the local update of the readback by `put` does not count.
+
+        Parameters
+        ----------
+        value : any
+            Value to set
+        tolerance : float, optional
+            Allowed absolute difference between the readback and the value.
+            Defaults to requiring them to be equal (where an enum readback is
+            compared by its string as well).
+        timeout : float, optional
+            Maximum time to wait for the set to complete, after which the
+            status is marked as failed
+        settle_time : float, optional
+            Time to wait after completion before running status callbacks
+
+        Returns
+        -------
+        status : Status
+        '''
+        self.check_value(value)
+        if not self._put_complete:
+            matches = _value_matcher(value, self.enum_strs, atol=tolerance)
+
+        status = Status(self, timeout=timeout, settle_time=settle_time)
+
+        if self._put_complete:
+            self.put(value, force=True, callback=status._finished)
+            return status
+
+        # the thread in put(), which updates a shared read/write PV readback
+        # locally rather than from EPICS
+        putting = []
+
+        def check_readback(value=None, **kwargs):
+            if putting and putting[0] == threading.get_ident():
+                return
+
+            if not status.done and matches(value):
+                status._finished()
+
+        def clear_readback_sub(status):
+            try:
+                self.clear_sub(check_readback, event_type=self.SUB_VALUE)
+            except ValueError:
+                # already cleared from another thread
+                pass
+
+        # do not wait for the read PV to reconnect, should it not have been
+        # monitored yet: its first monitor event checks the readback
+        self._monitor_read_pv(wait=False)
+        self.subscribe(check_readback, event_type=self.SUB_VALUE, run=False)
+        # the subscription ends with the status, be it a success or a timeout
+        status.add_callback(clear_readback_sub)
+
+        putting.append(threading.get_ident())
+        try:
+            self.put(value, force=True)
+        finally:
+            putting.clear()
+
+        if (self._read_pv is not self._write_pv and
+                self._monitor_time is not None):
+            # the readback, as last received from EPICS, may already match
+            check_readback(self._readback)
+        return status
 
     @property
     def setpoint(self):
@@ -683,3 +1299,48 @@ class EpicsSignal(EpicsSignalBase):
     @setpoint.setter
     def setpoint(self, value):
         self.put(value)
+
+
+def bulk_set(values, *, timeout=None, settle_time=None, **kwargs):
+    '''Set many signals at once, returning a combined status
+
+    Every set is started before waiting on any of them, such that setting N
+    signals takes about as long as the slowest one rather than the sum.
+
+    Parameters
+    ----------
+    values : dict
+        Mapping of signal to the value to set it to
+    timeout : float, optional
+        Maximum time for each set to complete
+    settle_time : float, optional
+        Time to wait after all sets complete before running status callbacks
+    kwargs :
+        Passed on to each `Signal.set` (e.g., tolerance)
+
+    Returns
+    -------
+    status : AndStatus
+        Completes once all of the sets have, failing if any one of them fails
+    '''
+    statuses = [signal.set(value, timeout=timeout, **kwargs)
+                for signal, value in values.items()]
+    return AndStatus(*statuses, settle_time=settle_time)
+
+
+def _value_layout(value):
+    '''The (type, shape) of a value, which its description depends on'''
+    return type(value), getattr(value, 'shape', None)
+
+
+def _differs(a, b):
+    '''Control variable comparison, treating enum_strs sequences as equal
+    regardless of their container type'''
+    if isinstance(a, (list, tuple)) and isinstance(b, (list, tuple)):
+        return tuple(a) != tuple(b)
+
+    try:
+        return bool(a != b)
+    except ValueError:
+        # e.g., arrays
+        return True
@@ -0,0 +1,832 @@
+# vi: ts=4 sw=4 sts=4 expandtab
+'''
+:mod:`ophyd.sim` - In-process simulated control layer
+=====================================================
+
+.. module:: ophyd.sim
+   :synopsis: A simulated PV database standing in for EPICS Channel Access
+
+A drop-in replacement for the subset of the pyepics PV interface that ophyd
+uses. PVs are held in a `SimPVDatabase`, and can be connected to, read, written
+and monitored without an IOC. Round-trip latency and jitter are configurable,
+so device code can be benchmarked under realistic conditions:
+
+>>> import ophyd
+>>> from ophyd import sim
+>>> ophyd.set_cl('sim')
+>>> sim.database.latency = 0.001
+>>> sim.database.add_pv('XF:1{Mtr}.RBV', 1.5, units='mm', precision=3)
+>>> motor = ophyd.EpicsMotor('XF:1{Mtr}', name='motor')
+
+Callbacks (monitors, put completion and connection callbacks) are run from a
+single scheduler thread per database, mirroring the libca callback thread.
+'''
+
+import collections
+import heapq
+import itertools
+import logging
+import random
+import threading
+import time
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+__all__ = ['SimPVDatabase',
+           'SimRecord',
+           'SimPV',
+           'database',
+           'name',
+           'get_pv',
+           'get_property_pv',
+           'get_many',
+           'caget',
+           'caput',
+           'setup',
+           ]
+
+name = 'sim'
+
+# Channel access event masks, selecting which events a monitor receives
+DBE_VALUE = 1
+DBE_LOG = 2
+DBE_ALARM = 4
+DBE_PROPERTY = 8
+
+
+class _Scheduler(threading.Thread):
+    '''Runs delayed callbacks in order of their deadlines'''
+
+    def __init__(self):
+        super().__init__(name='sim_pv_scheduler', daemon=True)
+        self._queue = []
+        self._counter = itertools.count()
+        self._cond = threading.Condition()
+        self.start()
+
+    def schedule(self, delay, fcn, *args, **kwargs):
+        '''Call fcn(*args, **kwargs) from the scheduler thread after delay'''
+        deadline = time.monotonic() + delay
+        with self._cond:
+            heapq.heappush(self._queue, (deadline, next(self._counter), fcn,
+                                         args, kwargs))
+            self._cond.notify()
+
+    def run(self):
+        while True:
+            with self._cond:
+                while not self._queue:
+                    self._cond.wait()
+
+                deadline, _, fcn, args, kwargs = self._queue[0]
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    self._cond.wait(remaining)
+                    continue
+
+                heapq.heappop(self._queue)
+
+            try:
+                fcn(*args, **kwargs)
+            except Exception as ex:
+                logger.error('Simulated PV callback %s failed', fcn,
+                             exc_info=ex)
+
+
+class SimRecord:
+    '''A single simulated process variable, as held by a SimPVDatabase
+
+    Parameters
+    ----------
+    pvname : str
+        The PV name
+    value : any, optional
+        The initial value
+    timestamp : float, optional
+        The initial timestamp, defaults to the current time
+    units : str, optional
+        Engineering units
+    precision : int, optional
+        Display precision
+    lower_ctrl_limit : float, optional
+    upper_ctrl_limit : float, optional
+        Control limits
+    enum_strs : sequence of str, optional
+        Enum state strings, making this an enum record
+    put_delay : float, optional
+        Additional time, beyond the database latency, that it takes for a put
+        to complete (e.g., to simulate motion)
+    put_hook : callable, optional
+        Called as put_hook(record, value) on every client put; the return
+        value, if not None, is stored instead of the value. This can be used to
+        link records together.
+    '''
+
+    def __init__(self, pvname, value=0.0, *, timestamp=None, units='',
+                 precision=0, lower_ctrl_limit=0.0, upper_ctrl_limit=0.0,
+                 enum_strs=None, put_delay=0.0, put_hook=None):
+        if timestamp is None:
+            timestamp = time.time()
+
+        if enum_strs is not None:
+            enum_strs = tuple(enum_strs)
+
+        self.pvname = pvname
+        self.value = value
+        self.timestamp = timestamp
+        self.status = 0
+        self.severity = 0
+        self.units = units
+        self.precision = precision
+        self.lower_ctrl_limit = lower_ctrl_limit
+        self.upper_ctrl_limit = upper_ctrl_limit
+        self.enum_strs = enum_strs
+        self.put_delay = float(put_delay)
+        self.put_hook = put_hook
+        self.connected = True
+        self.lock = threading.RLock()
+
+        # connected client PVs
+        self._pvs = []
+        self._last_deadline = 0.0
+
+    # attributes which are properties (metadata), rather than value or alarm
+    PROPERTIES = ('units', 'precision', 'lower_ctrl_limit', 'upper_ctrl_limit',
+                  'enum_strs')
+
+    @property
+    def ctrlvars(self):
+        '''Control variables (metadata), in the pyepics dictionary form'''
+        return dict(units=self.units, precision=self.precision,
+                    lower_ctrl_limit=self.lower_ctrl_limit,
+                    upper_ctrl_limit=self.upper_ctrl_limit,
+                    enum_strs=self.enum_strs, status=self.status,
+                    severity=self.severity)
+
+    @property
+    def timevars(self):
+        '''Time variables, in the pyepics dictionary form'''
+        return dict(timestamp=self.timestamp, status=self.status,
+                    severity=self.severity)
+
+    def convert(self, value):
+        '''Convert a value from a client put to the native record type'''
+        if self.enum_strs is not None and isinstance(value, str):
+            try:
+                return self.enum_strs.index(value)
+            except ValueError:
+                raise ValueError('{!r} is not a valid state of {}: {}'
+                                 ''.format(value, self.pvname, self.enum_strs))
+
+        if (isinstance(self.value, np.ndarray) and
+                self.value.dtype == np.uint8 and isinstance(value, str)):
+            # char waveform
+            return np.frombuffer(value.encode('latin-1') + b'\0',
+                                 dtype=np.uint8).copy()
+
+        if isinstance(value, (list, tuple)):
+            return np.asarray(value)
+
+        return value
+
+    def __repr__(self):
+        return '<SimRecord {} value={!r}>'.format(self.pvname, self.value)
+
+
+class SimPVDatabase:
+    '''An in-process database of simulated process variables
+
+    Parameters
+    ----------
+    latency : float, optional
+        Round-trip time for gets, puts, and control/time variable requests,
+        in seconds
+    jitter : float, optional
+        Maximum random deviation added to each latency, in seconds
+    connection_latency : float, optional
+        Time to connect a new PV, defaults to `latency`
+    auto_create : bool, optional
+        Create unknown PVs on first use (with `default_value`). If False,
+        unknown PVs never connect, as if their IOC were not running.
+    default_value : any, optional
+        The value of automatically created PVs
+
+    Attributes
+    ----------
+    counts : collections.Counter
+        Number of client requests made, by type ('get', 'put', 'ctrlvars',
+        'timevars'). Monitor events are not counted.
+    '''
+
+    def __init__(self, *, latency=0.0, jitter=0.0, connection_latency=None,
+                 auto_create=True, default_value=0.0):
+        self.latency = latency
+        self.jitter = jitter
+        self.connection_latency = connection_latency
+        self.auto_create = auto_create
+        self.default_value = default_value
+        self.counts = collections.Counter()
+
+        self._records = {}
+        self._lock = threading.RLock()
+        self._scheduler = None
+
+    @property
+    def scheduler(self):
+        '''The thread running callbacks for this database'''
+        with self._lock:
+            if self._scheduler is None:
+                self._scheduler = _Scheduler()
+            return self._scheduler
+
+    def delay(self, latency=None):
+        '''A single round-trip delay, including jitter'''
+        if latency is None:
+            latency = self.latency
+
+        if self.jitter:
+            latency += random.uniform(-self.jitter, self.jitter)
+
+        return max(latency, 0.0)
+
+    def add_pv(self, pvname, value=None, **kwargs):
+        '''Add (or replace) a PV in the database
+
+        Keyword arguments are passed on to SimRecord.
+
+        Returns
+        -------
+        record : SimRecord
+        '''
+        if value is None:
+            value = self.default_value
+
+        record = SimRecord(pvname, value, **kwargs)
+        with self._lock:
+            self._records[pvname] = record
+        return record
+
+    def find(self, pvname):
+        '''Find a record, creating it if auto_create is set
+
+        Returns
+        -------
+        record : SimRecord or None
+        '''
+        with self._lock:
+            try:
+                return self._records[pvname]
+            except KeyError:
+                if not self.auto_create:
+                    return None
+                return self.add_pv(pvname)
+
+    def __getitem__(self, pvname):
+        with self._lock:
+            return self._records[pvname]
+
+    def __contains__(self, pvname):
+        with self._lock:
+            return pvname in self._records
+
+    def clear(self):
+        '''Remove all records and reset the request counts'''
+        with self._lock:
+            self._records.clear()
+            self.counts.clear()
+
+    def _notify(self, record, mask, **changes):
+        '''Schedule monitor events for all PVs monitoring record
+
+        Only PVs whose monitor mask includes one of the event types in
+        `mask` (DBE_VALUE, DBE_ALARM, DBE_PROPERTY) receive the event.
+        '''
+        with record.lock:
+            # keep per-record ordering even with jitter
+            deadline = max(time.monotonic() + self.delay(),
+                           record._last_deadline)
+            record._last_deadline = deadline
+            delay = deadline - time.monotonic()
+            monitors = [pv for pv in record._pvs if pv._monitor_mask & mask]
+
+        for pv in monitors:
+            self.scheduler.schedule(delay, pv._monitor_event, changes)
+
+    def update(self, pvname, value=None, *, timestamp=None, **metadata):
+        '''Update a PV from the 'server' side, as the IOC would
+
+        Value monitors are run for all connected, monitoring PVs, and
+        property monitors (see `get_property_pv`) if any of the metadata
+        changed, as an IOC would post DBE_VALUE and DBE_PROPERTY events.
+
+        Parameters
+        ----------
+        pvname : str
+            The PV name
+        value : any, optional
+            The new value (None leaves the value as-is)
+        timestamp : float, optional
+            The new timestamp, defaults to the current time
+        metadata :
+            Attributes of the SimRecord to update (units, precision,
+            lower_ctrl_limit, upper_ctrl_limit, enum_strs, status, severity)
+        '''
+        record = self[pvname]
+        if timestamp is None:
+            timestamp = time.time()
+
+        with record.lock:
+            properties = {key: getattr(record, key)
+                          for key in record.PROPERTIES}
+            if value is not None:
+                record.value = record.convert(value)
+            record.timestamp = timestamp
+            for key, meta_value in metadata.items():
+                if not hasattr(record, key):
+                    raise ValueError('Unknown record attribute: {}'
+                                     ''.format(key))
+                if key == 'enum_strs' and meta_value is not None:
+                    meta_value = tuple(meta_value)
+                setattr(record, key, meta_value)
+
+            changes = dict(value=record.value, timestamp=timestamp)
+            changes.update(record.ctrlvars)
+            mask = DBE_VALUE | DBE_ALARM
+            if any(getattr(record, key) != properties[key]
+                   for key in record.PROPERTIES):
+                mask |= DBE_PROPERTY
+
+        self._notify(record, mask, **changes)
+
+    def set_connected(self, pvname, connected):
+        '''Simulate an IOC going offline or coming back'''
+        record = self[pvname]
+        with record.lock:
+            record.connected = bool(connected)
+            pvs = list(record._pvs)
+
+        for pv in pvs:
+            self.scheduler.schedule(self.delay(self.connection_latency),
+                                    pv._connection_changed, record.connected)
+
+    def get_pv(self, pvname, **kwargs):
+        '''Create a SimPV bound to this database
+
+        Keyword arguments are passed on to SimPV
+        '''
+        return SimPV(pvname, database=self, **kwargs)
+
+
+class SimPV:
+    '''A simulated PV, mimicking the interface of epics.PV
+
+    Parameters
+    ----------
+    pvname : str
+        The PV name
+    callback : callable or list of callables, optional
+        Monitor callbacks to add
+    form : {'native', 'time', 'ctrl'}, optional
+        Kept for compatibility with epics.PV
+    auto_monitor : bool or int, optional
+        Monitor the PV for changes. Defaults (None) to True, as pyepics would
+        for scalars. True monitors value and alarm changes; an integer is the
+        event mask (of DBE_VALUE, DBE_ALARM, DBE_PROPERTY) to monitor.
+    connection_callback : callable, optional
+        Called as connection_callback(pvname=, conn=, pv=) on connection state
+        changes
+    database : SimPVDatabase, optional
+        Defaults to the module-level `database`
+    '''
+
+    def __init__(self, pvname, callback=None, form='time', verbose=False,
+                 auto_monitor=None, count=None, connection_callback=None,
+                 connection_timeout=None, database=None, **kwargs):
+        if database is None:
+            database = _module_database()
+
+        if auto_monitor is None:
+            auto_monitor = True
+
+        if auto_monitor is True:
+            self._monitor_mask = DBE_VALUE | DBE_ALARM
+        else:
+            self._monitor_mask = int(auto_monitor)
+
+        self.pvname = pvname
+        self.form = form
+        self.auto_monitor = auto_monitor
+        self.connected = False
+        self.put_complete = False
+        self.callbacks = {}
+        self.connection_callbacks = []
+        self._database = database
+        self._record = None
+        self._count = count
+        self._args = dict(pvname=pvname, value=None, timestamp=None,
+                          status=None, severity=None)
+        self._ctrlvars = None
+        self._conn_event = threading.Event()
+
+        if connection_callback is not None:
+            self.connection_callbacks.append(connection_callback)
+
+        if callable(callback):
+            self.add_callback(callback)
+        elif callback is not None:
+            for cb in callback:
+                self.add_callback(cb)
+
+        record = database.find(pvname)
+        if record is not None:
+            database.scheduler.schedule(
+                database.delay(database.connection_latency), self._connect,
+                record)
+
+    def _connect(self, record):
+        '''Connection established (from the scheduler thread)'''
+        with record.lock:
+            self._record = record
+            self._update_args(record.value, record.timestamp)
+            if self.form == 'ctrl':
+                # ctrl-form PVs receive the control variables with the value
+                self._ctrlvars = record.ctrlvars
+            record._pvs.append(self)
+
+        self._connection_changed(record.connected)
+
+    def _connection_changed(self, connected):
+        self.connected = connected
+        if connected:
+            self._conn_event.set()
+        else:
+            self._conn_event.clear()
+
+        for cb in list(self.connection_callbacks):
+            try:
+                cb(pvname=self.pvname, conn=connected, pv=self)
+            except Exception as ex:
+                logger.error('Connection callback for %s failed',
+                             self.pvname, exc_info=ex)
+
+        if connected and self.auto_monitor:
+            # an initial monitor event is sent on subscription
+            self.run_callbacks()
+
+    def _update_args(self, value, timestamp, **kwargs):
+        if isinstance(value, np.ndarray):
+            value = value.copy()
+        self._args['value'] = value
+        self._args['timestamp'] = timestamp
+        self._args.update(kwargs)
+
+    def _monitor_event(self, changes):
+        '''Monitor event received (from the scheduler thread)'''
+        if not self.connected:
+            return
+
+        changes = dict(changes)
+        self._update_args(changes.pop('value'), changes.pop('timestamp'),
+                          status=changes['status'],
+                          severity=changes['severity'])
+        if self.form == 'ctrl':
+            self._ctrlvars = changes
+        # otherwise, as with pyepics, callbacks keep receiving the control
+        # variables of the last get_ctrlvars()
+        self.run_callbacks()
+
+    def _round_trip(self, request):
+        '''Simulate the latency of a request to the IOC'''
+        self._database.counts[request] += 1
+        delay = self._database.delay()
+        if delay > 0:
+            time.sleep(delay)
+
+    def wait_for_connection(self, timeout=None):
+        '''Wait for the PV to connect, returning the connection state'''
+        if timeout is None:
+            timeout = 5.0
+        return self._conn_event.wait(timeout)
+
+    def disconnect(self):
+        '''Disconnect the PV, clearing all callbacks'''
+        record = self._record
+        if record is not None:
+            with record.lock:
+                if self in record._pvs:
+                    record._pvs.remove(self)
+
+        self.connected = False
+        self._conn_event.clear()
+        self.clear_callbacks()
+
+    def _as_string(self, value):
+        enum_strs = self.enum_strs
+        if enum_strs and not isinstance(value, str):
+            try:
+                return enum_strs[int(value)]
+            except (IndexError, TypeError, ValueError):
+                pass
+        elif isinstance(value, np.ndarray) and value.dtype == np.uint8:
+            return value.tobytes().split(b'\0', 1)[0].decode('latin-1')
+
+        return str(value)
+
+    def _fetch(self):
+        '''Update the value and time variables from the record'''
+        record = self._record
+        with record.lock:
+            self._update_args(record.value, record.timestamp,
+                              status=record.status, severity=record.severity)
+
+    def get(self, count=None, as_string=False, as_numpy=True, timeout=None,
+            with_ctrlvars=False, use_monitor=True):
+        '''Get the value, from the last monitor event if available'''
+        if not self.wait_for_connection(timeout=timeout):
+            return None
+
+        if not (self._monitor_mask & DBE_VALUE and use_monitor):
+            self._round_trip('get')
+            self._fetch()
+
+        if with_ctrlvars:
+            self.get_ctrlvars()
+
+        return self._format_value(count=count, as_string=as_string,
+                                  as_numpy=as_numpy)
+
+    def _format_value(self, count=None, as_string=False, as_numpy=True):
+        '''The current value, formatted as requested from get()'''
+        value = self._args['value']
+        if count is None:
+            count = self._count
+
+        if count is not None and isinstance(value, np.ndarray):
+            value = value[:count]
+
+        if as_string:
+            return self._as_string(value)
+
+        if not as_numpy and isinstance(value, np.ndarray):
+            return value.tolist()
+
+        return value
+
+    def put(self, value, wait=False, timeout=30.0, use_complete=False,
+            callback=None, callback_data=None):
+        '''Put a value, optionally waiting for or being notified of completion
+        '''
+        if not self.wait_for_connection():
+            return None
+
+        database = self._database
+        database.counts['put'] += 1
+        record = self._record
+        with record.lock:
+            value = record.convert(value)
+            if record.put_hook is not None:
+                hooked = record.put_hook(record, value)
+                if hooked is not None:
+                    value = hooked
+
+            record.value = value
+            record.timestamp = time.time()
+            changes = dict(value=record.value, timestamp=record.timestamp)
+            changes.update(record.ctrlvars)
+            completion_delay = database.delay() + record.put_delay
+
+        database._notify(record, DBE_VALUE | DBE_ALARM, **changes)
+
+        if not (wait or use_complete or callback is not None):
+            return 1
+
+        done = threading.Event()
+        self.put_complete = False
+
+        def put_done():
+            self.put_complete = True
+            done.set()
+            if callback is not None:
+                callback(pvname=self.pvname, data=callback_data)
+
+        database.scheduler.schedule(completion_delay, put_done)
+
+        if wait:
+            if not done.wait(timeout):
+                return -1
+
+        return 1
+
+    def get_ctrlvars(self, timeout=5, warn=True):
+        '''Fetch the control variables from the IOC'''
+        if not self.wait_for_connection(timeout=timeout):
+            return None
+
+        self._round_trip('ctrlvars')
+        with self._record.lock:
+            self._ctrlvars = self._record.ctrlvars
+        return dict(self._ctrlvars)
+
+    def get_timevars(self, timeout=5, warn=True):
+        '''Fetch the timestamp, status and severity from the IOC'''
+        if not self.wait_for_connection(timeout=timeout):
+            return None
+
+        self._round_trip('timevars')
+        with self._record.lock:
+            timevars = self._record.timevars
+        self._args.update(timevars)
+        return timevars
+
+    def _get_ctrl(self, key):
+        if self._ctrlvars is None:
+            self.get_ctrlvars()
+        if self._ctrlvars is None:
+            return None
+        return self._ctrlvars[key]
+
+    @property
+    def precision(self):
+        return self._get_ctrl('precision')
+
+    @property
+    def units(self):
+        return self._get_ctrl('units')
+
+    @property
+    def enum_strs(self):
+        return self._get_ctrl('enum_strs')
+
+    @property
+    def lower_ctrl_limit(self):
+        return self._get_ctrl('lower_ctrl_limit')
+
+    @property
+    def upper_ctrl_limit(self):
+        return self._get_ctrl('upper_ctrl_limit')
+
+    @property
+    def timestamp(self):
+        return self._args['timestamp']
+
+    @property
+    def status(self):
+        return self._args['status']
+
+    @property
+    def severity(self):
+        return self._args['severity']
+
+    @property
+    def value(self):
+        return self.get()
+
+    @property
+    def char_value(self):
+        return self._as_string(self.get())
+
+    @property
+    def count(self):
+        value = self._args['value']
+        if isinstance(value, np.ndarray):
+            return len(value)
+        return 1
+
+    def add_callback(self, callback=None, index=None, run_now=False,
+                     with_ctrlvars=True, **kw):
+        '''Add a monitor callback, returning its index'''
+        if not callable(callback):
+            return None
+
+        if index is None:
+            index = 1 + max(self.callbacks.keys(), default=0)
+
+        self.callbacks[index] = (callback, kw)
+        if run_now and self.connected:
+            self.run_callback(index)
+        return index
+
+    def remove_callback(self, index=None):
+        '''Remove a monitor callback by index'''
+        self.callbacks.pop(index, None)
+
+    def clear_callbacks(self):
+        '''Remove all monitor callbacks'''
+        self.callbacks = {}
+
+    def run_callbacks(self):
+        '''Run all monitor callbacks with the current value'''
+        for index in sorted(self.callbacks):
+            self.run_callback(index)
+
+    def run_callback(self, index):
+        '''Run a single monitor callback with the current value'''
+        try:
+            fcn, kwargs = self.callbacks[index]
+        except KeyError:
+            return
+
+        kwd = dict(self._args)
+        if self._ctrlvars is not None:
+            kwd.update(self._ctrlvars)
+        kwd['char_value'] = self._as_string(kwd['value'])
+        kwd['count'] = self.count
+        kwd.update(kwargs)
+        kwd['cb_info'] = (index, self)
+        fcn(**kwd)
+
+    def __repr__(self):
+        return '<SimPV {!r} connected={}>'.format(self.pvname, self.connected)
+
+
+database = SimPVDatabase()
+
+
+def _module_database():
+    '''The module-level database, used by default'''
+    return database
+
+
+def get_pv(pvname, **kwargs):
+    '''Create a SimPV on the module-level database'''
+    return database.get_pv(pvname, **kwargs)
+
+
+def get_property_pv(pvname, callback, **kwargs):
+    '''Create a SimPV monitoring only property (metadata) changes
+
+    See the pyepics control layer's get_property_pv.
+    '''
+    return get_pv(pvname, form='ctrl', auto_monitor=DBE_PROPERTY,
+                  callback=callback, **kwargs)
+
+
+def caget(pvname, as_string=False, timeout=5.0, **kwargs):
+    '''Get a value from the simulated database, as epics.caget would'''
+    pv = get_pv(pvname, auto_monitor=False)
+    try:
+        return pv.get(as_string=as_string, timeout=timeout, **kwargs)
+    finally:
+        pv.disconnect()
+
+
+def caput(pvname, value, wait=False, timeout=60, **kwargs):
+    '''Put a value to the simulated database, as epics.caput would'''
+    pv = get_pv(pvname, auto_monitor=False)
+    try:
+        if not pv.wait_for_connection(timeout=timeout):
+            return None
+        return pv.put(value, wait=wait, timeout=timeout, **kwargs)
+    finally:
+        pv.disconnect()
+
+
+def get_many(pvs, *, timeout=None):
+    '''Get the values of many PVs, waiting only once for all of them
+
+    Simulates non-blocking channel access gets: the latency is only paid
+    once, though each PV counts as a 'get' request.
+
+    Parameters
+    ----------
+    pvs : sequence of SimPV
+        Connected PVs
+    timeout : float, optional
+        Unused, for compatibility with the pyepics control layer
+
+    Returns
+    -------
+    results : list
+        A dictionary of value and timestamp per PV, or None for any PV which
+        is not connected
+    '''
+    delay = 0.0
+    for pv in pvs:
+        pv._database.counts['get'] += 1
+        delay = max(delay, pv._database.delay())
+
+    if delay > 0:
+        time.sleep(delay)
+
+    results = []
+    for pv in pvs:
+        if not pv.connected:
+            results.append(None)
+            continue
+
+        pv._fetch()
+        results.append(dict(value=pv._format_value(),
+                            timestamp=pv.timestamp))
+    return results
+
+
+def setup(num_workers=1, **kwargs):
+    '''Setup the simulated control layer
+
+    Nothing is required for the simulated control layer; callbacks are
+    already run from a dedicated thread. The arguments are accepted for
+    compatibility with the pyepics control layer.
+    '''
+    pass
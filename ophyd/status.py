@@ -1,11 +1,14 @@
 import time
-from threading import RLock
-from functools import wraps
+from threading import (RLock, Event)
+from functools import (wraps, partial)
 
 import logging
-import threading
 import numpy as np
 
+from . import tracing
+from .utils.futures import (create_future, get_loop, resolve_threadsafe)
+from .utils.timers import (get_timer_thread, get_worker_pool)
+
 logger = logging.getLogger(__name__)
 
 # This is used below by StatusBase.
@@ -19,10 +22,50 @@ def _locked(func):
     return f
 
 
+def _get_status_timer():
+    '''The thread handling the timeouts and settle times of all statuses'''
+    return get_timer_thread('ophyd_status_timer')
+
+
+# worker threads running failure handling and callbacks of statuses which time
+# out or settle
+STATUS_CALLBACK_WORKERS = 4
+
+
+def _call_off_timer(fcn, *args):
+    '''Status timer callback: hand fcn(*args) off to the status callback
+    workers, such that slow failure handling or callbacks do not delay the
+    timeouts and settle times of other statuses'''
+    get_worker_pool('ophyd_status_callbacks',
+                    STATUS_CALLBACK_WORKERS).submit(fcn, *args)
+
+
+def _resolve_future(loop, future, status):
+    '''Status callback: resolve an asyncio future (see StatusBase.as_future)'''
+    if status.success is not None and not status.success:
+        resolve_threadsafe(loop, future, exception=RuntimeError(
+            'Operation completed but reported an error'))
+    else:
+        resolve_threadsafe(loop, future, status)
+
+
 class StatusBase:
     """
     This is a base class that provides a single-slot
-    call back for finished.
+    call back for finished, along with any number of callbacks added through
+    `add_callback`.
+
+    Completion is signaled through an event, such that blocking waits return
+    as soon as the status is done. Timeouts and settle times are handled by a
+    single timer thread shared by all status objects, rather than by threads
+    of their own. Failure handling and callbacks of statuses which time out
+    or settle run on a small shared pool of worker threads
+    (STATUS_CALLBACK_WORKERS). A callback which blocks holds up one worker,
+    so callbacks should not block for long, nor wait on more than a few other
+    statuses.
+
+    Statuses may be combined with ``&`` and ``|`` (see `AndStatus` and
+    `OrStatus`).
 
     Parameters
     ----------
@@ -37,6 +80,12 @@ class StatusBase:
         super().__init__()
         self._lock = RLock()
         self._cb = None
+        self._callbacks = []
+        self._event = Event()
+        self._finishing = False
+        self._timeout_timer = None
+        # creation time, when tracing (see ophyd.tracing)
+        self._trace_start = tracing.now() if tracing.enabled else None
         self.done = False
         self.success = False
         self.timeout = None
@@ -50,25 +99,35 @@ class StatusBase:
             self.timeout = float(timeout)
 
         if self.timeout is not None and self.timeout > 0.0:
-            thread = threading.Thread(target=self._timeout_thread, daemon=True)
-            self._timeout_thread = thread
-            self._timeout_thread.start()
+            self._timeout_timer = _get_status_timer().call_later(
+                self.timeout + self.settle_time, _call_off_timer,
+                self._timed_out)
+
+    def _timed_out(self):
+        '''Handle timeout (status callback worker)'''
+        with self._lock:
+            if self._finishing or self.done:
+                return
+            self._finishing = True
+            self._timeout_timer = None
 
-    def _timeout_thread(self):
-        '''Handle timeout'''
+        logger.debug('Status object %s timed out', str(self))
         try:
-            wait(self, timeout=self.timeout + self.settle_time,
-                 poll_rate=max(1.0, self.timeout / 10.0))
-        except TimeoutError:
-            logger.debug('Status object %s timed out', str(self))
-            try:
-                self._handle_failure()
-            finally:
-                self._finished(success=False)
-        except RuntimeError:
-            pass
+            self._handle_failure()
         finally:
-            self._timeout_thread = None
+            self._settle(success=False)
+
+    @property
+    def done(self):
+        '''Whether or not the operation has completed'''
+        return self._event.is_set()
+
+    @done.setter
+    def done(self, done):
+        if done:
+            self._event.set()
+        else:
+            self._event.clear()
 
     def _handle_failure(self):
         pass
@@ -78,29 +137,47 @@ class StatusBase:
         pass
 
     def _settle_then_run_callbacks(self, success=True):
-        # wait until the settling time is done to mark completion
-        if self.settle_time > 0.0:
-            time.sleep(self.settle_time)
-
+        # called once the settling time is done, to mark completion
         with self._lock:
             self.success = success
-            self.done = True
             self._settled()
+            # only once settled, as waiters are woken up right away
+            self.done = True
 
             if self._cb is not None:
                 self._cb()
                 self._cb = None
 
+            callbacks, self._callbacks = self._callbacks, []
+
+        if self._trace_start is not None and tracing.enabled:
+            tracing.add_async_span(self._trace_name(), self._trace_start,
+                                   tracing.now(), id=id(self), cat='status',
+                                   args={'success': success})
+
+        for callback in callbacks:
+            self._run_callback(callback)
+
     def _finished(self, success=True, **kwargs):
         # args/kwargs are not really used, but are passed - because pyepics
         # gives in a bunch of kwargs that we don't care about
+        with self._lock:
+            if self._finishing or self.done:
+                # already finished (or timed out); the outcome stands
+                return
+            self._finishing = True
+            if self._timeout_timer is not None:
+                self._timeout_timer.cancel()
+                self._timeout_timer = None
+
+        self._settle(success=success)
+
+    def _settle(self, success):
         if success and self.settle_time > 0:
             # delay gratification until the settle time is up
-            self._settle_thread = threading.Thread(
-                    target=self._settle_then_run_callbacks, daemon=True,
-                    kwargs=dict(success=success),
-                    )
-            self._settle_thread.start()
+            _get_status_timer().call_later(self.settle_time, _call_off_timer,
+                                           self._settle_then_run_callbacks,
+                                           success)
         else:
             self._settle_then_run_callbacks(success=success)
 
@@ -123,6 +200,84 @@ class StatusBase:
         else:
             self._cb = cb
 
+    def add_callback(self, callback):
+        '''Add a callback to be run when the status completes
+
+        Unlike `finished_cb`, any number of callbacks may be added. Each is
+        called with the status as its only argument -- right away, should the
+        status already be done.
+        '''
+        with self._lock:
+            if not self.done:
+                self._callbacks.append(callback)
+                return
+
+        self._run_callback(callback)
+
+    def _run_callback(self, callback):
+        try:
+            callback(self)
+        except Exception as ex:
+            logger.error('Status callback %s failed', callback, exc_info=ex)
+
+    def wait(self, timeout=None):
+        '''(Blocking) wait for the status to complete (see `wait`)'''
+        wait(self, timeout=timeout)
+
+    def wait_done(self, timeout=None):
+        '''(Blocking) wait for the status to be done, successfully or not
+
+        Unlike `wait`, this does not raise on failure or timeout.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Amount of time in seconds to wait, None to wait indefinitely
+
+        Returns
+        -------
+        done : bool
+            Whether or not the status is done
+        '''
+        return self._event.wait(timeout)
+
+    def as_future(self, *, loop=None):
+        '''An asyncio future resolved when the status completes
+
+        This does not take the single finished_cb slot, nor does it require a
+        thread to wait.
+
+        Parameters
+        ----------
+        loop : asyncio.AbstractEventLoop, optional
+            The event loop the future belongs to, defaulting to the current
+            one
+
+        Returns
+        -------
+        future : asyncio.Future
+            Resolved with the status itself. Should the status fail, a
+            RuntimeError is set instead, as with `wait`.
+        '''
+        loop = get_loop(loop)
+        future = create_future(loop)
+        self.add_callback(partial(_resolve_future, loop, future))
+        return future
+
+    def __await__(self):
+        '''Wait for the status to complete from an asyncio coroutine'''
+        return (yield from self.as_future())
+
+    def _trace_name(self):
+        '''The name of the status in traces (see ophyd.tracing)'''
+        return self.__class__.__name__
+
+    def __and__(self, other):
+        return AndStatus(self, other)
+
+    def __or__(self, other):
+        return OrStatus(self, other)
+
     def __str__(self):
         return ('{0}(done={1.done}, '
                 'success={1.success})'
@@ -132,6 +287,127 @@ class StatusBase:
     __repr__ = __str__
 
 
+class Status(StatusBase):
+    '''Generic status, for an operation on an object which may not be stopped
+
+    Parameters
+    ----------
+    obj : any, optional
+        The object the operation is acting on
+    '''
+    def __init__(self, obj=None, **kwargs):
+        self.obj = obj
+        super().__init__(**kwargs)
+
+    def _trace_name(self):
+        return '{}({})'.format(self.__class__.__name__,
+                               getattr(self.obj, 'name', self.obj))
+
+    def __str__(self):
+        name = getattr(self.obj, 'name', self.obj)
+        return ('{0}(obj={1}, done={2.done}, success={2.success})'
+                ''.format(self.__class__.__name__, name, self)
+                )
+
+    __repr__ = __str__
+
+
+class _CombinedStatus(StatusBase):
+    '''Base for statuses combining others; see AndStatus and OrStatus'''
+    def __init__(self, *statuses, **kwargs):
+        super().__init__(**kwargs)
+        self.statuses = statuses
+        # statuses not yet done, or None once the outcome is decided
+        self._pending = set(statuses)
+
+        if not statuses:
+            self._pending = None
+            self._finished(success=self._empty_success)
+
+        for status in statuses:
+            status.add_callback(self._status_finished)
+
+    def _decides(self, status):
+        '''Whether the completion of status decides the combined outcome'''
+        raise NotImplementedError()
+
+    def _status_finished(self, status):
+        with self._lock:
+            if self._pending is None or self._finishing:
+                return
+
+            self._pending.discard(status)
+            if not self._decides(status):
+                return
+
+            self._pending = None
+
+        self._finished(success=self._success())
+
+    def _success(self):
+        '''The combined success, once the outcome is decided'''
+        raise NotImplementedError()
+
+    def __str__(self):
+        return ('{0}(statuses={1.statuses}, done={1.done}, '
+                'success={1.success})'
+                ''.format(self.__class__.__name__, self)
+                )
+
+    __repr__ = __str__
+
+
+class AndStatus(_CombinedStatus):
+    '''A status which completes once all of the given statuses have
+
+    It fails as soon as any one of them fails, unless fail_fast is False. With
+    no statuses, it is done (successfully) right away.
+
+    Parameters
+    ----------
+    statuses : StatusBase
+        The statuses to combine
+    fail_fast : bool, optional
+        Fail as soon as any one status fails (the default), or only once all
+        of them are done
+    kwargs :
+        Passed on to StatusBase (e.g., timeout, settle_time)
+    '''
+    _empty_success = True
+
+    def __init__(self, *statuses, fail_fast=True, **kwargs):
+        self.fail_fast = fail_fast
+        super().__init__(*statuses, **kwargs)
+
+    def _decides(self, status):
+        return (self.fail_fast and not status.success) or not self._pending
+
+    def _success(self):
+        return all(status.success for status in self.statuses)
+
+
+class OrStatus(_CombinedStatus):
+    '''A status which completes once any of the given statuses has
+
+    It fails only once all of them have failed. With no statuses, it fails
+    right away.
+
+    Parameters
+    ----------
+    statuses : StatusBase
+        The statuses to combine
+    kwargs :
+        Passed on to StatusBase (e.g., timeout, settle_time)
+    '''
+    _empty_success = False
+
+    def _decides(self, status):
+        return status.success or not self._pending
+
+    def _success(self):
+        return any(status.success for status in self.statuses)
+
+
 class DeviceStatus(StatusBase):
     '''Device status'''
     def __init__(self, device, **kwargs):
@@ -143,6 +419,9 @@ class DeviceStatus(StatusBase):
         logger.debug('Trying to stop %s', str(self.device))
         self.device.stop()
 
+    def _trace_name(self):
+        return '{}({})'.format(self.__class__.__name__, self.device.name)
+
     def __str__(self):
         return ('{0}(device={1.device.name}, done={1.done}, '
                 'success={1.success})'
@@ -243,10 +522,12 @@ class MoveStatus(DeviceStatus):
     __repr__ = __str__
 
 
-
-def wait(status, timeout=None, *, poll_rate=0.05):
+def wait(status, timeout=None, *, poll_rate=None):
     '''(Blocking) wait for the status object to complete
 
+    Statuses providing `StatusBase.wait_done` are waited on until done,
+    rather than polled; others are polled for `done`.
+
     Parameters
     ----------
     timeout : float, optional
@@ -254,7 +535,7 @@ def wait(status, timeout=None, *, poll_rate=0.05):
         only return when either the status completes or if interrupted by the
         user.
     poll_rate : float, optional
-        Polling rate used to check the status
+        Polling rate used to check statuses without `wait_done`
 
     Raises
     ------
@@ -265,16 +546,46 @@ def wait(status, timeout=None, *, poll_rate=0.05):
     '''
     t0 = time.time()
 
-    def time_exceeded():
-        return timeout is not None and (time.time() - t0) > timeout
-
-    while not status.done and not time_exceeded():
-        time.sleep(poll_rate)
+    wait_done = getattr(status, 'wait_done', None)
+    if wait_done is None:
+        wait_done = partial(_poll_done, status, poll_rate=poll_rate)
 
-    if status.done:
-        if status.success is not None and not status.success:
-            raise RuntimeError('Operation completed but reported an error')
-    elif time_exceeded():
+    if not wait_done(timeout):
         elapsed = time.time() - t0
         raise TimeoutError('Operation failed to complete within {} seconds'
                            '(elapsed {} sec)'.format(timeout, elapsed))
+
+    if status.success is not None and not status.success:
+        raise RuntimeError('Operation completed but reported an error')
+
+
+def _poll_done(status, timeout, *, poll_rate=None):
+    '''Poll status.done until it is set or the timeout expires'''
+    if poll_rate is None:
+        poll_rate = 0.05
+
+    t0 = time.time()
+    while not status.done:
+        if timeout is not None and (time.time() - t0) > timeout:
+            return False
+        time.sleep(poll_rate)
+    return True
+
+
+def wait_all(statuses, timeout=None):
+    '''(Blocking) wait for all of the status objects to complete
+
+    Parameters
+    ----------
+    statuses : iterable of StatusBase
+    timeout : float, optional
+        Overall amount of time in seconds to wait (see `wait`)
+
+    Raises
+    ------
+    TimeoutError
+        If time waited exceeds specified timeout
+    RuntimeError
+        As soon as any one of the statuses fails
+    '''
+    wait(AndStatus(*statuses), timeout=timeout)
@@ -0,0 +1,182 @@
+'''
+:mod:`ophyd.tracing` - Device operation timelines
+=================================================
+
+.. module:: ophyd.tracing
+   :synopsis: Records spans of device operations and status lifetimes, for
+              viewing as a Chrome/Perfetto trace
+
+Tracing is disabled by default, in which case instrumented code only checks
+the module-level `enabled` flag. Once enabled (see `enable`), the following
+are recorded in a bounded in-memory buffer:
+
+* ``stage``, ``unstage``, ``trigger``, ``read``, ``describe`` and ``move``
+  calls, as spans on the calling thread named ``<device>.<operation>``.
+  Sub-devices read through their parent (see `Device.read`) have their
+  gets batched with the parent's, so their spans cover the whole batch.
+* status objects, from creation to completion, as asynchronous spans
+
+The buffer may be written in the Chrome trace-event format with `dump`, and
+opened in ``chrome://tracing`` or https://ui.perfetto.dev to see how
+operations of different devices overlap, and where they serialize.
+
+Example::
+
+    from ophyd import tracing
+
+    tracing.enable()
+    ...  # run one point of a scan
+    tracing.dump('/tmp/scan_point.json')
+'''
+
+import collections
+import json
+import os
+import threading
+import time
+
+__all__ = ['enabled', 'enable', 'disable', 'clear', 'now', 'add_span',
+           'add_async_span', 'get_events', 'to_chrome', 'dump']
+
+#: Whether events are recorded; see `enable` and `disable`
+enabled = False
+
+#: The default number of events kept, the oldest being discarded first
+DEFAULT_MAX_EVENTS = 100000
+
+# (phase, name, category, start, end, thread id, async id, args)
+_events = collections.deque(maxlen=DEFAULT_MAX_EVENTS)
+# thread id -> thread name
+_thread_names = {}
+
+
+def enable(max_events=None):
+    '''Start recording events
+
+    Parameters
+    ----------
+    max_events : int, optional
+        The size of the event buffer. Changing it discards recorded events.
+    '''
+    global enabled, _events
+    if max_events is not None and max_events != _events.maxlen:
+        _events = collections.deque(maxlen=int(max_events))
+    enabled = True
+
+
+def disable():
+    '''Stop recording events (already recorded ones are kept)'''
+    global enabled
+    enabled = False
+
+
+def clear():
+    '''Discard all recorded events'''
+    _events.clear()
+    _thread_names.clear()
+
+
+def now():
+    '''The current time, as used for event timestamps (seconds)'''
+    return time.perf_counter()
+
+
+def _current_thread():
+    thread = threading.current_thread()
+    _thread_names[thread.ident] = thread.name
+    return thread.ident
+
+
+def add_span(name, start, end, *, cat='ophyd', args=None):
+    '''Record a span on the current thread
+
+    Parameters
+    ----------
+    name : str
+        The span name
+    start : float
+        The start time, see `now`
+    end : float
+        The end time, see `now`
+    cat : str, optional
+        The event category
+    args : dict, optional
+        Additional information shown with the event
+    '''
+    _events.append(('X', name, cat, start, end, _current_thread(), None,
+                    args))
+
+
+def add_async_span(name, start, end, *, id, cat='ophyd', args=None):
+    '''Record a span which is not tied to a thread (e.g., a status object)
+
+    Parameters
+    ----------
+    name : str
+        The span name
+    start : float
+        The start time, see `now`
+    end : float
+        The end time, see `now`
+    id : int
+        Identifies the span among others of the same category
+    cat : str, optional
+        The event category
+    args : dict, optional
+        Additional information shown with the event
+    '''
+    _events.append(('b', name, cat, start, end, _current_thread(), id, args))
+
+
+def get_events():
+    '''The recorded events, as Chrome trace-event dictionaries'''
+    pid = os.getpid()
+    events = []
+    for phase, name, cat, start, end, tid, id_, args in list(_events):
+        event = {'name': name, 'cat': cat, 'ph': phase, 'pid': pid,
+                 'tid': tid, 'ts': start * 1e6}
+        if args:
+            event['args'] = args
+
+        if phase == 'X':
+            event['dur'] = (end - start) * 1e6
+            events.append(event)
+        else:
+            # asynchronous spans are a begin/end pair
+            event['id'] = id_
+            events.append(event)
+            events.append({'name': name, 'cat': cat, 'ph': 'e', 'pid': pid,
+                           'tid': tid, 'ts': end * 1e6, 'id': id_})
+
+    return events
+
+
+def to_chrome(events=None):
+    '''The Chrome trace-event JSON object of the recorded events
+
+    Parameters
+    ----------
+    events : list, optional
+        Defaults to `get_events()`
+    '''
+    if events is None:
+        events = get_events()
+
+    pid = os.getpid()
+    metadata = [{'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid,
+                 'args': {'name': name}}
+                for tid, name in list(_thread_names.items())]
+    return {'traceEvents': metadata + events,
+            'displayTimeUnit': 'ms'}
+
+
+def dump(path):
+    '''Write the recorded events to a Chrome trace-event JSON file
+
+    Parameters
+    ----------
+    path : str
+        The file to write
+    '''
+    with open(path, 'wt') as f:
+        json.dump(to_chrome(), f)
@@ -10,6 +10,7 @@
 
 import time as ttime
 import ctypes
+import itertools
 import threading
 import queue
 import logging
@@ -20,6 +21,8 @@ import numpy as np
 import epics
 
 from .errors import (MinorAlarmError, get_alarm_class, DisconnectedError)
+from .. import metrics
+from ..control_layer import get_cl
 
 __all__ = ['split_record_field',
            'strip_field',
@@ -82,7 +85,8 @@ def check_alarm(base_pv, stat_field='STAT', severity_field='SEVR',
         reason_pv = '%s.%s' % (base_pv, reason_field)
     reason = None
 
-    severity = epics.caget(severity_pv)
+    caget = get_cl().caget
+    severity = caget(severity_pv)
 
     if severity >= min_severity:
         try:
@@ -90,10 +94,10 @@ def check_alarm(base_pv, stat_field='STAT', severity_field='SEVR',
         except KeyError:
             pass
         else:
-            severity = epics.caget(severity_pv, as_string=True)
-            alarm = epics.caget(stat_pv, as_string=True)
+            severity = caget(severity_pv, as_string=True)
+            alarm = caget(stat_pv, as_string=True)
             if reason_pv is not None:
-                reason = epics.caget(reason_pv, as_string=True)
+                reason = caget(reason_pv, as_string=True)
 
             message = 'Alarm status %s [severity %s]' % (alarm, severity)
             if reason is not None:
@@ -104,13 +108,108 @@ def check_alarm(base_pv, stat_field='STAT', severity_field='SEVR',
     return True
 
 
-class MonitorDispatcher(epics.ca.CAThread):
+class DispatcherWorker(epics.ca.CAThread):
+    '''A MonitorDispatcher worker thread, with its own event queue
+
+    Parameters
+    ----------
+    dispatcher : MonitorDispatcher
+        The dispatcher owning the worker
+    index : int
+        The index of the worker in the dispatcher
+    max_queue_size : int, optional
+        Maximum number of queued events, 0 for no limit
+
+    Attributes
+    ----------
+    queue : Queue
+        The event queue, holding (callback, kwargs, time queued) tuples
+    processed : int
+        The number of events processed
+    dropped : int
+        The number of events dropped as the queue was full
+    max_depth : int
+        The maximum queue depth seen
+    total_latency : float
+        The total time events spent in the queue
+    max_latency : float
+        The maximum time an event spent in the queue
+    '''
+    def __init__(self, dispatcher, index, *, max_queue_size=0):
+        super().__init__(name='monitor_dispatcher_{}'.format(index))
+        self.daemon = True
+        self.dispatcher = dispatcher
+        self.queue = queue.Queue(maxsize=max_queue_size)
+
+        self.processed = 0
+        self.dropped = 0
+        self.max_depth = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    def put(self, callback, kwargs, *, block=True):
+        '''Queue a callback, returning False if it was dropped'''
+        try:
+            self.queue.put((callback, kwargs, ttime.monotonic()), block)
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+        self.max_depth = max(self.max_depth, self.queue.qsize())
+        return True
+
+    def run(self):
+        '''The worker loop'''
+        dispatcher = self.dispatcher
+        while not dispatcher._stop_event.is_set():
+            try:
+                callback, kwargs, queued = self.queue.get(True,
+                                                          dispatcher._timeout)
+            except queue.Empty:
+                continue
+
+            latency = ttime.monotonic() - queued
+            self.total_latency += latency
+            self.max_latency = max(self.max_latency, latency)
+            try:
+                callback(**kwargs)
+            except Exception as ex:
+                if dispatcher.callback_logger is not None:
+                    dispatcher.callback_logger.error(ex, exc_info=ex)
+            finally:
+                self.processed += 1
+
+        epics.ca.detach_context()
+
+    @property
+    def stats(self):
+        '''Queue depth and latency counters'''
+        mean_latency = (self.total_latency / self.processed
+                        if self.processed else 0.0)
+        return {'depth': self.queue.qsize(),
+                'max_depth': self.max_depth,
+                'processed': self.processed,
+                'dropped': self.dropped,
+                'mean_latency': mean_latency,
+                'max_latency': self.max_latency,
+                }
+
+
+class MonitorDispatcher:
     '''A monitor dispatcher which works with pyepics
 
     The monitor dispatcher works around having callbacks from libca threads.
     Using epics CA calls (caget, caput, etc.) from those callbacks is not
     possible without this dispatcher workaround.
 
+    Callbacks are run by a pool of worker threads, each with its own queue.
+    Each channel is assigned a worker, round-robin, on its first monitor
+    event, such that the callbacks of any one PV (and so of a signal's read
+    PV) are still run in order, while a slow callback only holds up the PVs
+    sharing its worker. Events of different PVs -- even those of one device
+    or of the read and write PVs of one signal -- may be run out of order
+    with more than one worker.
+
     ... note:: Without `all_contexts` set, only the callbacks that are run with
         the same context as the the main thread are affected.
 
@@ -121,10 +220,17 @@ class MonitorDispatcher(epics.ca.CAThread):
     ----------
     all_contexts : bool, optional
         re-route _all_ callbacks from _any_ context to the dispatcher callback
-        thread
+        threads
     timeout : float, optional
     callback_logger : logging.Logger, optional
         A logger to notify about failed callbacks
+    num_workers : int, optional
+        The number of worker threads
+    max_queue_size : int, optional
+        The maximum number of events queued per worker, 0 for no limit
+    full_policy : {'block', 'drop'}, optional
+        What to do with an event when the queue of its worker is full: block
+        the libca thread until there is room, or drop the event
 
     Attributes
     ----------
@@ -132,50 +238,91 @@ class MonitorDispatcher(epics.ca.CAThread):
         The main CA context
     callback_logger : logging.Logger
         A logger to notify about failed callbacks
-    queue : Queue
-        The event queue
+    workers : list of DispatcherWorker
+        The worker threads
     '''
+    FULL_POLICIES = ('block', 'drop')
 
     def __init__(self, all_contexts=False, timeout=0.1,
-                 callback_logger=None):
-        epics.ca.CAThread.__init__(self, name='monitor_dispatcher')
+                 callback_logger=None, *, num_workers=1, max_queue_size=0,
+                 full_policy='block'):
+        if num_workers < 1:
+            raise ValueError('At least one worker is required')
 
-        self.daemon = True
-        self.queue = queue.Queue()
+        if full_policy not in self.FULL_POLICIES:
+            raise ValueError('Unknown full queue policy {!r}; choose from: {}'
+                             ''.format(full_policy,
+                                       ', '.join(self.FULL_POLICIES)))
 
-        # The dispatcher thread will stop if this event is set
+        # The dispatcher threads will stop if this event is set
         self._stop_event = threading.Event()
         self.main_context = epics.ca.current_context()
         self.callback_logger = callback_logger
 
         self._all_contexts = bool(all_contexts)
         self._timeout = timeout
+        self._block = (full_policy == 'block')
 
-        self.start()
+        self.workers = [DispatcherWorker(self, index,
+                                         max_queue_size=max_queue_size)
+                        for index in range(num_workers)]
+        # key (channel ID) -> worker, assigned round-robin
+        self._key_workers = {}
+        self._next_worker = itertools.cycle(self.workers)
+        self._assign_lock = threading.Lock()
+
+        for worker in self.workers:
+            worker.start()
 
-    def run(self):
-        '''The dispatcher itself'''
         self._setup_pyepics(True)
 
-        while not self._stop_event.is_set():
-            try:
-                callback, args, kwargs = self.queue.get(True, self._timeout)
-            except queue.Empty:
-                pass
-            else:
-                try:
-                    callback(*args, **kwargs)
-                except Exception as ex:
-                    if self.callback_logger is not None:
-                        self.callback_logger.error(ex, exc_info=ex)
+    @property
+    def queue(self):
+        '''The event queue of the first worker'''
+        return self.workers[0].queue
 
-        self._setup_pyepics(False)
-        epics.ca.detach_context()
+    @property
+    def stats(self):
+        '''Queue depth and latency counters, per worker'''
+        return [worker.stats for worker in self.workers]
+
+    def is_alive(self):
+        '''Are any of the worker threads still running?'''
+        return any(worker.is_alive() for worker in self.workers)
+
+    def join(self, timeout=None):
+        '''Wait for all worker threads to finish'''
+        for worker in self.workers:
+            worker.join(timeout)
 
     def stop(self):
-        '''Stop the dispatcher thread and re-enable normal callbacks'''
+        '''Stop the dispatcher threads and re-enable normal callbacks'''
+        if not self._stop_event.is_set():
+            self._setup_pyepics(False)
         self._stop_event.set()
 
+    def dispatch(self, key, callback, kwargs):
+        '''Queue a callback on the worker for key (e.g., a channel ID)
+
+        Callbacks dispatched with the same key are run in order, by the
+        worker assigned to the key on its first event.
+
+        Returns
+        -------
+        queued : bool
+            False if the event was dropped, as the worker queue is full
+        '''
+        try:
+            worker = self._key_workers[key]
+        except KeyError:
+            with self._assign_lock:
+                worker = self._key_workers.get(key)
+                if worker is None:
+                    worker = next(self._next_worker)
+                    self._key_workers[key] = worker
+
+        return worker.put(callback, kwargs, block=self._block)
+
     def _setup_pyepics(self, enable):
         # Re-route monitor events to our new handler
         if enable:
@@ -190,7 +337,7 @@ class MonitorDispatcher(epics.ca.CAThread):
             if callable(args.usr):
                 if not hasattr(args.usr, '_disp_tag') or args.usr._disp_tag is not self:
                     args.usr = lambda orig_cb=args.usr, **kwargs: \
-                        self.queue.put((orig_cb, [], kwargs))
+                        self.dispatch(kwargs.get('chid'), orig_cb, kwargs)
                     args.usr._disp_tag = self
 
         return epics.ca._onMonitorEvent(args)
@@ -208,6 +355,15 @@ def waveform_to_string(value, type_=str, delim=''):
     delim : str, optional
         delimiter to use when joining string
     '''
+    if (isinstance(value, np.ndarray) and not delim and value.ndim == 1 and
+            value.dtype.kind in 'iu' and value.dtype.itemsize == 1):
+        # char waveform: decode all at once, each byte being one character
+        raw = value.tobytes()
+        nul = raw.find(b'\0')
+        if nul >= 0:
+            raw = raw[:nul]
+        return raw.decode('latin-1')
+
     try:
         value = delim.join(chr(c) for c in value)
     except TypeError:
@@ -344,11 +500,15 @@ def raise_if_disconnected(fcn):
     return wrapper
 
 
-def set_and_wait(signal, val, poll_time=0.01, timeout=10):
+def set_and_wait(signal, val, poll_time=0.01, timeout=10, *, atol=None,
+                 rtol=None):
     """
     Set a signal to a value and wait until it reads correctly.
 
-    There are cases where this would not work well, so it should be revisited.
+    Signals supporting subscriptions are monitored, such that this returns as
+    soon as a matching readback value is received. The readback is also
+    polled, with a logarithmic back-off, for signals which do not report
+    value changes.
 
     Parameters
     ----------
@@ -359,39 +519,116 @@ def set_and_wait(signal, val, poll_time=0.01, timeout=10):
         how soon to check whether the value has been successfully set
     timeout : float
         maximum time to wait for value to be successfully set
+    atol : float, optional
+        absolute tolerance allowed between numeric values
+    rtol : float, optional
+        relative tolerance allowed between numeric values, relative to val
 
     Raises
     ------
     TimeoutError if timeout is exceeded
     """
-    signal.put(val)
-    expiration_time = ttime.time() + timeout
-    current_value = signal.get()
     try:
         es = signal.enum_strs
     except AttributeError:
         es = ()
 
-    while not _compare_maybe_enum(val, current_value, es):
-        logger.info("Waiting for %s to be set from %r to %r...",
-                    signal.name, current_value, val)
-        ttime.sleep(poll_time)
-        poll_time *= 2  # logarithmic back-off
+    matches = _value_matcher(val, es, atol=atol, rtol=rtol)
+    matched = threading.Event()
+
+    def readback_changed(value=None, **kwargs):
+        if matches(value):
+            matched.set()
+
+    subscribed = hasattr(signal, 'subscribe')
+    if subscribed:
+        signal.subscribe(readback_changed, run=False)
+
+    iterations = 1
+    try:
+        signal.put(val)
+        expiration_time = ttime.time() + timeout
         current_value = signal.get()
-        if ttime.time() > expiration_time:
-            raise TimeoutError("Attempted to set %r to value %r and timed "
-                               "out after %r seconds. Current value is %r." %
-                               (signal, val, timeout, current_value))
-
-
-def _compare_maybe_enum(a, b, enums):
-    if not enums:
-        return a == b
-    if not isinstance(a, str):
-        a = enums[a]
-    if not isinstance(b, str):
-        b = enums[b]
-    return a == b
+
+        while not matches(current_value):
+            iterations += 1
+            logger.info("Waiting for %s to be set from %r to %r...",
+                        signal.name, current_value, val)
+            remaining = expiration_time - ttime.time()
+            if matched.wait(max(0.0, min(poll_time, remaining))):
+                break
+
+            poll_time *= 2  # logarithmic back-off
+            current_value = signal.get()
+            if ttime.time() > expiration_time:
+                raise TimeoutError("Attempted to set %r to value %r and timed "
+                                   "out after %r seconds. Current value is "
+                                   "%r." % (signal, val, timeout,
+                                            current_value))
+    finally:
+        if subscribed:
+            signal.clear_sub(readback_changed)
+
+        if metrics.enabled:
+            metrics.observe('ophyd_set_and_wait_iterations', iterations,
+                            buckets=metrics.COUNT_BUCKETS,
+                            signal=getattr(signal, 'name', signal))
+
+
+def _value_matcher(target, enums, *, atol=None, rtol=None):
+    '''A function checking if a readback value matches the target value
+
+    Parameters
+    ----------
+    target : any
+        The target value
+    enums : sequence of str
+        Enum strings, if any. Enum values may then be given either by index
+        or by string.
+    atol : float, optional
+        Absolute tolerance for numeric values
+    rtol : float, optional
+        Relative tolerance for numeric values, relative to target
+
+    Raises
+    ------
+    ValueError
+        If the target is not one of the enum values
+    '''
+    if enums:
+        enums = tuple(enums)
+
+        def to_string(value):
+            if isinstance(value, str):
+                return value
+            try:
+                return enums[value]
+            except (IndexError, TypeError):
+                return None
+
+        # convert the target only once
+        target_string = to_string(target)
+        if target_string not in enums:
+            raise ValueError('Invalid enum value {!r}; expected one of {}'
+                             ''.format(target, enums))
+
+        target = target_string
+        return lambda value: to_string(value) == target
+
+    if atol is not None or rtol is not None:
+        atol = 0.0 if atol is None else atol
+        rtol = 0.0 if rtol is None else rtol
+
+        def within_tolerance(value):
+            try:
+                return bool(np.allclose(value, target, atol=atol, rtol=rtol))
+            except TypeError:
+                return False
+
+        return within_tolerance
+
+    return lambda value: value == target
+
 
 _type_map = {'number': (float, ),
              'array': (np.ndarray, ),
@@ -0,0 +1,92 @@
+'''
+:mod:`ophyd.utils.futures` - asyncio future helpers
+===================================================
+
+.. module:: ophyd.utils.futures
+   :synopsis: Helpers bridging ophyd callbacks and asyncio futures
+
+Callbacks from the control layer (monitors, put completion, connection
+changes) run in their own threads. These helpers resolve asyncio futures from
+those threads, such that an event loop may await them without a thread being
+dedicated to each wait.
+'''
+
+import asyncio
+
+__all__ = ['get_loop', 'create_future', 'resolved', 'resolve_threadsafe',
+           'chain']
+
+
+def get_loop(loop=None):
+    '''The given event loop, or the current one if None'''
+    if loop is None:
+        loop = asyncio.get_event_loop()
+    return loop
+
+
+def create_future(loop=None):
+    '''Create a future attached to an event loop (default: current)'''
+    return asyncio.Future(loop=get_loop(loop))
+
+
+def resolved(result, *, loop=None):
+    '''A future which is already resolved with result'''
+    future = create_future(loop)
+    future.set_result(result)
+    return future
+
+
+def _resolve(future, result, exception):
+    if future.done():
+        # already resolved, timed out or cancelled
+        return
+
+    if exception is not None:
+        future.set_exception(exception)
+    else:
+        future.set_result(result)
+
+
+def resolve_threadsafe(loop, future, result=None, *, exception=None):
+    '''Resolve a future from any thread
+
+    The future is resolved in the event loop thread. Should it be done by then
+    (e.g., it was cancelled), the result is discarded.
+
+    Parameters
+    ----------
+    loop : asyncio.AbstractEventLoop
+        The event loop the future is attached to
+    future : asyncio.Future
+    result : any, optional
+        The result to set
+    exception : Exception, optional
+        If specified, set as the exception of the future instead
+    '''
+    loop.call_soon_threadsafe(_resolve, future, result, exception)
+
+
+def chain(future, fcn, *, loop=None):
+    '''A future resolved with fcn(future.result())
+
+    Exceptions raised by future or by fcn are set on the returned future, and
+    cancellation of future cancels it.
+    '''
+    chained = create_future(loop)
+
+    def done(future):
+        if chained.done():
+            return
+        elif future.cancelled():
+            chained.cancel()
+            return
+
+        try:
+            result = fcn(future.result())
+        except Exception as ex:
+            chained.set_exception(ex)
+        else:
+            chained.set_result(result)
+
+    future.add_done_callback(done)
+    return chained
@@ -12,10 +12,19 @@ __all__ = ['setup', 'logger']
 _dispatcher = None
 
 
-def setup():
+def setup(num_workers=1, **kwargs):
     '''Setup ophyd for use
 
     Must be called once per session using ophyd
+
+    Parameters
+    ----------
+    num_workers : int, optional
+        The number of monitor dispatcher threads running callbacks. With
+        more than one, the callbacks of different PVs may run out of order
+        (see `MonitorDispatcher`).
+    kwargs :
+        Passed on to MonitorDispatcher (e.g., max_queue_size, full_policy)
     '''
     # It's important to use the same context in the callback dispatcher
     # as the main thread, otherwise not-so-savvy users will be very
@@ -30,7 +39,7 @@ def setup():
 
     from .epics_pvs import MonitorDispatcher
     logger.debug('Installing monitor dispatcher')
-    _dispatcher = MonitorDispatcher()
+    _dispatcher = MonitorDispatcher(num_workers=num_workers, **kwargs)
     atexit.register(_cleanup)
     return _dispatcher
 
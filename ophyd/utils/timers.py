@@ -0,0 +1,211 @@
+'''
+:mod:`ophyd.utils.timers` - Shared timer threads
+================================================
+
+.. module:: ophyd.utils.timers
+   :synopsis: Heap-scheduled timer threads, shared by many objects
+
+Rather than each object sleeping in (or polling from) a thread of its own, a
+single named thread per purpose runs all of the delayed calls in order of
+their deadlines. Scheduled calls may be cancelled.
+
+Calls which may take a while (or block) are best handed off from a timer
+thread to a small, shared pool of worker threads (see `WorkerPool`), such
+that they do not delay other deadlines.
+'''
+
+import heapq
+import itertools
+import logging
+import queue
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+__all__ = ['Timer', 'TimerThread', 'get_timer_thread', 'WorkerPool',
+           'get_worker_pool']
+
+
+class Timer:
+    '''A delayed call scheduled on a TimerThread, which may be cancelled
+
+    Attributes
+    ----------
+    deadline : float
+        The monotonic time the call is due
+    cancelled : bool
+        Whether or not the call was cancelled
+    '''
+    __slots__ = ('deadline', 'fcn', 'args', 'cancelled', '_thread')
+
+    def __init__(self, thread, deadline, fcn, args):
+        self._thread = thread
+        self.deadline = deadline
+        self.fcn = fcn
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self):
+        '''Cancel the call, if it has not run yet'''
+        if self.cancelled:
+            return
+
+        self.cancelled = True
+        thread = self._thread
+        if thread is not None:
+            thread._timer_cancelled()
+
+
+class TimerThread(threading.Thread):
+    '''A daemon thread running delayed calls in order of their deadlines
+
+    Cancelled calls are dropped from the heap when they come due, or when
+    they make up most of it.
+
+    Parameters
+    ----------
+    name : str
+        The thread name
+    '''
+    def __init__(self, name):
+        super().__init__(name=name, daemon=True)
+        self._cond = threading.Condition()
+        # heap of (deadline, sequence number, timer)
+        self._heap = []
+        self._counter = itertools.count()
+        self._cancelled = 0
+
+    def call_at(self, deadline, fcn, *args):
+        '''Run fcn(*args) at (monotonic) time deadline
+
+        Returns
+        -------
+        timer : Timer
+        '''
+        timer = Timer(self, deadline, fcn, args)
+        with self._cond:
+            heapq.heappush(self._heap, (deadline, next(self._counter), timer))
+            if self._heap[0][2] is timer:
+                # only the earliest deadline affects how long to sleep
+                self._cond.notify()
+        return timer
+
+    def call_later(self, delay, fcn, *args):
+        '''Run fcn(*args) after delay seconds
+
+        Returns
+        -------
+        timer : Timer
+        '''
+        return self.call_at(time.monotonic() + delay, fcn, *args)
+
+    def __len__(self):
+        '''The number of scheduled calls, including cancelled ones'''
+        return len(self._heap)
+
+    def _timer_cancelled(self):
+        with self._cond:
+            self._cancelled += 1
+            if self._cancelled > 64 and self._cancelled > len(self._heap) // 2:
+                self._heap = [item for item in self._heap
+                              if not item[2].cancelled]
+                heapq.heapify(self._heap)
+                self._cancelled = 0
+
+    def _next_timer(self):
+        '''Wait for and pop the next timer which is due'''
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                while self._heap and self._heap[0][2].cancelled:
+                    heapq.heappop(self._heap)
+                    self._cancelled -= 1
+
+                if self._heap and self._heap[0][0] <= now:
+                    timer = heapq.heappop(self._heap)[2]
+                    # no longer in the heap, if cancelled from here on
+                    timer._thread = None
+                    return timer
+
+                timeout = (self._heap[0][0] - now) if self._heap else None
+                self._cond.wait(timeout)
+
+    def run(self):
+        while True:
+            timer = self._next_timer()
+            if timer.cancelled:
+                continue
+
+            try:
+                timer.fcn(*timer.args)
+            except Exception as ex:
+                logger.error('%s: timer callback %s failed', self.name,
+                             timer.fcn, exc_info=ex)
+
+
+class WorkerPool:
+    '''A fixed number of daemon threads running calls in order of submission
+
+    Any idle worker takes the next call, such that a call which blocks only
+    holds up its own worker.
+
+    Parameters
+    ----------
+    name : str
+        The pool name, from which the thread names are derived
+    num_workers : int
+        The number of worker threads
+    '''
+    def __init__(self, name, num_workers):
+        if num_workers < 1:
+            raise ValueError('At least one worker is required')
+
+        self.name = name
+        self._queue = queue.Queue()
+        self.threads = [threading.Thread(target=self._run, daemon=True,
+                                         name='{}_{}'.format(name, index))
+                        for index in range(num_workers)]
+        for thread in self.threads:
+            thread.start()
+
+    def submit(self, fcn, *args):
+        '''Run fcn(*args) on the next idle worker'''
+        self._queue.put((fcn, args))
+
+    def _run(self):
+        while True:
+            fcn, args = self._queue.get()
+            try:
+                fcn(*args)
+            except Exception as ex:
+                logger.error('%s: call %s failed', self.name, fcn,
+                             exc_info=ex)
+
+
+_timer_threads = {}
+_worker_pools = {}
+_timer_lock = threading.Lock()
+
+
+def get_timer_thread(name):
+    '''The shared timer thread of the given name, started on first use'''
+    with _timer_lock:
+        try:
+            return _timer_threads[name]
+        except KeyError:
+            thread = TimerThread(name)
+            thread.start()
+            _timer_threads[name] = thread
+            return thread
+
+
+def get_worker_pool(name, num_workers):
+    '''The shared worker pool of the given name, started on first use'''
+    with _timer_lock:
+        try:
+            return _worker_pools[name]
+        except KeyError:
+            pool = WorkerPool(name, num_workers)
+            _worker_pools[name] = pool
+            return pool
@@ -0,0 +1,17 @@
+import pytest
+
+from ophyd import sim
+from ophyd.control_layer import set_cl
+
+
+@pytest.fixture(scope='function')
+def sim_cl():
+    '''Use the simulated control layer, with a fresh database'''
+    sim.database.clear()
+    sim.database.latency = 0.0
+    sim.database.jitter = 0.0
+    sim.database.connection_latency = None
+    sim.database.auto_create = True
+    cl = set_cl('sim')
+    yield cl
+    set_cl('pyepics')
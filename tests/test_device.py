@@ -1,9 +1,14 @@
 import time
 import logging
 import unittest
+from collections import OrderedDict
 
-from ophyd import (Device, Component, FormattedComponent)
-from ophyd.signal import Signal
+import pytest
+
+from ophyd import (Device, Component, FormattedComponent,
+                   DynamicDeviceComponent)
+from ophyd import sim
+from ophyd.signal import (Signal, EpicsSignal, EpicsSignalRO)
 from ophyd.utils import ExceptionBundle
 
 logger = logging.getLogger(__name__)
@@ -32,6 +37,161 @@ def tearDownModule():
     logger.debug('Cleaning up')
 
 
+class SimConnDevice(Device):
+    sub = Component(Device, 'sub')
+    rbv = Component(EpicsSignalRO, ':rbv')
+    sp = Component(EpicsSignal, ':rbv', write_pv=':sp')
+
+
+def test_wait_for_connection(sim_cl):
+    sim.database.connection_latency = 0.1
+
+    dev = SimConnDevice('conn', name='dev')
+    assert not dev.connected
+
+    t0 = time.time()
+    dev.wait_for_connection(timeout=2.0)
+    assert time.time() - t0 < 0.5
+    assert dev.connected
+
+
+def test_connection_events(sim_cl):
+    dev = SimConnDevice('conn', name='dev')
+    dev.wait_for_connection(timeout=1.0)
+
+    events = []
+
+    def conn_cb(connected=None, **kwargs):
+        events.append(connected)
+
+    dev.subscribe(conn_cb, event_type=dev.SUB_CONNECTION, run=False)
+
+    sim.database.set_connected('conn:sp', False)
+    time.sleep(0.1)
+    assert not dev.sp.connected
+    assert not dev.connected
+
+    sim.database.set_connected('conn:sp', True)
+    time.sleep(0.1)
+    assert dev.connected
+    assert events == [False, True]
+
+
+def test_connected_before_parent_subscribes(sim_cl):
+    class EagerSignalRO(EpicsSignalRO):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            # connected before the parent device subscribes to it
+            self.wait_for_connection(timeout=1.0)
+
+    class EagerDevice(Device):
+        rbv = Component(EagerSignalRO, ':rbv')
+
+    dev = EagerDevice('eager', name='dev')
+    assert dev.connected
+    dev.wait_for_connection(timeout=0.1)
+
+    events = []
+    dev.subscribe(lambda connected=None, **kwargs: events.append(connected),
+                  event_type=dev.SUB_CONNECTION, run=False)
+    sim.database.set_connected('eager:rbv', False)
+    time.sleep(0.1)
+    assert events == [False]
+
+
+def test_wait_for_connection_timeout(sim_cl):
+    sim.database.auto_create = False
+    sim.database.add_pv('conn:rbv', 0)
+
+    dev = SimConnDevice('conn', name='dev')
+    with pytest.raises(TimeoutError) as exc_info:
+        dev.wait_for_connection(timeout=0.1)
+
+    assert 'dev.sp' in str(exc_info.value)
+    assert 'dev.rbv' not in str(exc_info.value)
+
+
+def test_bulk_create(sim_cl):
+    sim.database.connection_latency = 0.1
+    prefixes = ['bulk{}'.format(i) for i in range(20)]
+    names = ['dev{}'.format(i) for i in range(20)]
+
+    t0 = time.time()
+    result = SimConnDevice.bulk_create(prefixes, names, timeout=2.0)
+    # connected concurrently, rather than one after the other
+    assert time.time() - t0 < 1.0
+    assert [dev.name for dev in result.devices] == names
+    assert all(dev.connected for dev in result.devices)
+    assert not result.unconnected
+    assert result.devices[3].rbv.pvname == 'bulk3:rbv'
+
+    with pytest.raises(ValueError):
+        SimConnDevice.bulk_create(prefixes, names[:-1])
+
+
+def test_bulk_create_unconnected(sim_cl):
+    sim.database.auto_create = False
+    for prefix in ('ok', 'bad'):
+        sim.database.add_pv(prefix + 'sub', 0)
+        sim.database.add_pv(prefix + ':rbv', 0)
+    sim.database.add_pv('ok:sp', 0)
+
+    result = SimConnDevice.bulk_create(['ok', 'bad'], timeout=0.2)
+    assert [dev.name for dev in result.devices] == ['ok', 'bad']
+    assert list(result.unconnected) == ['bad']
+    assert result.unconnected['bad'] == ['bad.sp (bad:rbv)']
+
+
+def test_device_read_source(sim_cl):
+    class LazyDevice(SimConnDevice):
+        lazy_rbv = Component(EpicsSignalRO, ':lazy', lazy=True)
+
+    dev = LazyDevice('conn', name='dev')
+    assert dev.read_source is None
+    dev.set_read_source('monitor', max_age=1.0)
+    assert dev.read_source == 'monitor'
+    dev.wait_for_connection()
+
+    for sig in (dev.rbv, dev.sp, dev.lazy_rbv):
+        assert sig.read_source == 'monitor'
+        assert sig.max_age == 1.0
+
+    time.sleep(0.05)
+    sim.database.counts.clear()
+    dev.read()
+    assert sum(sim.database.counts.values()) == 0
+
+
+def test_batched_read(sim_cl):
+    class DoubledSignal(EpicsSignalRO):
+        def get(self, **kwargs):
+            return 2 * super().get(**kwargs)
+
+    class BatchDevice(SimConnDevice):
+        doubled = Component(DoubledSignal, ':doubled')
+
+    sim.database.add_pv('batch:rbv', 1.0)
+    sim.database.add_pv('batch:sp', 1.0)
+    sim.database.add_pv('batch:doubled', 1.0)
+    dev = BatchDevice('batch', name='dev', read_attrs=['rbv', 'doubled'])
+    dev.wait_for_connection()
+
+    sim.database.counts.clear()
+    reading = dev.read()
+    # gets of plain signals are batched; customized ones are read on their own
+    assert reading['dev_doubled']['value'] == 2.0
+    assert reading['dev_rbv']['value'] == 1.0
+    assert sim.database.counts['get'] == 2
+
+    # monitored signals are read from the monitor cache
+    dev.rbv.subscribe(lambda **kw: None)
+    dev.doubled.subscribe(lambda **kw: None)
+    time.sleep(0.05)
+    sim.database.counts.clear()
+    assert dev.read() == reading
+    assert sum(sim.database.counts.values()) == 0
+
+
 def test_device_state():
     d = Device('test')
 
@@ -41,6 +201,135 @@ def test_device_state():
     d.unstage()
 
 
+def test_construction_plan():
+    class PlanSignal(Signal):
+        def __init__(self, read_pv, *, write_pv=None, units=None, name=None,
+                     parent=None):
+            self.read_pv = read_pv
+            self.write_pv = write_pv
+            self.units = units
+            super().__init__(name=name, parent=parent)
+
+    class PlanDevice(Device):
+        rbv = Component(PlanSignal, ':rbv', write_pv=':sp', units='mm')
+        raw = Component(PlanSignal, 'raw', add_prefix=(), units='mm')
+        fmt = FormattedComponent(PlanSignal, '{self.prefix}:fmt',
+                                 write_pv='{self.name}')
+        lazy = Component(PlanSignal, ':lazy', lazy=True)
+
+    assert [attr for attr, cpt in PlanDevice._construction_plan] == \
+        ['rbv', 'raw', 'fmt']
+
+    for prefix in ('A', 'B'):
+        dev = PlanDevice(prefix, name='dev' + prefix)
+        assert set(dev._signals) == {'rbv', 'raw', 'fmt'}
+        assert dev.rbv.name == 'dev{}_rbv'.format(prefix)
+        assert dev.rbv.read_pv == prefix + ':rbv'
+        assert dev.rbv.write_pv == prefix + ':sp'
+        assert dev.rbv.units == 'mm'
+        assert dev.raw.read_pv == 'raw'
+        assert dev.fmt.read_pv == prefix + ':fmt'
+        assert dev.fmt.write_pv == 'dev' + prefix
+        assert dev.lazy.read_pv == prefix + ':lazy'
+
+    # the plan follows components shared with subclasses
+    class SubPlanDevice(PlanDevice):
+        extra = Component(PlanSignal, ':extra')
+
+    dev = SubPlanDevice('C', name='sub')
+    assert dev.rbv.read_pv == 'C:rbv'
+    assert dev.extra.name == 'sub_extra'
+
+
+def test_resolved_paths():
+    class SubDevice(Device):
+        cpt = Component(FakeSignal, 'cpt')
+        lazy = Component(FakeSignal, 'lazy', lazy=True)
+
+    class MyDevice(Device):
+        sub = Component(SubDevice, 'sub:')
+        cpt = Component(FakeSignal, 'cpt')
+
+    dev = MyDevice('prefix:', name='dev',
+                   read_attrs=['sub.cpt', 'sub.lazy', 'cpt'])
+    assert getattr(dev, 'sub.cpt') is dev.sub.cpt
+    assert getattr(dev, 'sub.lazy') is dev.sub.lazy
+    assert dev._resolved_paths == {'sub.cpt': dev.sub.cpt,
+                                   'sub.lazy': dev.sub.lazy}
+    assert list(dev.read()) == ['dev_sub_cpt', 'dev_sub_lazy', 'dev_cpt']
+
+    # only component paths are cached
+    assert getattr(dev, 'sub.cpt.read_pv') == 'prefix:sub:cpt'
+    assert 'sub.cpt.read_pv' not in dev._resolved_paths
+
+    with pytest.raises(AttributeError):
+        getattr(dev, 'sub.missing')
+    assert 'sub.missing' not in dev._resolved_paths
+
+
+def test_flat_plans():
+    class SubDevice(Device):
+        cpt1 = Component(FakeSignal, '1')
+        cpt2 = Component(FakeSignal, '2')
+
+    class CustomDevice(Device):
+        cpt = Component(FakeSignal, 'cpt')
+
+        def read(self):
+            return {'custom': {'value': 1, 'timestamp': 0}}
+
+    class MyDevice(Device):
+        sub = Component(SubDevice, 'sub:')
+        custom = Component(CustomDevice, 'custom:')
+        cpt = Component(FakeSignal, 'cpt')
+
+    dev = MyDevice('prefix:', name='dev', configuration_attrs=['sub'])
+    dev.sub.configuration_attrs = ['cpt2']
+
+    assert list(dev.read()) == ['dev_sub_cpt1', 'dev_sub_cpt2', 'custom',
+                                'dev_cpt']
+    assert list(dev.describe()) == ['dev_sub_cpt1', 'dev_sub_cpt2',
+                                    'dev_custom_cpt', 'dev_cpt']
+    assert list(dev.read_configuration()) == ['dev_sub_cpt2_conf',
+                                              'dev_sub_cpt2', 'dev_sub_cpt1']
+    assert list(dev.describe_configuration()) == \
+        ['dev_sub_cpt2_conf', 'dev_sub_cpt2', 'dev_sub_cpt1']
+
+    # plans are reused until attribute lists change, also in sub-devices
+    plan = dev._flat_plan('read')
+    assert dev._flat_plan('read') is plan
+    assert [(obj.name, method) for obj, method, start, stop
+            in plan.devices] == [('dev_sub', 'read')]
+
+    dev.sub.read_attrs.remove('cpt1')
+    assert list(dev.read()) == ['dev_sub_cpt2', 'custom', 'dev_cpt']
+    dev.read_attrs = ['cpt']
+    assert list(dev.read()) == ['dev_cpt']
+    assert dev.sub.read() == dev.sub._call_plan('read')
+
+
+def test_dynamic_device_classes():
+    class MyDevice(Device):
+        channels = DynamicDeviceComponent(
+            OrderedDict((('ch{}'.format(i), (FakeSignal, str(i), {}))
+                         for i in range(1, 5))))
+
+    class SubDevice(MyDevice):
+        pass
+
+    dev1 = MyDevice('prefix1:', name='dev1', read_attrs=['channels'])
+    dev2 = MyDevice('prefix2:', name='dev2', read_attrs=['ch3', 'ch1'])
+    assert type(dev1.channels) is type(dev2.channels)
+    assert type(dev1.channels).__name__ == 'MyDeviceChannels'
+    assert dev1.channels.read_attrs == ['ch1', 'ch2', 'ch3', 'ch4']
+    assert dev2.channels.read_attrs == ['ch1', 'ch3']
+    assert dev2.channels.ch3.read_pv == 'prefix2:3'
+
+    sub = SubDevice('prefix3:', name='sub')
+    assert type(sub.channels).__name__ == 'SubDeviceChannels'
+    assert type(SubDevice('prefix4:').channels) is type(sub.channels)
+
+
 class DeviceTests(unittest.TestCase):
     def test_attrs(self):
         class MyDevice(Device):
@@ -156,7 +445,7 @@ class DeviceTests(unittest.TestCase):
     def test_name_shadowing(self):
         RESERVED_ATTRS = ['name', 'parent', 'signal_names', '_signals',
                           'read_attrs', 'configuration_attrs', '_sig_attrs',
-                          '_sub_devices']
+                          '_sub_devices', '_construction_plan']
 
         type('a', (Device,), {'a': None})  # legal class definition
         # Illegal class definitions:
@@ -0,0 +1,130 @@
+import json
+import time
+
+import pytest
+
+from ophyd import (metrics, sim, EpicsSignal, EpicsScaler)
+from ophyd.utils.epics_pvs import set_and_wait
+
+
+@pytest.fixture(scope='function')
+def enabled_metrics():
+    metrics.reset()
+    metrics.enable()
+    yield metrics
+    metrics.disable()
+    metrics.reset()
+
+
+def get_metric(snap, name, **labels):
+    labels = {key: str(value) for key, value in labels.items()}
+    for metric in snap['metrics']:
+        if metric['name'] == name and dict(metric['labels']) == labels:
+            return metric
+    raise KeyError((name, labels))
+
+
+def test_disabled(sim_cl):
+    metrics.reset()
+    sim.database.add_pv('sim:m', 1.0)
+    sig = EpicsSignal('sim:m', name='sig')
+    sig.wait_for_connection()
+    sig.get(use_monitor=False)
+    sig.put(2.0, wait=True)
+    assert metrics.snapshot()['metrics'] == []
+
+
+def test_signal_metrics(sim_cl, enabled_metrics):
+    sim.database.latency = 0.01
+    sim.database.add_pv('sim:m', 1.0, put_delay=0.02)
+    sig = EpicsSignal('sim:m', name='sig', put_complete=True)
+    sig.wait_for_connection()
+
+    sig.get(use_monitor=False)
+    sig.set(2.0).wait(timeout=1)
+    set_and_wait(sig, 3.0)
+    values = []
+    sig.subscribe(lambda value, **kwargs: values.append(value))
+    sim.database.update('sim:m', 4.0)
+    time.sleep(0.1)
+
+    snap = metrics.snapshot()
+    get = get_metric(snap, 'ophyd_ca_get_seconds', signal='sig')
+    assert get['count'] >= 1
+    assert get['sum'] >= 0.01
+
+    put = get_metric(snap, 'ophyd_ca_put_seconds', signal='sig')
+    assert put['count'] == 2
+    completion = get_metric(snap, 'ophyd_put_completion_seconds',
+                            signal='sig')
+    # only the set tracks its completion
+    assert completion['count'] == 1
+    assert completion['sum'] >= 0.02
+
+    iterations = get_metric(snap, 'ophyd_set_and_wait_iterations',
+                            signal='sig')
+    assert iterations['count'] == 1
+
+    events = get_metric(snap, 'ophyd_monitor_events_total', signal='sig')
+    assert events['value'] >= 1 and events['rate'] > 0
+
+    callbacks = [metric for metric in snap['metrics']
+                 if metric['name'] == 'ophyd_callback_seconds' and
+                 metric['labels']['callback'].endswith('<lambda>')]
+    assert callbacks and callbacks[0]['count'] >= 1
+
+
+def test_device_metrics(sim_cl, enabled_metrics):
+    scaler = EpicsScaler('sim:scaler', name='scaler')
+    scaler.wait_for_connection()
+    scaler.read()
+    scaler.read()
+    scaler.read_configuration()
+
+    snap = metrics.snapshot()
+    read = get_metric(snap, 'ophyd_device_seconds', device='scaler',
+                      operation='read')
+    # nested (super) calls are only timed once
+    assert read['count'] == 2
+
+    # as are sub-devices flattened into the read
+    assert get_metric(snap, 'ophyd_device_seconds', device='scaler_channels',
+                      operation='read')['count'] == 2
+
+    # batched gets are recorded once per batch
+    assert get_metric(snap, 'ophyd_ca_get_many_seconds')['count'] == 2
+    pvs = get_metric(snap, 'ophyd_ca_get_many_pvs_total')['value']
+    assert pvs > 0 and pvs % 2 == 0
+
+    # and into the configuration, which reads each sub-device as well
+    for operation in ('read_configuration', 'read'):
+        assert get_metric(snap, 'ophyd_device_seconds', device='scaler_gates',
+                          operation=operation)['count'] == 1
+
+
+def test_export(sim_cl, enabled_metrics, tmpdir):
+    metrics.observe('ophyd_ca_get_seconds', 0.002, signal='a"b')
+    metrics.observe('ophyd_ca_get_seconds', 20, signal='a"b')
+    metrics.inc('ophyd_monitor_events_total', 3, signal='c')
+
+    text = metrics.to_prometheus()
+    assert '# TYPE ophyd_ca_get_seconds histogram' in text
+    assert 'ophyd_ca_get_seconds_bucket{signal="a\\"b",le="0.005"} 1' in text
+    assert 'ophyd_ca_get_seconds_bucket{signal="a\\"b",le="+Inf"} 2' in text
+    assert 'ophyd_ca_get_seconds_count{signal="a\\"b"} 2' in text
+    assert 'ophyd_monitor_events_total{signal="c"} 3' in text
+
+    path = str(tmpdir.join('metrics.json'))
+    metrics.export(path)
+    with open(path) as f:
+        snap = json.load(f)
+    assert get_metric(snap, 'ophyd_monitor_events_total',
+                      signal='c')['value'] == 3
+
+    path = str(tmpdir.join('metrics.prom'))
+    metrics.export(path)
+    with open(path) as f:
+        assert f.read().startswith('# HELP')
+
+    with pytest.raises(ValueError):
+        metrics.export(path, format='xml')
@@ -1,9 +1,13 @@
 
+import time
 import logging
+import threading
 import unittest
 # import copy
 
 from unittest.mock import Mock
+
+import numpy as np
 from ophyd.ophydobj import OphydObject
 from ophyd.status import (StatusBase, DeviceStatus, wait)
 
@@ -60,6 +64,129 @@ class OphydObjTests(unittest.TestCase):
 
         self.assertIs(parent.connected, True)
 
+    def test_subscribe_during_dispatch(self):
+        class MyObject(OphydObject):
+            SUB_TEST = 'test'
+            _default_sub = SUB_TEST
+
+        obj = MyObject(name='obj')
+        self.assertEqual(set(obj._subs), {'test', 'connection'})
+        self.assertIs(MyObject._get_sub_types(), MyObject._get_sub_types())
+
+        calls = []
+        late_cb = Mock()
+
+        def first(**kwargs):
+            calls.append('first')
+            obj.clear_sub(first)
+            obj.subscribe(late_cb, run=False)
+
+        def second(**kwargs):
+            calls.append('second')
+
+        obj.subscribe(first)
+        obj.subscribe(second)
+        obj._run_subs(sub_type=obj.SUB_TEST, value=1)
+        # the change only applies from the next event
+        self.assertEqual(calls, ['first', 'second'])
+        late_cb.assert_not_called()
+
+        obj._run_subs(sub_type=obj.SUB_TEST, value=2)
+        self.assertEqual(calls, ['first', 'second', 'second'])
+        late_cb.assert_called_once_with(sub_type='test', value=2, obj=obj)
+
+    def test_coalesce(self):
+        class MyObject(OphydObject):
+            SUB_TEST = 'test'
+            _default_sub = SUB_TEST
+
+        obj = MyObject(name='obj')
+        values = []
+        first = threading.Event()
+
+        def slow_cb(value, **kwargs):
+            values.append(value)
+            first.wait(1)
+
+        sub = obj.subscribe(slow_cb, coalesce=True, max_rate=20)
+        for value in range(100):
+            obj._run_subs(sub_type=obj.SUB_TEST, value=value)
+            if value == 0:
+                time.sleep(0.05)
+
+        first.set()
+        time.sleep(0.2)
+        # the first event, and then only the latest
+        self.assertEqual(values, [0, 99])
+        self.assertEqual((sub.delivered, sub.dropped), (2, 98))
+
+        # rate limited
+        t0 = time.monotonic()
+        for value in range(3):
+            obj._run_subs(sub_type=obj.SUB_TEST, value=value)
+            time.sleep(0.06)
+        self.assertEqual(values[2:], [0, 1, 2])
+        self.assertGreaterEqual(time.monotonic() - t0, 0.1)
+
+        obj.clear_sub(slow_cb)
+        self.assertEqual(obj._subs[obj.SUB_TEST], ())
+        self.assertRaises(ValueError, obj.subscribe, slow_cb, max_rate=1)
+
+    def test_subscribe_batch(self):
+        class MyObject(OphydObject):
+            SUB_TEST = 'test'
+            _default_sub = SUB_TEST
+
+        obj = MyObject(name='obj')
+        batches = []
+
+        def cb(timestamps, values, obj, sub_type):
+            batches.append((timestamps, values))
+
+        sub = obj.subscribe_batch(cb, max_batch=100, max_latency=0.1)
+        for value in range(250):
+            obj._run_subs(sub_type=obj.SUB_TEST, value=value,
+                          timestamp=1000. + value)
+
+        time.sleep(0.05)
+        self.assertEqual([len(values) for ts, values in batches], [100, 100])
+        # the rest are delivered once max_latency is up
+        time.sleep(0.15)
+        self.assertEqual([len(values) for ts, values in batches],
+                         [100, 100, 50])
+        self.assertEqual((sub.delivered, sub.batches), (250, 3))
+
+        timestamps = np.concatenate([ts for ts, values in batches])
+        values = np.concatenate([values for ts, values in batches])
+        np.testing.assert_array_equal(values, np.arange(250))
+        np.testing.assert_array_equal(timestamps, 1000. + np.arange(250))
+
+        obj._run_subs(sub_type=obj.SUB_TEST, value=1, timestamp=None)
+        sub.flush()
+        self.assertEqual(len(batches), 4)
+
+        obj.clear_sub(cb)
+        self.assertEqual(obj._subs[obj.SUB_TEST], ())
+
+    def test_replay(self):
+        class MyObject(OphydObject):
+            SUB_CACHED = 'cached'
+            SUB_UNCACHED = 'uncached'
+            _no_replay_subs = frozenset([SUB_UNCACHED])
+
+        obj = MyObject(name='obj')
+        obj._run_subs(sub_type=obj.SUB_CACHED, value=1, timestamp=None)
+        obj._run_subs(sub_type=obj.SUB_UNCACHED, value=1)
+
+        cb = Mock()
+        obj.subscribe(cb, event_type=obj.SUB_CACHED)
+        self.assertEqual(cb.call_args[1]['value'], 1)
+        self.assertIsNotNone(cb.call_args[1]['timestamp'])
+
+        cb = Mock()
+        obj.subscribe(cb, event_type=obj.SUB_UNCACHED)
+        cb.assert_not_called()
+
 
 is_main = (__name__ == '__main__')
 main(is_main)
@@ -2,11 +2,13 @@
 
 import time
 import logging
+import threading
 import unittest
 from copy import copy
 
 import epics
-from ophyd import (PseudoPositioner, PseudoSingle, EpicsMotor)
+import pytest
+from ophyd import (PseudoPositioner, PseudoSingle, EpicsMotor, SoftPositioner)
 from ophyd import (Component as C)
 
 
@@ -295,3 +297,72 @@ class PseudoPosTests(unittest.TestCase):
 from . import main
 is_main = (__name__ == '__main__')
 main(is_main)
+
+
+class DelayedSoftPositioner(SoftPositioner):
+    '''A soft positioner which takes some time to get to its target'''
+    def __init__(self, prefix='', *, delay=0.05, success=True, **kwargs):
+        super().__init__(**kwargs)
+        self.delay = delay
+        self.success = success
+        self._timer = None
+        self._set_position(0)
+
+    def _setup_move(self, position, status):
+        self._run_subs(sub_type=self.SUB_START, timestamp=time.time())
+        self._started_moving = True
+        self._moving = True
+
+        def done():
+            self._moving = False
+            self._set_position(position)
+            self._done_moving(success=self.success)
+
+        # a new move supersedes the one in progress
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = threading.Timer(self.delay, done)
+        self._timer.start()
+
+
+class SoftPseudo1x2(PseudoPositioner):
+    pseudo1 = C(PseudoSingle, limits=(-10, 10))
+    real1 = C(DelayedSoftPositioner, delay=0.05)
+    real2 = C(DelayedSoftPositioner, delay=0.1)
+
+    def forward(self, pseudo_pos):
+        pseudo_pos = self.PseudoPosition(*pseudo_pos)
+        return self.RealPosition(real1=pseudo_pos.pseudo1,
+                                 real2=-pseudo_pos.pseudo1)
+
+    def inverse(self, real_pos):
+        real_pos = self.RealPosition(*real_pos)
+        return self.PseudoPosition(pseudo1=real_pos.real1)
+
+
+def test_concurrent_soft():
+    pseudo = SoftPseudo1x2('', name='soft', concurrent=True)
+
+    status = pseudo.move((1, ), wait=False)
+    # concurrent: all real motors start moving right away
+    assert pseudo.real1.moving and pseudo.real2.moving
+    status.wait(timeout=1)
+    assert status.success
+    # and done once the slowest real motor is
+    assert not pseudo.real2.moving
+    assert tuple(pseudo.real_position) == (1, -1)
+
+    # a move superseded by another one
+    first = pseudo.move((2, ), wait=False)
+    second = pseudo.move((3, ), wait=False)
+    second.wait(timeout=1)
+    assert first.done and not first.success
+    assert tuple(pseudo.real_position) == (3, -3)
+
+    # a failed real motion fails the pseudo motion, once all real motions
+    # are done
+    pseudo.real1.success = False
+    with pytest.raises(RuntimeError):
+        pseudo.move((4, ), wait=True)
+    assert not pseudo.real2.moving
+    assert pseudo.real2.position == -4
@@ -8,10 +8,14 @@ import time
 import copy
 
 import numpy as np
+import pytest
 import epics
 
-from ophyd.signal import (Signal, EpicsSignal, EpicsSignalRO, DerivedSignal)
-from ophyd.utils import ReadOnlyError
+from ophyd import sim
+from ophyd.signal import (Signal, EpicsSignal, EpicsSignalRO, DerivedSignal,
+                          bulk_set)
+from ophyd.status import wait
+from ophyd.utils import (ReadOnlyError, LimitError)
 
 logger = logging.getLogger(__name__)
 
@@ -552,6 +556,289 @@ class DerivedSignalTests(unittest.TestCase):
         # self.assertEqual(derived.get(), signal.value)
 
 
+def test_read_source_monitor(sim_cl):
+    sim.database.add_pv('sim:ai', 1.0)
+    sig = EpicsSignalRO('sim:ai', name='ai', read_source='monitor')
+    sig.wait_for_connection()
+    assert sig.read_source == 'monitor'
+
+    # wait for the initial monitor event
+    time.sleep(0.05)
+    sim.database.counts.clear()
+
+    assert sig.get() == 1.0
+    reading = sig.read()['ai']
+    assert reading['value'] == 1.0
+    assert reading['timestamp'] == sig.timestamp
+
+    sim.database.update('sim:ai', 2.0)
+    time.sleep(0.05)
+    assert sig.get() == 2.0
+    assert sum(sim.database.counts.values()) == 0
+
+    # explicit requests for a fresh value still go to the control layer
+    sig.get(use_monitor=False)
+    assert sim.database.counts['get'] == 1
+
+
+def test_read_source_max_age(sim_cl):
+    sim.database.add_pv('sim:ai', 1.0)
+    sig = EpicsSignalRO('sim:ai', name='ai')
+    sig.wait_for_connection()
+    sig.set_read_source('monitor', max_age=0.1)
+    time.sleep(0.05)
+
+    sim.database.counts.clear()
+    sig.get()
+    assert sim.database.counts['get'] == 0
+
+    time.sleep(0.15)
+    sig.get()
+    assert sim.database.counts['get'] == 1
+
+    with pytest.raises(ValueError):
+        sig.set_read_source('cache')
+
+
+def test_read_source_get(sim_cl):
+    sim.database.add_pv('sim:ai', 1.0)
+    sig = EpicsSignalRO('sim:ai', name='ai')
+    sig.wait_for_connection()
+
+    sim.database.counts.clear()
+    sig.read()
+    # the timestamp is received along with the value
+    assert dict(sim.database.counts) == {'get': 1}
+
+
+def test_ctrlvars_cache(sim_cl):
+    sim.database.add_pv('sim:rbv', 1.0, units='mm', precision=3)
+    sim.database.add_pv('sim:sp', 1.0, lower_ctrl_limit=0,
+                        upper_ctrl_limit=10)
+    sig = EpicsSignal('sim:rbv', write_pv='sim:sp', limits=True, name='sig')
+    sig.wait_for_connection()
+
+    sim.database.counts.clear()
+    for i in range(5):
+        sig.check_value(5)
+        assert sig.limits == (0, 10)
+        assert sig.precision == 3
+        assert sig.units == 'mm'
+    sig.describe()
+    assert sim.database.counts['ctrlvars'] == 2
+
+    # property changes are delivered by a property monitor, even with the
+    # value unmonitored
+    sim.database.update('sim:sp', upper_ctrl_limit=20)
+    time.sleep(0.1)
+    assert sig.limits == (0, 20)
+    with pytest.raises(LimitError):
+        sig.check_value(25)
+    assert sim.database.counts['ctrlvars'] == 2
+
+    # explicit refresh
+    sim.database['sim:rbv'].units = 'um'
+    assert sig.units == 'mm'
+    sig.refresh_ctrlvars()
+    assert sig.units == 'um'
+
+
+def test_user_connection_callback(sim_cl):
+    calls = []
+
+    def conn_cb(pvname=None, conn=None, **kwargs):
+        calls.append((pvname, conn))
+
+    sim.database.add_pv('sim:conn', 1.0)
+    sig = EpicsSignalRO('sim:conn', name='sig',
+                        pv_kw=dict(connection_callback=conn_cb))
+    sig.wait_for_connection()
+    time.sleep(0.05)
+    assert sig.connected
+    assert calls == [('sim:conn', True)]
+
+
+def test_describe_cache(sim_cl):
+    sim.database.add_pv('sim:ai', 1.0, units='mm', precision=3)
+    sim.database.add_pv('sim:wf', np.zeros(4))
+    sig = EpicsSignalRO('sim:ai', name='ai')
+    wf = EpicsSignalRO('sim:wf', name='wf')
+    sig.wait_for_connection()
+    wf.wait_for_connection()
+
+    # scalars cannot change type or shape, so only need describing once
+    desc = sig.describe()
+    sim.database.counts.clear()
+    assert sig.describe() == desc
+    assert sum(sim.database.counts.values()) == 0
+
+    # unmonitored arrays may change shape unnoticed
+    assert wf.describe()['wf']['shape'] == [4]
+    sim.database.counts.clear()
+    wf.describe()
+    assert sim.database.counts['get'] == 1
+
+    # monitored arrays are described again once their shape changes
+    wf.set_read_source('monitor')
+    time.sleep(0.05)
+    wf.describe()
+    sim.database.counts.clear()
+    assert wf.describe()['wf']['shape'] == [4]
+    sim.database.update('sim:wf', np.zeros(8))
+    time.sleep(0.05)
+    assert wf.describe()['wf']['shape'] == [8]
+
+    # as is any signal once its metadata changes, monitored or not
+    sim.database.update('sim:ai', 2.0)
+    time.sleep(0.05)
+    assert sig._describe_cache is not None
+    sim.database.update('sim:ai', units='um')
+    time.sleep(0.05)
+    assert sig.describe()['ai']['units'] == 'um'
+
+    sim.database['sim:ai'].precision = 4
+    sig.refresh_ctrlvars()
+    assert sig.describe()['ai']['precision'] == 4
+
+
+def _link_readback(rbv, delay):
+    '''Simulated put hook, updating the readback record after a delay'''
+    def put_hook(record, value):
+        sim.database.scheduler.schedule(delay, sim.database.update, rbv,
+                                        value)
+    return put_hook
+
+
+def test_signal_set():
+    sig = Signal(name='sig', value=0)
+    status = sig.set(1)
+    assert status.done and status.success
+    assert sig.get() == 1
+
+
+def test_epics_signal_set(sim_cl):
+    sim.database.add_pv('sim:rbv', 0.0)
+    sim.database.add_pv('sim:sp', 0.0,
+                        put_hook=_link_readback('sim:rbv', 0.1))
+    sig = EpicsSignal('sim:rbv', write_pv='sim:sp', name='sig')
+    sig.wait_for_connection()
+
+    status = sig.set(1.0)
+    assert not status.done
+    wait(status, timeout=1)
+    assert status.success
+    assert sig.get() == 1.0
+
+    # readback within tolerance
+    sim.database['sim:sp'].put_hook = _link_readback('sim:rbv', 0.0)
+    sim.database.update('sim:rbv', 2.001)
+    wait(sig.set(2.0, tolerance=0.01), timeout=1)
+
+    # readback never matches
+    sim.database['sim:sp'].put_hook = None
+    n_subs = len(sig._subs[sig.SUB_VALUE])
+    status = sig.set(3.0, timeout=0.2)
+    assert len(sig._subs[sig.SUB_VALUE]) == n_subs + 1
+    with pytest.raises(RuntimeError):
+        wait(status, timeout=3)
+    assert not status.success
+    # the readback subscription ends with the status
+    time.sleep(0.05)
+    assert len(sig._subs[sig.SUB_VALUE]) == n_subs
+
+
+def test_epics_signal_set_put_complete(sim_cl):
+    sim.database.add_pv('sim:sp', 0.0, put_delay=0.1)
+    sig = EpicsSignal('sim:sp', put_complete=True, name='sig')
+    sig.wait_for_connection()
+
+    status = sig.set(1.0)
+    assert not status.done
+    wait(status, timeout=1)
+    assert status.success
+
+    # setpoint subscribers do not receive the put completion callback
+    sig = EpicsSignal('sim:sp', put_complete=True, auto_monitor=True,
+                      name='sig')
+    sig.wait_for_connection()
+    setpoint_kwargs = []
+    sig.subscribe(lambda **kwargs: setpoint_kwargs.append(kwargs),
+                  event_type=sig.SUB_SETPOINT, run=False)
+    wait(sig.set(2.0), timeout=1)
+    assert setpoint_kwargs and 'callback' not in setpoint_kwargs[-1]
+
+
+def test_epics_signal_set_shared_pv(sim_cl):
+    sim.database.add_pv('sim:val', 0.0)
+    sig = EpicsSignal('sim:val', name='sig')
+    sig.wait_for_connection()
+
+    # the readback updated locally by put does not complete the set; the
+    # monitor event from EPICS does
+    sim.database.latency = 0.1
+    status = sig.set(1.0)
+    assert not status.done
+    wait(status, timeout=1)
+    assert status.success
+
+
+def test_get_many_without_channel():
+    from ophyd import _pyepics_shim
+
+    class ChannelessPV:
+        timestamp = 1.0
+
+        def __init__(self, value):
+            self.value = value
+
+        def get(self, timeout=None):
+            return self.value
+
+    results = _pyepics_shim.get_many([ChannelessPV(5), ChannelessPV(None)])
+    assert results == [{'value': 5, 'timestamp': 1.0}, None]
+
+
+def test_get_many_old_pyepics(monkeypatch):
+    from ophyd import _pyepics_shim
+
+    class ChannelPV:
+        chid = 1
+        ftype = 6
+        timestamp = 2.0
+
+        def get(self, timeout=None):
+            return 3.0
+
+    # pyepics < 3.4 lacks the non-blocking gets with metadata
+    monkeypatch.delattr(_pyepics_shim.ca, 'get_with_metadata',
+                        raising=False)
+    monkeypatch.delattr(_pyepics_shim.ca, 'get_complete_with_metadata',
+                        raising=False)
+    results = _pyepics_shim.get_many([ChannelPV()])
+    assert results == [{'value': 3.0, 'timestamp': 2.0}]
+
+
+def test_bulk_set(sim_cl):
+    sigs = []
+    for i in range(20):
+        sim.database.add_pv('sim:sp{}'.format(i), 0.0, put_delay=0.1)
+        sigs.append(EpicsSignal('sim:sp{}'.format(i), put_complete=True,
+                                name='sig{}'.format(i)))
+
+    for sig in sigs:
+        sig.wait_for_connection()
+
+    t0 = time.time()
+    status = bulk_set({sig: i for i, sig in enumerate(sigs)})
+    wait(status, timeout=1)
+    assert status.success
+    # all puts complete in parallel
+    assert time.time() - t0 < 0.1 * 5
+    assert [sig.get() for sig in sigs] == list(range(20))
+
+    assert bulk_set({}).done
+
+
 from . import main
 is_main = (__name__ == '__main__')
 main(is_main)
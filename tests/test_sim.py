@@ -0,0 +1,288 @@
+import time
+import threading
+import logging
+
+import numpy as np
+import pytest
+
+from ophyd import sim
+from ophyd import (EpicsSignal, EpicsSignalRO, EpicsMotor, EpicsScaler)
+from ophyd.control_layer import (set_cl, get_cl)
+
+logger = logging.getLogger(__name__)
+
+
+def test_set_cl():
+    try:
+        assert set_cl('sim').name == 'sim'
+        assert get_cl().name == 'sim'
+        assert set_cl('pyepics').name == 'pyepics'
+    finally:
+        set_cl('pyepics')
+
+    with pytest.raises(ValueError):
+        set_cl('not_a_control_layer')
+
+
+def test_simpv_get_put(sim_cl):
+    sim.database.add_pv('sim:pv', 1.0, units='mm', precision=3,
+                        lower_ctrl_limit=-5, upper_ctrl_limit=5)
+
+    pv = sim.get_pv('sim:pv')
+    assert pv.wait_for_connection(timeout=1.0)
+    assert pv.get() == 1.0
+    assert pv.units == 'mm'
+    assert pv.precision == 3
+    assert (pv.lower_ctrl_limit, pv.upper_ctrl_limit) == (-5, 5)
+
+    info = {}
+
+    def done(**kwargs):
+        info.update(kwargs)
+
+    assert pv.put(2.0, wait=True, callback=done, callback_data='data') == 1
+    assert info == {'pvname': 'sim:pv', 'data': 'data'}
+    assert pv.get(use_monitor=False) == 2.0
+    assert sim.caget('sim:pv') == 2.0
+
+
+def test_simpv_monitor(sim_cl):
+    sim.database.add_pv('sim:mon', 0)
+    values = []
+
+    pv = sim.get_pv('sim:mon',
+                    callback=lambda value, **kw: values.append(value))
+    assert pv.wait_for_connection(timeout=1.0)
+    sim.database.update('sim:mon', 1)
+    sim.database.update('sim:mon', 2)
+
+    time.sleep(0.1)
+    assert values == [0, 1, 2]
+
+
+def test_simpv_property_monitor(sim_cl):
+    sim.database.add_pv('sim:prop', 0, units='mm')
+    values = []
+    properties = []
+
+    pv = sim.get_pv('sim:prop',
+                    callback=lambda **kw: values.append(kw.get('units')))
+    prop_pv = sim.get_property_pv(
+        'sim:prop', callback=lambda units, **kw: properties.append(units))
+    assert pv.wait_for_connection(timeout=1.0)
+    assert prop_pv.wait_for_connection(timeout=1.0)
+    pv.get_ctrlvars()
+
+    sim.database.update('sim:prop', 1)
+    sim.database.update('sim:prop', units='um')
+    time.sleep(0.1)
+    # as with pyepics, time-form value monitors carry the control variables
+    # of the last get_ctrlvars(), and property monitors only fire on
+    # connection and property changes
+    assert values[-2:] == ['mm', 'mm']
+    assert properties == ['mm', 'um']
+
+
+def test_simpv_enum_and_string(sim_cl):
+    sim.database.add_pv('sim:enum', 0, enum_strs=['Off', 'On'])
+    sim.database.add_pv('sim:str', np.zeros(16, dtype=np.uint8))
+
+    pv = sim.get_pv('sim:enum')
+    assert pv.wait_for_connection(timeout=1.0)
+    pv.put('On', wait=True)
+    assert pv.get() == 1
+    assert pv.get(as_string=True) == 'On'
+
+    pv = sim.get_pv('sim:str')
+    assert pv.wait_for_connection(timeout=1.0)
+    pv.put('abc', wait=True)
+    assert pv.get(as_string=True) == 'abc'
+
+
+def test_simpv_latency(sim_cl):
+    sim.database.latency = 0.05
+    sim.database.add_pv('sim:slow', 1.0, put_delay=0.05)
+
+    pv = sim.get_pv('sim:slow', auto_monitor=False)
+    assert pv.wait_for_connection(timeout=1.0)
+
+    t0 = time.time()
+    pv.get()
+    assert time.time() - t0 >= 0.05
+
+    t0 = time.time()
+    pv.put(2.0, wait=True)
+    assert time.time() - t0 >= 0.1
+
+
+def test_simpv_disconnected(sim_cl):
+    sim.database.auto_create = False
+    pv = sim.get_pv('sim:does_not_exist')
+    assert not pv.wait_for_connection(timeout=0.1)
+    assert pv.get(timeout=0.1) is None
+
+
+def test_epics_signal(sim_cl):
+    sim.database.add_pv('sim:rbv', 1.0)
+    sim.database.add_pv('sim:sp', 1.0, lower_ctrl_limit=0, upper_ctrl_limit=10)
+
+    sig = EpicsSignal('sim:rbv', write_pv='sim:sp', limits=True, name='sig')
+    sig.wait_for_connection()
+
+    assert sig.limits == (0, 10)
+    sig.put(5, wait=True)
+    assert sig.get_setpoint() == 5
+    assert sig.get() == 1.0
+
+    with pytest.raises(ValueError):
+        sig.put(20)
+
+    ro = EpicsSignalRO('sim:rbv', name='ro')
+    ro.wait_for_connection()
+    assert ro.read()['ro']['value'] == 1.0
+
+
+def test_devices(sim_cl):
+    motor = EpicsMotor('sim:mtr', name='motor')
+    motor.wait_for_connection()
+    assert set(motor.read()) == {'motor', 'motor_user_setpoint'}
+
+    scaler = EpicsScaler('sim:scaler', name='scaler')
+    scaler.wait_for_connection()
+    assert len(scaler.read()) == 33
+
+
+def test_bulk_read(sim_cl):
+    scaler = EpicsScaler('sim:scaler', name='scaler')
+    scaler.wait_for_connection()
+    expected = scaler.read()
+
+    sim.database.latency = 0.02
+    sim.database.counts.clear()
+    t0 = time.time()
+    values = scaler.read()
+    elapsed = time.time() - t0
+
+    assert list(values) == list(expected)
+    assert sim.database.counts['get'] == 33
+    # one network wait for all channels, rather than one per channel
+    assert elapsed < 0.02 * 10
+
+
+def test_image_plugin(sim_cl):
+    from ophyd import ImagePlugin
+
+    prefix = 'sim:image1:'
+    image = np.arange(12, dtype=np.uint16)
+    sim.database.add_pv(prefix + 'ArraySize0_RBV', 4)
+    sim.database.add_pv(prefix + 'ArraySize1_RBV', 3)
+    sim.database.add_pv(prefix + 'ArraySize2_RBV', 0)
+    sim.database.add_pv(prefix + 'NDimensions_RBV', 2)
+    sim.database.add_pv(prefix + 'ArrayData', np.zeros(24, dtype=np.uint16))
+    sim.database.update(prefix + 'ArrayData', np.resize(image, 24))
+
+    plugin = ImagePlugin(prefix, name='plugin')
+    np.testing.assert_array_equal(plugin.image, image.reshape(3, 4))
+
+    # the geometry is only requested once
+    sim.database.counts.clear()
+    plugin.image
+    assert sim.database.counts['get'] == 1
+
+    # ... until the array size changes
+    sim.database.update(prefix + 'ArraySize1_RBV', 2)
+    time.sleep(0.1)
+    np.testing.assert_array_equal(plugin.image, image[:8].reshape(2, 4))
+
+    # a change while the geometry is being requested is not lost
+    get_size = plugin.array_size.get
+    calls = []
+
+    def get_changing_size():
+        calls.append(None)
+        size = get_size()
+        if len(calls) == 1:
+            plugin._geometry_changed()
+        return size
+
+    plugin._geometry_changed()
+    plugin.array_size.get = get_changing_size
+    plugin.image
+    requested = len(calls)
+    plugin.image
+    assert len(calls) == 2 * requested
+    plugin.image
+    assert len(calls) == 2 * requested
+
+    # monitor callbacks are not locked out while subscribing
+    plugin = ImagePlugin(prefix, name='plugin')
+    subscribe = plugin.ndimensions.subscribe
+    invalidated = threading.Event()
+
+    def subscribe_with_event(*args, **kwargs):
+        thread = threading.Thread(target=plugin._geometry_changed)
+        thread.start()
+        thread.join(1)
+        if not thread.is_alive():
+            invalidated.set()
+        return subscribe(*args, **kwargs)
+
+    plugin.ndimensions.subscribe = subscribe_with_event
+    plugin.image
+    assert invalidated.is_set()
+
+
+def test_async(sim_cl):
+    import asyncio
+    from ophyd.utils.futures import chain
+
+    sim.database.add_pv('sim:async', 1.0)
+    sim.database.connection_latency = 0.05
+    loop = asyncio.new_event_loop()
+
+    try:
+        scaler = EpicsScaler('sim:ascaler', name='scaler')
+        assert not scaler.connected
+        assert loop.run_until_complete(
+            scaler.connect_async(timeout=2, loop=loop)) is scaler
+        assert scaler.connected
+
+        sig = EpicsSignal('sim:async', name='sig')
+        sig.wait_for_connection()
+        assert loop.run_until_complete(sig.get_async(loop=loop)) == 1.0
+        # the one-shot value subscription is gone once resolved
+        time.sleep(0.05)
+        assert sig._subs[sig.SUB_VALUE] == ()
+
+        status = sig.set_async(2.0, timeout=1)
+        loop.run_until_complete(asyncio.wait_for(status, 2))
+        assert loop.run_until_complete(sig.get_async(loop=loop)) == 2.0
+        # the read PV is now monitored: no further requests
+        sim.database.counts.clear()
+        reading = loop.run_until_complete(sig.read_async(loop=loop))
+        assert reading['sig']['value'] == 2.0
+        assert sim.database.counts['get'] == 0
+
+        expected = scaler.read()
+        values = loop.run_until_complete(scaler.read_async(loop=loop))
+        assert list(values) == list(expected)
+        assert ({key: val['value'] for key, val in values.items()} ==
+                {key: val['value'] for key, val in expected.items()})
+
+        # whole trees connect concurrently
+        scalers = [EpicsScaler('sim:ascaler{}'.format(i), name='scaler')
+                   for i in range(5)]
+        t0 = time.time()
+        futures = [chain(s.connect_async(loop=loop), lambda s: s.connected,
+                         loop=loop)
+                   for s in scalers]
+        assert all(loop.run_until_complete(asyncio.gather(*futures)))
+        assert time.time() - t0 < 0.05 * 5
+
+        sim.database.auto_create = False
+        with pytest.raises(TimeoutError):
+            loop.run_until_complete(
+                EpicsScaler('sim:missing', name='s').connect_async(
+                    timeout=0.1, loop=loop))
+    finally:
+        loop.close()
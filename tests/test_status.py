@@ -1,4 +1,4 @@
-from ophyd.status import StatusBase
+from ophyd.status import (StatusBase, STATUS_CALLBACK_WORKERS)
 
 
 def _setup_st():
@@ -32,3 +32,222 @@ def test_status_pre():
     st.finished_cb = cb
     assert 'done' in state
     assert state['done']
+
+
+def test_status_await():
+    import asyncio
+    import pytest
+
+    loop = asyncio.new_event_loop()
+    try:
+        st = StatusBase()
+        loop.call_later(0.01, st._finished)
+        assert loop.run_until_complete(asyncio.wait_for(st, 1)) is st
+
+        # already done; the single finished_cb slot remains free
+        assert loop.run_until_complete(st.as_future(loop=loop)) is st
+        assert st.finished_cb is None
+
+        st = StatusBase()
+        st._finished(success=False)
+        with pytest.raises(RuntimeError):
+            loop.run_until_complete(st.as_future(loop=loop))
+    finally:
+        loop.close()
+
+
+def test_status_timeout_and_settle():
+    import threading
+    import time
+    import pytest
+    from ophyd.status import wait
+
+    n_threads = threading.active_count()
+    st = StatusBase(timeout=0.1)
+    t0 = time.time()
+    with pytest.raises(RuntimeError):
+        wait(st, timeout=1)
+    assert st.done and not st.success
+    assert time.time() - t0 < 0.5
+
+    st = StatusBase(settle_time=0.1)
+    st._finished()
+    assert not st.done
+    wait(st, timeout=1)
+    assert st.done and st.success
+
+    # finishing early cancels the timeout
+    statuses = [StatusBase(timeout=0.1) for i in range(100)]
+    for st in statuses:
+        st._finished()
+    time.sleep(0.2)
+    assert all(st.done and st.success for st in statuses)
+
+    # a failure is reported right away, without waiting for the settle time
+    st = StatusBase(settle_time=1)
+    st._finished(success=False)
+    assert st.done and not st.success
+
+    # the shared status timer thread and callback workers, at most, have been
+    # started
+    assert threading.active_count() <= n_threads + 1 + STATUS_CALLBACK_WORKERS
+
+
+def test_status_late_finish():
+    import threading
+    import pytest
+    from ophyd.status import wait
+
+    class SlowFailure(StatusBase):
+        def _handle_failure(self):
+            threads.append(threading.current_thread().name)
+            self._finished(success=True)
+
+    def callback(st):
+        threads.append(threading.current_thread().name)
+        called_back.set()
+
+    threads = []
+    called = []
+    called_back = threading.Event()
+    st = SlowFailure(timeout=0.05)
+    st.add_callback(callback)
+    st.finished_cb = lambda: called.append(st.success)
+    with pytest.raises(RuntimeError):
+        wait(st, timeout=1)
+    assert called_back.wait(1)
+
+    # finishing after (or while) timing out does not change the outcome
+    st._finished(success=True)
+    assert not st.success
+    assert called == [False]
+    # failure handling and callbacks are run off the status timer thread
+    assert len(threads) == 2
+    assert all(name.startswith('ophyd_status_callbacks_') for name in threads)
+
+
+def test_status_blocking_callback():
+    import threading
+    from ophyd.status import wait
+
+    release = threading.Event()
+    blocked = StatusBase(settle_time=0.01)
+    blocked.add_callback(lambda st: release.wait(2))
+    blocked._finished()
+
+    # a callback blocking one worker holds up neither the timeouts nor the
+    # callbacks of other statuses
+    called = threading.Event()
+    st = StatusBase(timeout=0.05)
+    st.add_callback(lambda st: called.set())
+    try:
+        assert called.wait(1)
+        assert st.done and not st.success
+
+        # nor the callbacks of one waiting on another status
+        other = StatusBase(settle_time=0.05)
+        waiting = StatusBase(settle_time=0.01)
+        waiting.add_callback(lambda st: wait(other, timeout=1))
+        waiting._finished()
+        other._finished()
+        wait(other, timeout=1)
+    finally:
+        release.set()
+
+
+def test_status_callbacks_and_wait():
+    import threading
+    import time
+    from ophyd.status import wait
+
+    st = StatusBase()
+    called = []
+    st.add_callback(called.append)
+    st.add_callback(called.append)
+    st.finished_cb = lambda: called.append('finished_cb')
+
+    threading.Timer(0.05, st._finished).start()
+    t0 = time.time()
+    st.wait(timeout=1)
+    # no polling delay
+    assert time.time() - t0 < 0.05 + 0.03
+    time.sleep(0.01)
+    assert called == ['finished_cb', st, st]
+
+    # added once done: called right away
+    st.add_callback(called.append)
+    assert called[-1] is st
+
+    st = StatusBase()
+    st._finished(success=False)
+    import pytest
+    with pytest.raises(RuntimeError):
+        wait(st)
+    with pytest.raises(TimeoutError):
+        StatusBase().wait(timeout=0.01)
+
+
+def test_status_combinators():
+    import pytest
+    from ophyd.status import AndStatus, OrStatus, wait_all
+
+    a, b = StatusBase(), StatusBase()
+    both = a & b
+    either = a | b
+    assert isinstance(both, AndStatus) and isinstance(either, OrStatus)
+
+    a._finished()
+    assert either.done and either.success
+    assert not both.done
+    b._finished()
+    assert both.done and both.success
+
+    a, b = StatusBase(), StatusBase()
+    both, either = AndStatus(a, b), OrStatus(a, b)
+    a._finished(success=False)
+    # fails right away
+    assert both.done and not both.success
+    assert not either.done
+    b._finished(success=False)
+    assert either.done and not either.success
+
+    # or only once all are done
+    a, b = StatusBase(), StatusBase()
+    both = AndStatus(a, b, fail_fast=False)
+    a._finished(success=False)
+    assert not both.done
+    b._finished()
+    assert both.done and not both.success
+
+    assert AndStatus().success and not OrStatus().success
+
+    statuses = [StatusBase() for i in range(3)]
+    for st in statuses:
+        st._finished()
+    wait_all(statuses, timeout=1)
+    wait_all([])
+
+    statuses.append(StatusBase())
+    with pytest.raises(TimeoutError):
+        wait_all(statuses, timeout=0.01)
+
+
+def test_wait_duck_typed_status():
+    import pytest
+    from ophyd.status import wait
+
+    class DuckStatus:
+        done = True
+        success = False
+
+    with pytest.raises(RuntimeError):
+        wait(DuckStatus(), timeout=1, poll_rate=0.01)
+
+    DuckStatus.done = False
+    with pytest.raises(TimeoutError):
+        wait(DuckStatus(), timeout=0.05, poll_rate=0.01)
+
+    st = StatusBase()
+    assert not st.wait_done(0.01)
+    st._finished()
+    assert st.wait_done(0.01)
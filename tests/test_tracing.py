@@ -0,0 +1,87 @@
+import json
+
+import pytest
+
+from ophyd import (tracing, EpicsScaler, SoftPositioner)
+from ophyd.status import StatusBase
+
+
+@pytest.fixture(scope='function')
+def enabled_tracing():
+    tracing.clear()
+    tracing.enable()
+    yield tracing
+    tracing.disable()
+    tracing.enable(max_events=tracing.DEFAULT_MAX_EVENTS)
+    tracing.disable()
+    tracing.clear()
+
+
+def test_disabled():
+    tracing.clear()
+    positioner = SoftPositioner(name='pos')
+    positioner.move(1)
+    assert tracing.get_events() == []
+
+
+def test_device_spans(sim_cl, enabled_tracing, tmpdir):
+    scaler = EpicsScaler('sim:scaler', name='scaler')
+    # generous, as the simulated channels all connect on the one scheduler
+    # thread
+    scaler.wait_for_connection(timeout=10)
+    scaler.stage()
+    scaler.trigger()
+    scaler.read()
+    scaler.describe()
+    scaler.unstage()
+
+    positioner = SoftPositioner(name='pos')
+    positioner.move(1)
+
+    events = tracing.get_events()
+    spans = [event['name'] for event in events if event['ph'] == 'X']
+    for name in ('scaler.stage', 'scaler.trigger', 'scaler.read',
+                 'scaler.describe', 'scaler.unstage', 'pos.move'):
+        # nested (super) calls are only recorded once
+        assert spans.count(name) == 1
+
+    # as is each batch of gets of the read
+    assert 'get_many' in spans
+
+    # sub-devices flattened into the plans of the scaler get a span each
+    assert spans.count('scaler_channels.read') == 1
+    assert spans.count('scaler_channels.describe') == 1
+    read, = [event for event in events
+             if event['name'] == 'scaler_channels.read']
+    assert read['args'] == {'device': 'scaler_channels', 'operation': 'read'}
+
+    for event in events:
+        if event['ph'] == 'X' and event['cat'] == 'device':
+            assert event['dur'] >= 0
+            # including sub-devices
+            assert event['args']['device'].startswith(('scaler', 'pos'))
+
+    # status lifetimes, as async begin/end pairs
+    begin = [event for event in events if event['ph'] == 'b']
+    end = [event for event in events if event['ph'] == 'e']
+    assert 'MoveStatus(pos)' in [event['name'] for event in begin]
+    assert len(begin) == len(end)
+
+    path = str(tmpdir.join('trace.json'))
+    tracing.dump(path)
+    with open(path) as f:
+        trace = json.load(f)
+
+    assert any(event['ph'] == 'M' and event['name'] == 'thread_name'
+               for event in trace['traceEvents'])
+    assert len(trace['traceEvents']) > len(events)
+
+
+def test_bounded(enabled_tracing):
+    tracing.enable(max_events=10)
+    for i in range(20):
+        StatusBase()._finished()
+
+    events = tracing.get_events()
+    # async spans are exported as begin/end pairs
+    assert len(events) == 2 * 10
@@ -1,9 +1,12 @@
 
 
 import os
+import time
 import logging
+import threading
 import unittest
 import numpy as np
+import pytest
 
 import epics
 
@@ -53,6 +56,14 @@ class EpicsUtilTest(unittest.TestCase):
         asc = [ord(c) for c in s] + [0, 0, 0]
         self.assertEquals(epics_utils.waveform_to_string(asc), s)
 
+        for dtype in (np.uint8, np.int8, np.int32):
+            asc = np.array([ord(c) for c in s] + [0, 65, 0], dtype=dtype)
+            self.assertEquals(epics_utils.waveform_to_string(asc), s)
+
+        asc = np.array([ord(c) for c in 'abc\xe9'], dtype=np.uint8)
+        self.assertEquals(epics_utils.waveform_to_string(asc), 'abc\xe9')
+        self.assertEquals(epics_utils.waveform_to_string(asc[:0]), '')
+
     def test_pv_form(self):
         self.assertIn(epics_utils.get_pv_form(), ('native', 'time'))
         version = epics.__version__
@@ -111,6 +122,132 @@ class ErrorsTest(unittest.TestCase):
         errors.MajorAlarmError('', alarm=0)
 
 
+def test_set_and_wait(sim_cl):
+    from ophyd import sim, EpicsSignal
+
+    def put_hook(record, value):
+        # readback arrives with a small offset, after a delay
+        sim.database.scheduler.schedule(0.3, sim.database.update, 'sim:rbv',
+                                        value + 1e-6)
+
+    sim.database.add_pv('sim:rbv', 0.0)
+    sim.database.add_pv('sim:sp', 0.0, put_hook=put_hook)
+    sim.database.add_pv('sim:enum', 0, enum_strs=['Off', 'On'])
+    sig = EpicsSignal('sim:rbv', write_pv='sim:sp', name='sig')
+    sig.wait_for_connection()
+
+    t0 = time.time()
+    epics_utils.set_and_wait(sig, 1.0, atol=1e-3)
+    # woken by the monitor, rather than the next poll (at 0.31 sec)
+    assert time.time() - t0 < 0.31
+
+    with pytest.raises(TimeoutError):
+        epics_utils.set_and_wait(sig, 2.0, timeout=0.5)
+
+    enum = EpicsSignal('sim:enum', name='enum')
+    enum.wait_for_connection()
+    epics_utils.set_and_wait(enum, 'On')
+    epics_utils.set_and_wait(enum, 0)
+    assert enum.get(as_string=True) == 'Off'
+
+
+def test_monitor_dispatcher():
+    cb_event = epics.ca._CB_EVENT
+    dispatcher = epics_utils.MonitorDispatcher(num_workers=2,
+                                               max_queue_size=2,
+                                               full_policy='drop')
+    try:
+        started, release = threading.Event(), threading.Event()
+        values = {0: [], 1: []}
+
+        def callback(key, value):
+            if key == 0 and value == 0:
+                started.set()
+                release.wait(2)
+            values[key].append(value)
+
+        # key 0 is held up by its first callback...
+        dispatcher.dispatch(0, callback, dict(key=0, value=0))
+        assert started.wait(1)
+        for value in range(1, 4):
+            dispatcher.dispatch(0, callback, dict(key=0, value=value))
+        # ... without blocking the other worker
+        for value in range(2):
+            dispatcher.dispatch(1, callback, dict(key=1, value=value))
+
+        time.sleep(0.2)
+        assert values == {0: [], 1: [0, 1]}
+        release.set()
+        time.sleep(0.2)
+
+        # in order, but one event dropped as the queue was full
+        assert values[0] == [0, 1, 2]
+        stats = dispatcher.stats
+        assert stats[0]['dropped'] == 1
+        assert stats[0]['processed'] == 3
+        assert stats[0]['max_depth'] == 2
+        assert stats[0]['max_latency'] > 0.15
+        assert stats[1]['processed'] == 2
+    finally:
+        dispatcher.stop()
+        dispatcher.join()
+        epics.ca._CB_EVENT = cb_event
+
+    with pytest.raises(ValueError):
+        epics_utils.MonitorDispatcher(full_policy='unknown')
+
+
+def test_monitor_dispatcher_workers():
+    from ophyd.utils import startup
+
+    cb_event = epics.ca._CB_EVENT
+    # the session's own dispatcher, if any, is set aside
+    session_dispatcher, startup._dispatcher = startup._dispatcher, None
+    dispatcher = startup.setup(num_workers=4)
+    try:
+        assert len(dispatcher.workers) == 4
+        threads = {}
+        values = {}
+
+        def callback(chid, value):
+            threads.setdefault(chid, set()).add(
+                threading.current_thread().name)
+            values.setdefault(chid, []).append(value)
+            time.sleep(0.001)
+
+        # interleaved events of 8 channels
+        for value in range(20):
+            for chid in range(8):
+                dispatcher.dispatch(chid, callback,
+                                    dict(chid=chid, value=value))
+
+        time.sleep(0.5)
+        # each channel is handled by one worker, in order...
+        assert all(len(names) == 1 for names in threads.values())
+        assert values == {chid: list(range(20)) for chid in range(8)}
+        # ... and the channels are spread over all of the workers
+        assert len(set.union(*threads.values())) == 4
+    finally:
+        dispatcher.stop()
+        dispatcher.join()
+        startup._dispatcher = session_dispatcher
+        epics.ca._CB_EVENT = cb_event
+
+
+def test_value_matcher():
+    matches = epics_utils._value_matcher(1.0, (), rtol=1e-3)
+    assert matches(1.0005) and not matches(1.01) and not matches('a')
+
+    matches = epics_utils._value_matcher('On', ('Off', 'On'))
+    assert matches(1) and matches('On') and not matches(0) and not matches(5)
+
+    assert epics_utils._value_matcher(1, ())(1)
+
+    for target in ('Unknown', 5, None):
+        with pytest.raises(ValueError):
+            epics_utils._value_matcher(target, ('Off', 'On'))
+
+
 def assert_OD_equal_ignore_ts(a, b):
     for (k1, v1), (k2, v2) in zip(a.items(), b.items()):
         assert (k1 == k2) and (v1['value'] == v2['value'])
@@ -119,3 +256,25 @@ def assert_OD_equal_ignore_ts(a, b):
 from . import main
 is_main = (__name__ == '__main__')
 main(is_main)
+
+
+def test_timer_thread():
+    from ophyd.utils.timers import TimerThread
+
+    timer = TimerThread('test_timer')
+    timer.start()
+    calls = []
+    done = threading.Event()
+
+    timer.call_later(0.05, calls.append, 2)
+    timer.call_later(0.01, calls.append, 1)
+    timer.call_later(0.02, calls.append, 'cancelled').cancel()
+    timer.call_later(0.1, done.set)
+
+    assert done.wait(1)
+    assert calls == [1, 2]
+
+    # cancelled calls do not accumulate
+    for i in range(1000):
+        timer.call_later(10, calls.append, i).cancel()
+    assert len(timer) < 500